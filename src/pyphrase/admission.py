@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Optional, Tuple
+
+from .models.phrase_models import AsyncRequestStatusDto
+
+if TYPE_CHECKING:
+    from .asynchron.client import AsyncPhraseTMSClient
+    from .synchron.client import SyncPhraseTMSClient
+
+logger = logging.getLogger(__name__)
+
+
+class _AdmissionBase:
+    def __init__(
+        self,
+        refresh_interval: float = 5.0,
+        reserve: int = 0,
+        phrase_token: Optional[str] = None,
+    ):
+        """
+        Admit operations creating async requests, e.g. createJob, only while the organization is below its limit
+        of pending async requests. The limit and the pending count come from getCurrentLimitStatus. Operations
+        that returned after that read, and operations still being sent, are added to the count, so the estimate
+        errs on the high side. Waiting operations are admitted by priority, lowest first, and in order of arrival
+        within a priority.
+
+        :param refresh_interval: float - seconds after which the limit status is read again, also the pause
+            between reads while the limit is reached
+        :param reserve: int - pending requests left free for other users of the organization
+        :param phrase_token: string (optional) - token to read the limit status with, defaults to the client token
+        """
+        self.refresh_interval = refresh_interval
+        self.reserve = reserve
+        self.phrase_token = phrase_token
+        self.limit: Optional[int] = None
+        self.server_count = 0
+        # Admitted operations that have not returned yet, the server may or may not count them already
+        self.in_flight = 0
+        self.admitted = 0
+        self.returned = 0
+        self.refreshes = 0
+        self._returned_at_refresh = 0
+        self._refreshed_at: Optional[float] = None
+        self._refreshing = False
+        self._queue: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+
+    def _stale(self) -> bool:
+        return (
+            self._refreshed_at is None
+            or time.monotonic() - self._refreshed_at >= self.refresh_interval
+        )
+
+    def _apply_status(self, status: AsyncRequestStatusDto, returned: int) -> None:
+        """
+        :param returned: int - operations returned when the status was requested, later ones are not in its count
+        """
+        requests = status.concurrentRequests
+        self.limit = requests.limit if requests else None
+        self.server_count = (requests.count if requests else None) or 0
+        self._returned_at_refresh = returned
+        self.refreshes += 1
+        self._refreshed_at = time.monotonic()
+        logger.debug(f"Async request limit {self.limit}, pending {self.server_count}")
+
+    def pending(self) -> int:
+        """
+        Estimated pending async requests of the organization
+        """
+        return (
+            self.server_count
+            + (self.returned - self._returned_at_refresh)
+            + self.in_flight
+        )
+
+    def headroom(self) -> Optional[int]:
+        """
+        Operations that may still be admitted, None without a limit
+        """
+        if self.limit is None:
+            return None
+        return self.limit - self.reserve - self.pending()
+
+    def _start_refresh(self, ticket: Tuple[int, int]) -> bool:
+        if self._queue[0] != ticket or self._refreshing or not self._stale():
+            return False
+        self._refreshing = True
+        return True
+
+    def _try_admit(self, ticket: Tuple[int, int]) -> bool:
+        if self._queue[0] != ticket or self._refreshing:
+            return False
+        headroom = self.headroom()
+        if headroom is not None and headroom <= 0:
+            return False
+        heapq.heappop(self._queue)
+        self.in_flight += 1
+        self.admitted += 1
+        return True
+
+    def _finish(self, succeeded: bool) -> None:
+        self.in_flight -= 1
+        if succeeded:
+            self.returned += 1
+        else:
+            # The operation failed, so it probably created no request. Read the status again before the next admission.
+            self._refreshed_at = None
+
+    def _leave_queue(self, ticket: Tuple[int, int]) -> bool:
+        if ticket not in self._queue:
+            return False
+        self._queue.remove(ticket)
+        heapq.heapify(self._queue)
+        return True
+
+    def snapshot(self) -> dict:
+        return {
+            "limit": self.limit,
+            "pending": self.pending(),
+            "headroom": self.headroom(),
+            "in_flight": self.in_flight,
+            "queued": len(self._queue),
+            "admitted": self.admitted,
+            "refreshes": self.refreshes,
+        }
+
+
+class SyncAdmissionController(_AdmissionBase):
+    def __init__(
+        self,
+        client: SyncPhraseTMSClient,
+        refresh_interval: float = 5.0,
+        reserve: int = 0,
+        phrase_token: Optional[str] = None,
+    ):
+        super().__init__(refresh_interval, reserve, phrase_token)
+        self.client = client
+        self._condition = threading.Condition()
+
+    def refresh(self) -> AsyncRequestStatusDto:
+        """
+        Read the limit and the pending count of the organization
+        """
+        with self._condition:
+            returned = self.returned
+        status = self.client.async_request.getCurrentLimitStatus(self.phrase_token)
+        with self._condition:
+            self._apply_status(status, returned)
+            self._condition.notify_all()
+        return status
+
+    def acquire(self, priority: int = 0) -> None:
+        """
+        Block until an operation may be sent. Callers from many threads are admitted by priority, then in order.
+        The limit status is read without holding the lock, so other callers are not held up by the round trip.
+        """
+        with self._condition:
+            ticket = (priority, next(self._sequence))
+            heapq.heappush(self._queue, ticket)
+        try:
+            while True:
+                with self._condition:
+                    refresh = self._start_refresh(ticket)
+                    if not refresh:
+                        if self._try_admit(ticket):
+                            self._condition.notify_all()
+                            return
+                        self._condition.wait(
+                            self.refresh_interval if self._queue[0] == ticket else None
+                        )
+                        continue
+                try:
+                    self.refresh()
+                finally:
+                    with self._condition:
+                        self._refreshing = False
+                        self._condition.notify_all()
+        except BaseException:
+            with self._condition:
+                if self._leave_queue(ticket):
+                    self._condition.notify_all()
+            raise
+
+    def submit(
+        self, operation: Callable[..., Any], *args, priority: int = 0, **kwargs
+    ) -> Any:
+        """
+        Call an operation creating an async request once it is admitted, e.g.
+        controller.submit(client.job.createJob, projectUid, body, content=...)
+
+        :param priority: int - operations with a lower value are admitted first
+        """
+        self.acquire(priority)
+        succeeded = False
+        try:
+            result = operation(*args, **kwargs)
+            succeeded = True
+            return result
+        finally:
+            with self._condition:
+                self._finish(succeeded)
+                self._condition.notify_all()
+
+
+class AsyncAdmissionController(_AdmissionBase):
+    def __init__(
+        self,
+        client: AsyncPhraseTMSClient,
+        refresh_interval: float = 5.0,
+        reserve: int = 0,
+        phrase_token: Optional[str] = None,
+    ):
+        super().__init__(refresh_interval, reserve, phrase_token)
+        self.client = client
+        self._condition: Optional[asyncio.Condition] = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def refresh(self) -> AsyncRequestStatusDto:
+        """
+        Read the limit and the pending count of the organization
+        """
+        condition = self._get_condition()
+        returned = self.returned
+        status = await self.client.async_request.getCurrentLimitStatus(
+            self.phrase_token
+        )
+        async with condition:
+            self._apply_status(status, returned)
+            condition.notify_all()
+        return status
+
+    async def acquire(self, priority: int = 0) -> None:
+        """
+        Wait until an operation may be sent. Waiting tasks are admitted by priority, then in order.
+        """
+        condition = self._get_condition()
+        ticket = (priority, next(self._sequence))
+        heapq.heappush(self._queue, ticket)
+        try:
+            while True:
+                async with condition:
+                    refresh = self._start_refresh(ticket)
+                    if not refresh:
+                        if self._try_admit(ticket):
+                            condition.notify_all()
+                            return
+                        if self._queue[0] == ticket:
+                            try:
+                                await asyncio.wait_for(
+                                    condition.wait(), self.refresh_interval
+                                )
+                            except asyncio.TimeoutError:
+                                pass
+                        else:
+                            await condition.wait()
+                        continue
+                try:
+                    await self.refresh()
+                finally:
+                    self._refreshing = False
+                    async with condition:
+                        condition.notify_all()
+        except BaseException:
+            if self._leave_queue(ticket):
+                async with condition:
+                    condition.notify_all()
+            raise
+
+    async def submit(
+        self,
+        operation: Callable[..., Awaitable[Any]],
+        *args,
+        priority: int = 0,
+        **kwargs,
+    ) -> Any:
+        """
+        Async version of SyncAdmissionController.submit
+        """
+        await self.acquire(priority)
+        succeeded = False
+        try:
+            result = await operation(*args, **kwargs)
+            succeeded = True
+            return result
+        finally:
+            self._finish(succeeded)
+            condition = self._get_condition()
+            async with condition:
+                condition.notify_all()
@@ -1,11 +1,72 @@
+import asyncio
 import logging
-from typing import Any, Optional
+from collections import Counter
+from typing import (
+    Any,
+    AsyncIterator,
+    ContextManager,
+    Dict,
+    Iterable,
+    Optional,
+    Sequence,
+    Union,
+)
 
 import httpx
-from httpx import HTTPStatusError
 
-from ..exceptions import NotAuthenticatedError, UnableToAuthenticateError
+from ..exceptions import UnableToAuthenticateError
 from ..models import MemsourceAuthTokenModel
+from ..models.phrase_models import AsyncRequestDto, BackgroundTasksTbDto, LoginUserDto
+from ..transport import (
+    AdaptiveConcurrencyLimiter,
+    AuthMiddleware,
+    CacheMiddleware,
+    CircuitBreakerMiddleware,
+    CoalescingMiddleware,
+    CompressionMiddleware,
+    ConcurrencyMiddleware,
+    HedgingMiddleware,
+    MetricsMiddleware,
+    Middleware,
+    Pipeline,
+    RateLimiter,
+    RateLimitMiddleware,
+    RequestContext,
+    RetryMiddleware,
+    RetryPolicy,
+    TimeoutMiddleware,
+    TimeoutPolicy,
+    deadline_context,
+    exception_from_response,
+)
+from ..transport.endpoints import (
+    MEMSOURCE_BASE_URL,
+    PROBE_PATH,
+    aprobe_endpoints,
+    fastest_endpoint,
+)
+from ..transport.pipeline import (
+    DEFAULT_TIMEOUT,
+    DOWNLOAD_TIMEOUT,
+    payload_to_dict,
+    response_json,
+)
+from ..transport.streaming import (
+    DEFAULT_CHUNK_SIZE,
+    DownloadDestination,
+    ProgressCallback,
+    UploadBody,
+    content_length,
+    open_destination,
+)
+from ..transport.timeouts import Deadline, TimeoutValue
+from ..waiters import (
+    AsyncAsyncRequestWaiter,
+    AsyncBackgroundTaskWaiter,
+    BackgroundTask,
+    BackgroundTaskProgress,
+    PollingPolicy,
+)
 from .tags import (
     AdditionalWorkflowStepOperations,
     AnalysisOperations,
@@ -54,13 +115,20 @@ from .tags import (
     XmlAssistantOperations,
 )
 
-MEMSOURCE_BASE_URL = "https://cloud.memsource.com/web"
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
 
 logger = logging.getLogger(__name__)
 
 
-async def async_get_phrase_tms_token(user: str, pw: str) -> MemsourceAuthTokenModel:
-    url = f"{MEMSOURCE_BASE_URL}/api2/v1/auth/login"
+async def async_get_phrase_tms_token(
+    user: str, pw: str, base_url: str = MEMSOURCE_BASE_URL
+) -> MemsourceAuthTokenModel:
+    """
+    :param base_url: string (optional) - data center or gateway to log in at, use the base_url of the client
+    """
+    url = f"{base_url}/api2/v1/auth/login"
     payload = {"userName": user, "password": pw}
     async with httpx.AsyncClient() as client:
         _r = await client.post(url, json=payload)
@@ -78,9 +146,115 @@ async def async_get_phrase_tms_token(user: str, pw: str) -> MemsourceAuthTokenMo
         return MemsourceAuthTokenModel(token="ApiToken " + token, expires=expires)
 
 
+def _h2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 class AsyncPhraseTMSClient:
-    def __init__(self, token: Optional[str] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        endpoints: Sequence[str] = (),
+        probe: bool = False,
+        limits: Optional[httpx.Limits] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        http2: bool = False,
+        cache: Optional[CacheMiddleware] = None,
+        coalescing: Optional[CoalescingMiddleware] = None,
+        compression: Optional[CompressionMiddleware] = None,
+        circuit_breaker: Optional[CircuitBreakerMiddleware] = None,
+        hedging: Optional[HedgingMiddleware] = None,
+        timeouts: Optional[TimeoutPolicy] = None,
+        polling: Optional[PollingPolicy] = None,
+        middlewares: Sequence[Middleware] = (),
+    ):
+        """
+        :param token: string (optional) - default token used when an operation is called without one
+        :param base_url: string (optional) - data center or gateway to send calls to, defaults to MEMSOURCE_BASE_URL.
+            See PHRASE_TMS_ENDPOINTS for the data centers
+        :param endpoints: list of strings (optional) - further base URLs that select_endpoint may switch to
+        :param probe: bool (optional) - measure the round trip time of base_url and endpoints when entering
+            the client with async with, and use the fastest reachable one
+        :param limits: httpx.Limits (optional) - connection pool limits and keep-alive expiry,
+            defaults to DEFAULT_POOL_LIMITS
+        :param http_client: httpx.AsyncClient (optional) - existing client to send requests with,
+            it is not closed by this client
+        :param transport: httpx.AsyncBaseTransport (optional) - transport for the pooled client,
+            ignored when http_client is supplied
+        :param retry_policy: RetryPolicy (optional) - when failed calls are retried, defaults to RetryPolicy().
+            Use RetryPolicy.disabled() to raise on the first failure
+        :param rate_limiter: RateLimiter (optional) - paces requests before they are sent,
+            can be shared between clients
+        :param concurrency_limiter: AdaptiveConcurrencyLimiter (optional) - adapts the number of requests
+            in flight to the latency and error rate of the responses
+        :param http2: bool (optional) - offer HTTP/2 so concurrent calls are multiplexed over few connections.
+            Requires the h2 package (pip install pyphrase[http2]), falls back to HTTP/1.1 without it or
+            when the server does not negotiate HTTP/2. Ignored when http_client or transport is supplied
+        :param cache: CacheMiddleware (optional) - reuse successful GET responses for a while
+        :param coalescing: CoalescingMiddleware (optional) - share one call among identical GETs in flight
+        :param compression: CompressionMiddleware (optional) - negotiate compressed responses and compress
+            large request bodies
+        :param circuit_breaker: CircuitBreakerMiddleware (optional) - fail fast on endpoint families
+            that keep failing
+        :param hedging: HedgingMiddleware (optional) - send a duplicate of GETs that take longer than usual
+        :param timeouts: TimeoutPolicy (optional) - connect/read/write/pool timeout profiles per endpoint family,
+            defaults to TimeoutPolicy()
+        :param polling: PollingPolicy (optional) - how often wait_for checks on async requests,
+            defaults to PollingPolicy()
+        :param middlewares: list of Middleware (optional) - added to the end of the pipeline,
+            right before the request is sent
+        """
         self.token = token
+        self.base_url = (base_url or MEMSOURCE_BASE_URL).rstrip("/")
+        self.endpoints = list(endpoints)
+        self.endpoint_rtts = {}
+        self.probe = probe
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.timeouts = timeouts or TimeoutPolicy()
+        self.async_request_waiter = AsyncAsyncRequestWaiter(self, polling)
+        self.background_task_waiter = AsyncBackgroundTaskWaiter(self)
+        self.metrics = MetricsMiddleware()
+        self.pipeline = Pipeline(
+            [
+                AuthMiddleware(),
+                cache,
+                coalescing,
+                compression,
+                RetryMiddleware(self.retry_policy),
+                circuit_breaker,
+                hedging,
+                rate_limiter and RateLimitMiddleware(rate_limiter),
+                concurrency_limiter and ConcurrencyMiddleware(concurrency_limiter),
+                hedging and hedging.admission,
+                TimeoutMiddleware(self.timeouts),
+                self.metrics,
+                *middlewares,
+            ]
+        )
+        self.http_versions = Counter()
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            if http2 and not _h2_available():
+                logger.warning(
+                    "HTTP/2 requested but h2 is not installed, using HTTP/1.1"
+                )
+                http2 = False
+            http_client = httpx.AsyncClient(
+                limits=limits or DEFAULT_POOL_LIMITS, transport=transport, http2=http2
+            )
+        http_client.event_hooks["response"].append(self._record_http_version)
+        self.http_client = http_client
         self.additional_workflow_step = AdditionalWorkflowStepOperations(self)
         self.analysis = AnalysisOperations(self)
         self.async_request = AsyncRequestOperations(self)
@@ -127,40 +301,257 @@ class AsyncPhraseTMSClient:
         self.workflow_changes = WorkflowChangesOperations(self)
         self.provider = ProviderOperations(self)
 
-    async def get_bytestream(
+    @property
+    def negotiated_http_version(self) -> Optional[str]:
+        """
+        Protocol of the most common response so far, e.g. "HTTP/2" or "HTTP/1.1".
+        See http_versions for the count of responses per protocol
+        """
+        if not self.http_versions:
+            return None
+        return self.http_versions.most_common(1)[0][0]
+
+    async def _record_http_version(self, response: httpx.Response) -> None:
+        self.http_versions[response.http_version] += 1
+
+    async def __aenter__(self) -> "AsyncPhraseTMSClient":
+        if self.probe and not self.endpoint_rtts:
+            await self.select_endpoint()
+        return self
+
+    async def select_endpoint(self, attempts: int = 3) -> str:
+        """
+        Measure the round trip time of base_url and endpoints and switch to the fastest reachable one.
+        Keeps base_url if none is reachable. The measurements are kept in endpoint_rtts.
+        """
+        candidates = list(dict.fromkeys([self.base_url, *self.endpoints]))
+        self.endpoint_rtts = await aprobe_endpoints(
+            self.http_client, candidates, attempts
+        )
+        fastest = fastest_endpoint(self.endpoint_rtts)
+        if fastest is None:
+            logger.warning(f"No endpoint reachable, keeping {self.base_url}")
+        else:
+            logger.info(f"Using {fastest}, round trip times: {self.endpoint_rtts}")
+            self.base_url = fastest
+        return self.base_url
+
+    async def warmup(
+        self,
+        connections: int = 1,
+        validate_token: bool = False,
+        phrase_token: Optional[str] = None,
+        timeout: float = 10.0,
+    ) -> Optional[LoginUserDto]:
+        """
+        Open pooled connections to base_url ahead of time, so that the first calls do not pay for DNS,
+        TCP and TLS. With HTTP/2 one connection carries all calls.
+
+        :param connections: int - connections to open at the same time, at most the keep-alive limit of the pool
+        :param validate_token: bool - check the token with whoAmI and return the user, raises if it is not valid
+        :param phrase_token: string (optional) - token to validate, defaults to the token of the client
+        :param timeout: float - seconds for each warm-up request
+        """
+        url = f"{self.base_url}{PROBE_PATH}"
+        await asyncio.gather(
+            *(self.http_client.get(url, timeout=timeout) for _ in range(connections))
+        )
+        if validate_token:
+            return await self.authentication.whoAmI(phrase_token)
+        return None
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the pooled connections, unless the http client was supplied by the caller
+        """
+        if self._owns_http_client:
+            await self.http_client.aclose()
+
+    async def wait_for(
+        self,
+        requests: Iterable[Any],
+        timeout: Optional[float] = None,
+        phrase_token: Optional[str] = None,
+    ) -> Dict[str, AsyncRequestDto]:
+        """
+        Wait until all async requests are done, e.g. those returned by createJob or preTranslateV3.
+        Many requests are resolved with a scan of listPendingRequests instead of one getAsyncRequest each.
+
+        :param requests: list of async request ids, or objects with an id such as AsyncRequestReference
+        :param timeout: float (optional) - seconds to wait at most, raises WaitTimeoutError after that
+
+        :return: dict of async request id to its finished AsyncRequestDto
+        """
+        return await self.async_request_waiter.wait_for(requests, timeout, phrase_token)
+
+    async def wait_for_background_tasks(
         self,
+        tasks: Iterable[BackgroundTask],
+        timeout: Optional[float] = None,
+        progress: Optional[BackgroundTaskProgress] = None,
+        phrase_token: Optional[str] = None,
+    ) -> Dict[str, BackgroundTasksTbDto]:
+        """
+        Wait until the imports and clears of translation memories and term bases are done, e.g. after
+        importTransMemoryV2 or clearTermBase. See BackgroundTask for how to describe them.
+
+        :param tasks: list of BackgroundTask, e.g. BackgroundTask.trans_memory(uid, async_request)
+        :param timeout: float (optional) - seconds to wait at most, raises WaitTimeoutError after that
+        :param progress: callable (optional) - called after every check with the tasks done and their number
+
+        :return: dict of memory or term base uid to its last background task
+        """
+        return await self.background_task_waiter.wait_for(
+            tasks, timeout, progress, phrase_token
+        )
+
+    def deadline(self, seconds: float) -> ContextManager[Deadline]:
+        """
+        Context manager limiting all calls inside it, with their retries, to `seconds` in total,
+        e.g. with client.deadline(5): ... Raises DeadlineExceededError when the time is up.
+        """
+        return deadline_context(seconds)
+
+    async def request(
+        self,
+        method: str,
         path: str,
         phrase_token: Optional[str] = None,
         params: Optional[dict] = None,
         payload: Optional[Any] = None,
         files: Optional[Any] = None,
         headers: Optional[dict] = None,
-    ) -> bytes:
-        token = phrase_token or self.token
-        if token is None:
-            raise NotAuthenticatedError
-
-        if params is None:
-            params = {}
-
-        url = f"{MEMSOURCE_BASE_URL}{path}"
-        header = {"Authorization": token}
-        if headers is not None:
-            header.update(headers)
-
-        async with httpx.AsyncClient() as client:
-            logger.info(url, params)
-            r = await client.get(url, params=params, headers=header, timeout=60.0)
-
+        content: Optional[Union[bytes, UploadBody]] = None,
+        timeout: TimeoutValue = DEFAULT_TIMEOUT,
+        stream: bool = False,
+        exclude_none: bool = False,
+    ) -> httpx.Response:
+        """
+        Send a call through the middleware pipeline. All verb methods use this.
+
+        :param method: string (required) - HTTP method
+        :param path: string (required) - endpoint path, e.g. /api2/v1/projects/{projectUid}
+        :param payload: dict or pydantic model (optional) - JSON body
+        :param timeout: TimeoutValue - name of a profile of the client's TimeoutPolicy, seconds or httpx.Timeout
+        :param stream: bool - leave the body unread, the caller must close the response
+        :param exclude_none: bool - leave fields that are None out of a pydantic payload
+        :raises PhraseTMSException: for error responses left after retries
+        """
+        context = RequestContext(
+            method,
+            path,
+            f"{self.base_url}{path}",
+            token=phrase_token or self.token,
+            params=params,
+            headers=headers,
+            json=payload_to_dict(payload, exclude_none=exclude_none),
+            content=content,
+            files=files,
+            timeout=timeout,
+            stream=stream,
+        )
+        logger.info(context.url)
+        response = await self.pipeline.asend(context, self._send)
+        if response.is_error:
+            if stream:
+                await response.aread()
+                await response.aclose()
+            logger.error(f"Call failed: {response} // {context.url} - {context.params}")
+            raise exception_from_response(response)
+        return response
+
+    async def _send(self, context: RequestContext) -> httpx.Response:
+        kwargs = context.request_kwargs()
+        if isinstance(kwargs["content"], UploadBody):
+            kwargs["content"] = kwargs["content"].aiter_chunks()
+        request = self.http_client.build_request(context.method, context.url, **kwargs)
+        return await self.http_client.send(request, stream=context.stream)
+
+    async def _iter_response(
+        self,
+        response: httpx.Response,
+        progress: Optional[ProgressCallback] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        total = content_length(response)
+        received = 0
         try:
-            r.raise_for_status()
-        except HTTPStatusError as exc:
-            logger.exception(f"Call failed: {r.content} // {url} - {params}")
-            raise Exception from exc
+            async for chunk in response.aiter_bytes(chunk_size):
+                received += len(chunk)
+                if progress is not None:
+                    progress(received, total)
+                yield chunk
+        finally:
+            await response.aclose()
+
+    async def _write_response(
+        self,
+        response: httpx.Response,
+        destination: DownloadDestination,
+        progress: Optional[ProgressCallback] = None,
+    ) -> int:
+        written = 0
+        with open_destination(destination) as f:
+            async for chunk in self._iter_response(response, progress):
+                f.write(chunk)
+                written += len(chunk)
+        return written
+
+    async def iter_bytestream(
+        self,
+        path: str,
+        phrase_token: Optional[str] = None,
+        params: Optional[dict] = None,
+        payload: Optional[Any] = None,
+        headers: Optional[dict] = None,
+        method: str = "GET",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream the body of a file download in chunks, without holding the whole file in memory
+
+        :param path: string (required) - endpoint path, e.g. /api2/v1/projects/{projectUid}/jobs/{jobUid}/original
+        :param method: string - GET, or POST for downloads that take a body
+        :param chunk_size: int - size of the yielded chunks in bytes
+        :param progress: callable (optional) - called with bytes received so far and total bytes, if known
+        """
+        r = await self.request(
+            method,
+            path,
+            phrase_token,
+            params=params,
+            payload=payload,
+            headers=headers,
+            timeout=DOWNLOAD_TIMEOUT,
+            stream=True,
+        )
+        async for chunk in self._iter_response(r, progress, chunk_size):
+            yield chunk
 
+    async def _bytestream(
+        self,
+        method: str,
+        path: str,
+        destination: Optional[DownloadDestination],
+        progress: Optional[ProgressCallback],
+        **kwargs,
+    ) -> Union[bytes, int]:
+        r = await self.request(
+            method,
+            path,
+            timeout=DOWNLOAD_TIMEOUT,
+            stream=destination is not None,
+            **kwargs,
+        )
+        if destination is not None:
+            return await self._write_response(r, destination, progress)
         return r.content
 
-    async def post_bytestream(
+    async def get_bytestream(
         self,
         path: str,
         phrase_token: Optional[str] = None,
@@ -168,45 +559,44 @@ class AsyncPhraseTMSClient:
         payload: Optional[Any] = None,
         files: Optional[Any] = None,
         headers: Optional[dict] = None,
-        content: Optional[bytes] = None,
-    ) -> bytes:
-        token = phrase_token or self.token
-        if token is None:
-            raise NotAuthenticatedError
-
-        if params is None:
-            params = {}
-
-        url = f"{MEMSOURCE_BASE_URL}{path}"
-        header = {"Authorization": token}
-        if headers is not None:
-            header.update(headers)
-
-        if payload is not None and type(payload) != dict:
-            try:
-                payload = payload.dict()
-            except Exception as e:
-                logger.exception(f"Payload could not be cast as dict: {e}")
-                raise Exception from e
-
-        async with httpx.AsyncClient() as client:
-            logger.info(url, params)
-            r = await client.post(
-                url,
-                json=payload,
-                headers=header,
-                params=params,
-                files=files,
-                timeout=60.0,
-            )
-
-        try:
-            r.raise_for_status()
-        except HTTPStatusError as exc:
-            logger.exception(f"Call failed: {r.content} // {url} - {params}")
-            raise Exception from exc
+        content: Optional[Union[bytes, UploadBody]] = None,
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
+        return await self._bytestream(
+            "GET",
+            path,
+            destination,
+            progress,
+            phrase_token=phrase_token,
+            params=params,
+            headers=headers,
+        )
 
-        return r.content
+    async def post_bytestream(
+        self,
+        path: str,
+        phrase_token: Optional[str] = None,
+        params: Optional[dict] = None,
+        payload: Optional[Any] = None,
+        files: Optional[Any] = None,
+        headers: Optional[dict] = None,
+        content: Optional[Union[bytes, UploadBody]] = None,
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
+        return await self._bytestream(
+            "POST",
+            path,
+            destination,
+            progress,
+            phrase_token=phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            headers=headers,
+            content=content,
+        )
 
     async def get(
         self,
@@ -216,29 +606,19 @@ class AsyncPhraseTMSClient:
         payload: Optional[Any] = None,
         files: Optional[Any] = None,
         headers: Optional[dict] = None,
-    ) -> dict:
-        token = phrase_token or self.token
-        if token is None:
-            raise NotAuthenticatedError
-
-        if params is None:
-            params = {}
-        params = {k: v for k, v in params.items() if v is not None}
-
-        url = f"{MEMSOURCE_BASE_URL}{path}"
-        header = {"Authorization": token}
-        if headers is not None:
-            header.update(headers)
-
-        async with httpx.AsyncClient() as client:
-            logger.info(url)
-            resp = await client.get(url, params=params, headers=header, timeout=30.0)
-        try:
-            resp.raise_for_status()
-        except HTTPStatusError as exc:
-            logger.exception(f"Call failed: {resp.content} // {url} - {params}")
-            raise Exception from exc
-        return resp.json()
+        content: Optional[Union[bytes, UploadBody]] = None,
+    ) -> dict | None:
+        r = await self.request(
+            "GET",
+            path,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            headers=headers,
+            content=content,
+        )
+        return response_json(r)
 
     async def post(
         self,
@@ -248,40 +628,20 @@ class AsyncPhraseTMSClient:
         payload: Optional[Any] = None,
         files: Optional[Any] = None,
         headers: Optional[dict] = None,
-        content: Optional[bytes] = None,
-    ) -> dict:
-        token = phrase_token or self.token
-        if token is None:
-            raise NotAuthenticatedError
-
-        url = f"{MEMSOURCE_BASE_URL}{path}"
-        header = {"Authorization": token}
-        if headers is not None:
-            header.update(headers)
-
-        if payload is not None and type(payload) != dict:
-            try:
-                payload = payload.dict()
-            except Exception as e:
-                logger.exception(f"Payload could not be cast as dict: {e}")
-                raise Exception from e
-
-        async with httpx.AsyncClient() as client:
-            r = await client.post(
-                url,
-                json=payload,
-                headers=header,
-                params=params,
-                files=files,
-                content=content,
-                timeout=30.0,
-            )
-        try:
-            r.raise_for_status()
-        except HTTPStatusError as exc:
-            logger.exception(f"Call failed: {r.content} // {url} - {payload}")
-            raise Exception from exc
-        return r.json()
+        content: Optional[Union[bytes, UploadBody]] = None,
+    ) -> dict | None:
+        r = await self.request(
+            "POST",
+            path,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            headers=headers,
+            content=content,
+            exclude_none=True,
+        )
+        return response_json(r)
 
     async def put(
         self,
@@ -291,41 +651,19 @@ class AsyncPhraseTMSClient:
         payload: Optional[Any] = None,
         files: Optional[Any] = None,
         headers: Optional[dict] = None,
-        content: Optional[bytes] = None,
-    ) -> dict:
-        token = phrase_token or self.token
-        if token is None:
-            raise NotAuthenticatedError
-
-        url = f"{MEMSOURCE_BASE_URL}{path}"
-        header = {"Authorization": token}
-        if headers is not None:
-            header.update(headers)
-        if payload is not None and type(payload) != dict:
-            try:
-                payload = payload.dict()
-            except Exception as e:
-                logger.exception(f"Payload could not be cast as dict: {e}")
-                raise Exception from e
-
-        async with httpx.AsyncClient() as client:
-            r = await client.put(
-                url,
-                json=payload,
-                headers=header,
-                params=params,
-                files=files,
-                content=content,
-                timeout=30.0,
-            )
-
-        try:
-            r.raise_for_status()
-        except HTTPStatusError as exc:
-            logger.exception(f"Call failed: {r.content} // {url} - {payload}")
-            raise Exception from exc
-
-        return r.json()
+        content: Optional[Union[bytes, UploadBody]] = None,
+    ) -> dict | None:
+        r = await self.request(
+            "PUT",
+            path,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            headers=headers,
+            content=content,
+        )
+        return response_json(r)
 
     async def patch(
         self,
@@ -335,41 +673,19 @@ class AsyncPhraseTMSClient:
         payload: Optional[Any] = None,
         files: Optional[Any] = None,
         headers: Optional[dict] = None,
-        content: Optional[bytes] = None,
-    ) -> dict:
-        token = phrase_token or self.token
-        if token is None:
-            raise NotAuthenticatedError
-
-        url = f"{MEMSOURCE_BASE_URL}{path}"
-        header = {"Authorization": token}
-        if headers is not None:
-            header.update(headers)
-        if payload is not None and type(payload) != dict:
-            try:
-                payload = payload.dict()
-            except Exception as e:
-                logger.exception(f"Payload could not be cast as dict: {e}")
-                raise Exception from e
-
-        async with httpx.AsyncClient() as client:
-            r = await client.patch(
-                url,
-                json=payload,
-                headers=header,
-                params=params,
-                files=files,
-                content=content,
-                timeout=30.0,
-            )
-
-        try:
-            r.raise_for_status()
-        except HTTPStatusError as exc:
-            logger.exception(f"Call failed: {r.content} // {url} - {payload}")
-            raise Exception from exc
-
-        return r.json()
+        content: Optional[Union[bytes, UploadBody]] = None,
+    ) -> dict | None:
+        r = await self.request(
+            "PATCH",
+            path,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            headers=headers,
+            content=content,
+        )
+        return response_json(r)
 
     async def delete(
         self,
@@ -379,23 +695,16 @@ class AsyncPhraseTMSClient:
         payload: Optional[Any] = None,
         files: Optional[Any] = None,
         headers: Optional[dict] = None,
-    ) -> dict:
-        token = phrase_token or self.token
-        if token is None:
-            raise NotAuthenticatedError
-
-        url = f"{MEMSOURCE_BASE_URL}{path}"
-        header = {"Authorization": token}
-        if headers is not None:
-            header.update(headers)
-
-        async with httpx.AsyncClient() as client:
-            r = await client.delete(url, headers=header, params=params, timeout=30.0)
-
-        try:
-            r.raise_for_status()
-        except HTTPStatusError as exc:
-            logger.exception(f"Call failed: {r.content} // {url} - {payload}")
-            raise Exception from exc
-
-        return r.json()
+        content: Optional[Union[bytes, UploadBody]] = None,
+    ) -> dict | None:
+        r = await self.request(
+            "DELETE",
+            path,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            headers=headers,
+            content=content,
+        )
+        return response_json(r)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
 if TYPE_CHECKING:
     from ..client import AsyncPhraseTMSClient
@@ -10,6 +10,7 @@ from ...models.phrase_models import (
     AdditionalWorkflowStepRequestDto,
     PageDtoAdditionalWorkflowStepDto,
 )
+from ...pagination import apaginate_items
 
 
 class AdditionalWorkflowStepOperations:
@@ -68,6 +69,36 @@ class AdditionalWorkflowStepOperations:
 
         return PageDtoAdditionalWorkflowStepDto(**r)
 
+    def iter_listAWFSteps(
+        self,
+        name: str = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[AdditionalWorkflowStepDto]:
+        """
+        List additional workflow steps, all pages
+
+        Yields the items of every page of listAWFSteps. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listAWFSteps except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of AdditionalWorkflowStepDto
+        """
+        return apaginate_items(
+            self.listAWFSteps,
+            pageSize,
+            concurrency,
+            prefetch,
+            name=name,
+            phrase_token=phrase_token,
+        )
+
     async def createAWFStep(
         self, body: AdditionalWorkflowStepRequestDto, phrase_token: Optional[str] = None
     ) -> AdditionalWorkflowStepDto:
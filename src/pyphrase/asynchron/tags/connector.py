@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 if TYPE_CHECKING:
     from ..client import AsyncPhraseTMSClient
@@ -13,6 +13,7 @@ from ...models.phrase_models import (
     GetFileRequestParamsDto,
     UploadResultDto,
 )
+from ...transport.streaming import DownloadDestination, ProgressCallback
 
 
 class ConnectorOperations:
@@ -25,7 +26,9 @@ class ConnectorOperations:
         folder: str,
         connectorId: str,
         phrase_token: Optional[str] = None,
-    ) -> bytes:
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
         Download file
         Download a file from a subfolder of the selected connector
@@ -34,6 +37,9 @@ class ConnectorOperations:
         :param connectorId: string (required), path.
 
         :param phrase_token: string (optional) - if not supplied, client will look token from init
+        :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+            the number of bytes written is returned
+        :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
         :return: InputStreamLength
         """
@@ -44,7 +50,13 @@ class ConnectorOperations:
         payload = None
 
         r = await self.client.get_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
@@ -236,7 +248,9 @@ class ConnectorOperations:
         folder: str,
         connectorId: str,
         phrase_token: Optional[str] = None,
-    ) -> bytes:
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
         Download prepared file
         Download the file by referencing successfully finished async download request [Connector - Download file (async)](#operation/getFile_1).
@@ -246,6 +260,9 @@ class ConnectorOperations:
         :param connectorId: string (required), path.
 
         :param phrase_token: string (optional) - if not supplied, client will look token from init
+        :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+            the number of bytes written is returned
+        :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
         :return: InputStreamLength
         """
@@ -256,7 +273,13 @@ class ConnectorOperations:
         payload = None
 
         r = await self.client.get_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
 if TYPE_CHECKING:
     from ..client import AsyncPhraseTMSClient
@@ -10,6 +10,7 @@ from ...models.phrase_models import (
     CostCenterEditDto,
     PageDtoCostCenterDto,
 )
+from ...pagination import apaginate_items
 
 
 class CostCenterOperations:
@@ -135,6 +136,42 @@ class CostCenterOperations:
 
         return PageDtoCostCenterDto(**r)
 
+    def iter_listCostCenters(
+        self,
+        createdBy: str = None,
+        name: str = None,
+        sort: str = "NAME",
+        order: str = "ASC",
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[CostCenterDto]:
+        """
+        List of cost centers, all pages
+
+        Yields the items of every page of listCostCenters. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listCostCenters except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of CostCenterDto
+        """
+        return apaginate_items(
+            self.listCostCenters,
+            pageSize,
+            concurrency,
+            prefetch,
+            createdBy=createdBy,
+            name=name,
+            sort=sort,
+            order=order,
+            phrase_token=phrase_token,
+        )
+
     async def createCostCenter(
         self, body: CostCenterEditDto, phrase_token: Optional[str] = None
     ) -> CostCenterDto:
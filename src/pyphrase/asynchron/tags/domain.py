@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
 if TYPE_CHECKING:
     from ..client import AsyncPhraseTMSClient
 
 from ...models.phrase_models import DomainDto, DomainEditDto, PageDtoDomainDto
+from ...pagination import apaginate_items
 
 
 class DomainOperations:
@@ -128,6 +129,42 @@ class DomainOperations:
 
         return PageDtoDomainDto(**r)
 
+    def iter_listDomains(
+        self,
+        createdBy: str = None,
+        name: str = None,
+        sort: str = "NAME",
+        order: str = "ASC",
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[DomainDto]:
+        """
+        List of domains, all pages
+
+        Yields the items of every page of listDomains. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listDomains except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of DomainDto
+        """
+        return apaginate_items(
+            self.listDomains,
+            pageSize,
+            concurrency,
+            prefetch,
+            createdBy=createdBy,
+            name=name,
+            sort=sort,
+            order=order,
+            phrase_token=phrase_token,
+        )
+
     async def createDomain(
         self, body: DomainEditDto, phrase_token: Optional[str] = None
     ) -> DomainDto:
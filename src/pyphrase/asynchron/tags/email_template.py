@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
 if TYPE_CHECKING:
     from ..client import AsyncPhraseTMSClient
@@ -9,6 +9,7 @@ from ...models.phrase_models import (
     OrganizationEmailTemplateDto,
     PageDtoOrganizationEmailTemplateDto,
 )
+from ...pagination import apaginate_items
 
 
 class EmailTemplateOperations:
@@ -68,3 +69,33 @@ class EmailTemplateOperations:
         )
 
         return PageDtoOrganizationEmailTemplateDto(**r)
+
+    def iter_listOrgEmailTemplates(
+        self,
+        type: str = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[OrganizationEmailTemplateDto]:
+        """
+        List email templates, all pages
+
+        Yields the items of every page of listOrgEmailTemplates. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listOrgEmailTemplates except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of OrganizationEmailTemplateDto
+        """
+        return apaginate_items(
+            self.listOrgEmailTemplates,
+            pageSize,
+            concurrency,
+            prefetch,
+            type=type,
+            phrase_token=phrase_token,
+        )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
 if TYPE_CHECKING:
     from ..client import AsyncPhraseTMSClient
@@ -9,8 +9,10 @@ from ...models.phrase_models import (
     ImportSettingsCreateDto,
     ImportSettingsDto,
     ImportSettingsEditDto,
+    ImportSettingsReference,
     PageDtoImportSettingsReference,
 )
+from ...pagination import apaginate_items
 
 
 class ImportSettingsOperations:
@@ -118,6 +120,36 @@ class ImportSettingsOperations:
 
         return PageDtoImportSettingsReference(**r)
 
+    def iter_listImportSettings(
+        self,
+        name: str = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[ImportSettingsReference]:
+        """
+        List import settings, all pages
+
+        Yields the items of every page of listImportSettings. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listImportSettings except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of ImportSettingsReference
+        """
+        return apaginate_items(
+            self.listImportSettings,
+            pageSize,
+            concurrency,
+            prefetch,
+            name=name,
+            phrase_token=phrase_token,
+        )
+
     async def createImportSettings(
         self, body: ImportSettingsCreateDto, phrase_token: Optional[str] = None
     ) -> ImportSettingsDto:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
 if TYPE_CHECKING:
     from ..client import AsyncPhraseTMSClient
@@ -9,11 +9,14 @@ from ...models.phrase_models import (
     DiscountSchemeCreateDto,
     NetRateScheme,
     NetRateSchemeEdit,
+    NetRateSchemeReference,
     NetRateSchemeWorkflowStep,
     NetRateSchemeWorkflowStepEdit,
+    NetRateSchemeWorkflowStepReference,
     PageDtoNetRateSchemeReference,
     PageDtoNetRateSchemeWorkflowStepReference,
 )
+from ...pagination import apaginate_items
 
 
 class NetRateSchemeOperations:
@@ -100,6 +103,34 @@ class NetRateSchemeOperations:
 
         return PageDtoNetRateSchemeReference(**r)
 
+    def iter_getDiscountSchemes(
+        self,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[NetRateSchemeReference]:
+        """
+        List net rate schemes, all pages
+
+        Yields the items of every page of getDiscountSchemes. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getDiscountSchemes except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of NetRateSchemeReference
+        """
+        return apaginate_items(
+            self.getDiscountSchemes,
+            pageSize,
+            concurrency,
+            prefetch,
+            phrase_token=phrase_token,
+        )
+
     async def createDiscountScheme(
         self, body: DiscountSchemeCreateDto, phrase_token: Optional[str] = None
     ) -> NetRateScheme:
@@ -211,3 +242,33 @@ class NetRateSchemeOperations:
         )
 
         return PageDtoNetRateSchemeWorkflowStepReference(**r)
+
+    def iter_getDiscountSchemeWorkflowSteps(
+        self,
+        netRateSchemeUid: str,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[NetRateSchemeWorkflowStepReference]:
+        """
+        List schemes for workflow step, all pages
+
+        Yields the items of every page of getDiscountSchemeWorkflowSteps. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getDiscountSchemeWorkflowSteps except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of NetRateSchemeWorkflowStepReference
+        """
+        return apaginate_items(
+            self.getDiscountSchemeWorkflowSteps,
+            pageSize,
+            concurrency,
+            prefetch,
+            netRateSchemeUid=netRateSchemeUid,
+            phrase_token=phrase_token,
+        )
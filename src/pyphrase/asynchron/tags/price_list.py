@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
 
 if TYPE_CHECKING:
     from ..client import AsyncPhraseTMSClient
@@ -14,8 +14,10 @@ from ...models.phrase_models import (
     TranslationPriceSetBulkMinimumPricesDto,
     TranslationPriceSetBulkPricesDto,
     TranslationPriceSetCreateDto,
+    TranslationPriceSetDto,
     TranslationPriceSetListDto,
 )
+from ...pagination import apaginate_items
 
 
 class PriceListOperations:
@@ -126,6 +128,34 @@ class PriceListOperations:
 
         return PageDtoTranslationPriceListDto(**r)
 
+    def iter_getListOfPriceList(
+        self,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[TranslationPriceListDto]:
+        """
+        List price lists, all pages
+
+        Yields the items of every page of getListOfPriceList. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getListOfPriceList except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of TranslationPriceListDto
+        """
+        return apaginate_items(
+            self.getListOfPriceList,
+            pageSize,
+            concurrency,
+            prefetch,
+            phrase_token=phrase_token,
+        )
+
     async def createPriceList(
         self, body: TranslationPriceListCreateDto, phrase_token: Optional[str] = None
     ) -> TranslationPriceListDto:
@@ -189,6 +219,40 @@ class PriceListOperations:
 
         return PageDtoTranslationPriceSetDto(**r)
 
+    def iter_getPricesWithWorkflowSteps(
+        self,
+        priceListUid: str,
+        targetLanguages: List[str] = None,
+        sourceLanguages: List[str] = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[TranslationPriceSetDto]:
+        """
+        List price sets, all pages
+
+        Yields the items of every page of getPricesWithWorkflowSteps. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getPricesWithWorkflowSteps except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of TranslationPriceSetDto
+        """
+        return apaginate_items(
+            self.getPricesWithWorkflowSteps,
+            pageSize,
+            concurrency,
+            prefetch,
+            priceListUid=priceListUid,
+            targetLanguages=targetLanguages,
+            sourceLanguages=sourceLanguages,
+            phrase_token=phrase_token,
+        )
+
     async def createLanguagePair(
         self,
         priceListUid: str,
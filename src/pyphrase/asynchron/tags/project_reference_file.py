@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional, Union
 
 if TYPE_CHECKING:
     from ..client import AsyncPhraseTMSClient
@@ -9,9 +9,12 @@ from ...models.phrase_models import (
     CreateReferenceFilesRequest,
     ProjectReferenceFilesRequestDto,
     ReferenceFilePageDto,
+    ReferenceFileReference,
     ReferenceFilesDto,
     UserReferencesDto,
 )
+from ...pagination import apaginate_items
+from ...transport.streaming import DownloadDestination, ProgressCallback
 
 
 class ProjectReferenceFileOperations:
@@ -66,6 +69,46 @@ class ProjectReferenceFileOperations:
 
         return ReferenceFilePageDto(**r)
 
+    def iter_listReferenceFiles(
+        self,
+        projectUid: str,
+        createdBy: str = None,
+        dateCreatedSince: str = None,
+        filename: str = None,
+        pageSize: int = 50,
+        sort: str = "DATE_CREATED",
+        order: str = "DESC",
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[ReferenceFileReference]:
+        """
+        List project reference files, all pages
+
+        Yields the items of every page of listReferenceFiles. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listReferenceFiles except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of ReferenceFileReference
+        """
+        return apaginate_items(
+            self.listReferenceFiles,
+            pageSize,
+            concurrency,
+            prefetch,
+            projectUid=projectUid,
+            createdBy=createdBy,
+            dateCreatedSince=dateCreatedSince,
+            filename=filename,
+            sort=sort,
+            order=order,
+            phrase_token=phrase_token,
+        )
+
     async def batchDeleteReferenceFiles(
         self,
         projectUid: str,
@@ -95,8 +138,13 @@ class ProjectReferenceFileOperations:
         return
 
     async def downloadReference(
-        self, referenceFileId: str, projectUid: str, phrase_token: Optional[str] = None
-    ) -> bytes:
+        self,
+        referenceFileId: str,
+        projectUid: str,
+        phrase_token: Optional[str] = None,
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
         Download project reference file
 
@@ -104,6 +152,9 @@ class ProjectReferenceFileOperations:
         :param projectUid: string (required), path.
 
         :param phrase_token: string (optional) - if not supplied, client will look token from init
+        :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+            the number of bytes written is returned
+        :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
         :return: None
         """
@@ -114,7 +165,13 @@ class ProjectReferenceFileOperations:
         payload = None
 
         r = await self.client.get_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
@@ -124,7 +181,9 @@ class ProjectReferenceFileOperations:
         projectUid: str,
         body: ProjectReferenceFilesRequestDto,
         phrase_token: Optional[str] = None,
-    ) -> bytes:
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
         Download project reference files (batch)
 
@@ -132,6 +191,9 @@ class ProjectReferenceFileOperations:
         :param body: ProjectReferenceFilesRequestDto (required), body.
 
         :param phrase_token: string (optional) - if not supplied, client will look token from init
+        :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+            the number of bytes written is returned
+        :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
         :return: None
         """
@@ -142,7 +204,13 @@ class ProjectReferenceFileOperations:
         payload = body
 
         r = await self.client.post_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
 
 if TYPE_CHECKING:
     from ..client import AsyncPhraseTMSClient
@@ -19,7 +19,9 @@ from ...models.phrase_models import (
     UpdateIgnoredChecksDto,
     UpdateIgnoredWarningsDto,
     UpdateLqaProfileDto,
+    UserReference,
 )
+from ...pagination import apaginate_items
 
 
 class QualityAssuranceOperations:
@@ -72,6 +74,44 @@ class QualityAssuranceOperations:
 
         return PageDtoLqaProfileReferenceDto(**r)
 
+    def iter_getLqaProfiles(
+        self,
+        order: List[str] = None,
+        sort: List[str] = None,
+        dateCreated: str = None,
+        createdBy: str = None,
+        name: str = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[LqaProfileReferenceDto]:
+        """
+        GET list LQA profiles, all pages
+
+        Yields the items of every page of getLqaProfiles. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getLqaProfiles except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of LqaProfileReferenceDto
+        """
+        return apaginate_items(
+            self.getLqaProfiles,
+            pageSize,
+            concurrency,
+            prefetch,
+            order=order,
+            sort=sort,
+            dateCreated=dateCreated,
+            createdBy=createdBy,
+            name=name,
+            phrase_token=phrase_token,
+        )
+
     async def createLqaProfile(
         self, body: CreateLqaProfileDto, phrase_token: Optional[str] = None
     ) -> LqaProfileDetailDto:
@@ -382,6 +422,34 @@ class QualityAssuranceOperations:
 
         return PageDtoUserReference(**r)
 
+    def iter_getLqaProfileAuthorsV2(
+        self,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[UserReference]:
+        """
+        Get list of LQA profile authors, all pages
+
+        Yields the items of every page of getLqaProfileAuthorsV2. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getLqaProfileAuthorsV2 except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of UserReference
+        """
+        return apaginate_items(
+            self.getLqaProfileAuthorsV2,
+            pageSize,
+            concurrency,
+            prefetch,
+            phrase_token=phrase_token,
+        )
+
     async def enabledQualityChecksForJob(
         self, jobUid: str, projectUid: str, phrase_token: Optional[str] = None
     ) -> QualityAssuranceChecksDtoV2:
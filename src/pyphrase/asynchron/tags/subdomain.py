@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
 if TYPE_CHECKING:
     from ..client import AsyncPhraseTMSClient
 
 from ...models.phrase_models import PageDtoSubDomainDto, SubDomainDto, SubDomainEditDto
+from ...pagination import apaginate_items
 
 
 class SubdomainOperations:
@@ -131,6 +132,42 @@ class SubdomainOperations:
 
         return PageDtoSubDomainDto(**r)
 
+    def iter_listSubDomains(
+        self,
+        createdBy: str = None,
+        name: str = None,
+        sort: str = "NAME",
+        order: str = "ASC",
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[SubDomainDto]:
+        """
+        List subdomains, all pages
+
+        Yields the items of every page of listSubDomains. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listSubDomains except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of SubDomainDto
+        """
+        return apaginate_items(
+            self.listSubDomains,
+            pageSize,
+            concurrency,
+            prefetch,
+            createdBy=createdBy,
+            name=name,
+            sort=sort,
+            order=order,
+            phrase_token=phrase_token,
+        )
+
     async def createSubDomain(
         self, body: SubDomainEditDto, phrase_token: Optional[str] = None
     ) -> SubDomainDto:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Union
 
 if TYPE_CHECKING:
     from ..client import AsyncPhraseTMSClient
@@ -32,6 +32,13 @@ from ...models.phrase_models import (
     TermEditDto,
     TermPairDto,
 )
+from ...pagination import apaginate_items
+from ...transport.streaming import (
+    DownloadDestination,
+    ProgressCallback,
+    UploadBody,
+    UploadContent,
+)
 
 
 class TermBaseOperations:
@@ -242,6 +249,37 @@ class TermBaseOperations:
 
         return ConceptListResponseDto(**r)
 
+    def iter_listConcepts(
+        self,
+        termBaseUid: str,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[ConceptWithMetadataDto]:
+        """
+        List concepts, all pages
+
+        Yields the items of every page of listConcepts. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listConcepts except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of ConceptWithMetadataDto
+        """
+        return apaginate_items(
+            self.listConcepts,
+            pageSize,
+            concurrency,
+            prefetch,
+            items="concepts",
+            termBaseUid=termBaseUid,
+            phrase_token=phrase_token,
+        )
+
     async def createConcept(
         self, termBaseUid: str, body: ConceptEditDto, phrase_token: Optional[str] = None
     ) -> ConceptWithMetadataDto:
@@ -616,7 +654,9 @@ class TermBaseOperations:
         format: str = "Tbx",
         charset: str = "UTF-8",
         phrase_token: Optional[str] = None,
-    ) -> bytes:
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
         Export term base
 
@@ -626,6 +666,9 @@ class TermBaseOperations:
         :param charset: string (optional), query.
 
         :param phrase_token: string (optional) - if not supplied, client will look token from init
+        :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+            the number of bytes written is returned
+        :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
         :return: None
         """
@@ -636,7 +679,13 @@ class TermBaseOperations:
         payload = None
 
         r = await self.client.get_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
@@ -687,6 +736,44 @@ class TermBaseOperations:
 
         return PageDtoTermBaseDto(**r)
 
+    def iter_listTermBases(
+        self,
+        subDomainId: str = None,
+        domainId: str = None,
+        clientId: str = None,
+        lang: List[str] = None,
+        name: str = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[TermBaseDto]:
+        """
+        List term bases, all pages
+
+        Yields the items of every page of listTermBases. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listTermBases except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of TermBaseDto
+        """
+        return apaginate_items(
+            self.listTermBases,
+            pageSize,
+            concurrency,
+            prefetch,
+            subDomainId=subDomainId,
+            domainId=domainId,
+            clientId=clientId,
+            lang=lang,
+            name=name,
+            phrase_token=phrase_token,
+        )
+
     async def createTermBase(
         self, body: TermBaseEditDto, phrase_token: Optional[str] = None
     ) -> TermBaseDto:
@@ -714,23 +801,26 @@ class TermBaseOperations:
     async def importTermBaseV2(
         self,
         termBaseUid: str,
-        body: InputStream,
+        body: UploadContent,
         charset: str = "UTF-8",
         strictLangMatching: bool = "False",
         updateTerms: bool = "True",
         phrase_token: Optional[str] = None,
+        fileName: Optional[str] = None,
     ) -> dict:
         """
                 Upload term base
                 Terms can be imported from XLS/XLSX and TBX file formats into a term base.
         See <a target="_blank" href="https://support.phrase.com/hc/en-us/articles/5709733372188">Phrase Help Center</a>
                 :param termBaseUid: string (required), path.
-                :param body: InputStream (required), body.
+                :param body: UploadContent (required), body. Bytes, path, binary file, memory map or iterator of byte chunks,
+                    streamed while it is sent
                 :param charset: string (optional), query.
                 :param strictLangMatching: boolean (optional), query.
                 :param updateTerms: boolean (optional), query.
 
                 :param phrase_token: string (optional) - if not supplied, client will look token from init
+                :param fileName: string (optional) - name of the uploaded file, defaults to the name of the path or file in body
 
                 :return:
         """
@@ -741,11 +831,20 @@ class TermBaseOperations:
             "updateTerms": updateTerms,
         }
 
+        content = UploadBody(body)
+        headers = {"Content-Disposition": content.content_disposition(fileName)}
+
         files = None
-        payload = body
+        payload = None
 
         r = await self.client.post(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            content=content,
+            files=files,
+            headers=headers,
         )
 
         return r
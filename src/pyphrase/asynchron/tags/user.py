@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
 
 if TYPE_CHECKING:
     from ..client import AsyncPhraseTMSClient
@@ -8,17 +8,22 @@ if TYPE_CHECKING:
 from ...models.phrase_models import (
     AbstractUserCreateDto,
     AbstractUserEditDto,
+    AssignedJobDto,
+    LastLoginDto,
     PageDtoAssignedJobDto,
     PageDtoLastLoginDto,
     PageDtoProjectReference,
     PageDtoString,
     PageDtoUserDto,
     PageDtoWorkflowStepReference,
+    ProjectReference,
     UserDetailsDtoV3,
     UserDto,
     UserPasswordEditDto,
     UserStatisticsListDto,
+    WorkflowStepReference,
 )
+from ...pagination import apaginate_items
 
 
 class UserOperations:
@@ -100,6 +105,48 @@ class UserOperations:
 
         return PageDtoAssignedJobDto(**r)
 
+    def iter_listJobs(
+        self,
+        userUid: str,
+        filename: str = None,
+        dueInHours: int = None,
+        workflowStepId: int = None,
+        targetLang: List[str] = None,
+        projectUid: str = None,
+        status: List[str] = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[AssignedJobDto]:
+        """
+        List assigned jobs, all pages
+
+        Yields the items of every page of listJobs. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listJobs except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of AssignedJobDto
+        """
+        return apaginate_items(
+            self.listJobs,
+            pageSize,
+            concurrency,
+            prefetch,
+            userUid=userUid,
+            filename=filename,
+            dueInHours=dueInHours,
+            workflowStepId=workflowStepId,
+            targetLang=targetLang,
+            projectUid=projectUid,
+            status=status,
+            phrase_token=phrase_token,
+        )
+
     async def getListOfUsersFiltered(
         self,
         order: List[str] = None,
@@ -161,6 +208,54 @@ class UserOperations:
 
         return PageDtoUserDto(**r)
 
+    def iter_getListOfUsersFiltered(
+        self,
+        order: List[str] = None,
+        sort: List[str] = None,
+        role: List[str] = None,
+        nameOrEmail: str = None,
+        email: str = None,
+        userName: str = None,
+        name: str = None,
+        lastName: str = None,
+        firstName: str = None,
+        includeDeleted: bool = "False",
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[UserDto]:
+        """
+        List users, all pages
+
+        Yields the items of every page of getListOfUsersFiltered. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getListOfUsersFiltered except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of UserDto
+        """
+        return apaginate_items(
+            self.getListOfUsersFiltered,
+            pageSize,
+            concurrency,
+            prefetch,
+            order=order,
+            sort=sort,
+            role=role,
+            nameOrEmail=nameOrEmail,
+            email=email,
+            userName=userName,
+            name=name,
+            lastName=lastName,
+            firstName=firstName,
+            includeDeleted=includeDeleted,
+            phrase_token=phrase_token,
+        )
+
     async def updatePassword(
         self,
         userUid: str,
@@ -289,6 +384,48 @@ class UserOperations:
 
         return PageDtoProjectReference(**r)
 
+    def iter_listAssignedProjects(
+        self,
+        userUid: str,
+        projectName: str = None,
+        filename: str = None,
+        dueInHours: int = None,
+        workflowStepId: int = None,
+        targetLang: List[str] = None,
+        status: List[str] = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[ProjectReference]:
+        """
+        List assigned projects, all pages
+
+        Yields the items of every page of listAssignedProjects. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listAssignedProjects except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of ProjectReference
+        """
+        return apaginate_items(
+            self.listAssignedProjects,
+            pageSize,
+            concurrency,
+            prefetch,
+            userUid=userUid,
+            projectName=projectName,
+            filename=filename,
+            dueInHours=dueInHours,
+            workflowStepId=workflowStepId,
+            targetLang=targetLang,
+            status=status,
+            phrase_token=phrase_token,
+        )
+
     async def loginActivity(
         self, userUid: str, phrase_token: Optional[str] = None
     ) -> UserStatisticsListDto:
@@ -361,6 +498,46 @@ class UserOperations:
 
         return PageDtoWorkflowStepReference(**r)
 
+    def iter_listWorkflowSteps(
+        self,
+        userUid: str,
+        filename: str = None,
+        dueInHours: int = None,
+        targetLang: List[str] = None,
+        projectUid: str = None,
+        status: List[str] = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[WorkflowStepReference]:
+        """
+        List assigned workflow steps, all pages
+
+        Yields the items of every page of listWorkflowSteps. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listWorkflowSteps except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of WorkflowStepReference
+        """
+        return apaginate_items(
+            self.listWorkflowSteps,
+            pageSize,
+            concurrency,
+            prefetch,
+            userUid=userUid,
+            filename=filename,
+            dueInHours=dueInHours,
+            targetLang=targetLang,
+            projectUid=projectUid,
+            status=status,
+            phrase_token=phrase_token,
+        )
+
     async def listTargetLangs(
         self,
         userUid: str,
@@ -409,6 +586,46 @@ class UserOperations:
 
         return PageDtoString(**r)
 
+    def iter_listTargetLangs(
+        self,
+        userUid: str,
+        filename: str = None,
+        dueInHours: int = None,
+        workflowStepId: int = None,
+        projectUid: str = None,
+        status: List[str] = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        List assigned target languages, all pages
+
+        Yields the items of every page of listTargetLangs. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listTargetLangs except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of str
+        """
+        return apaginate_items(
+            self.listTargetLangs,
+            pageSize,
+            concurrency,
+            prefetch,
+            userUid=userUid,
+            filename=filename,
+            dueInHours=dueInHours,
+            workflowStepId=workflowStepId,
+            projectUid=projectUid,
+            status=status,
+            phrase_token=phrase_token,
+        )
+
     async def user_lastLogins(
         self,
         order: List[str] = None,
@@ -452,6 +669,42 @@ class UserOperations:
 
         return PageDtoLastLoginDto(**r)
 
+    def iter_user_lastLogins(
+        self,
+        order: List[str] = None,
+        sort: List[str] = None,
+        role: List[str] = None,
+        userName: str = None,
+        pageSize: int = 100,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[LastLoginDto]:
+        """
+        List last login dates, all pages
+
+        Yields the items of every page of user_lastLogins. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of user_lastLogins except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 100
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of LastLoginDto
+        """
+        return apaginate_items(
+            self.user_lastLogins,
+            pageSize,
+            concurrency,
+            prefetch,
+            order=order,
+            sort=sort,
+            role=role,
+            userName=userName,
+            phrase_token=phrase_token,
+        )
+
     async def createUserV3(
         self,
         body: AbstractUserCreateDto,
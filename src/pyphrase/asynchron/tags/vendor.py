@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
 if TYPE_CHECKING:
     from ..client import AsyncPhraseTMSClient
 
 from ...models.phrase_models import CreateVendorDto, PageDtoVendorDto, VendorDto
+from ...pagination import apaginate_items
 
 
 class VendorOperations:
@@ -66,6 +67,36 @@ class VendorOperations:
 
         return PageDtoVendorDto(**r)
 
+    def iter_listVendors(
+        self,
+        name: str = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[VendorDto]:
+        """
+        List vendors, all pages
+
+        Yields the items of every page of listVendors. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listVendors except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of VendorDto
+        """
+        return apaginate_items(
+            self.listVendors,
+            pageSize,
+            concurrency,
+            prefetch,
+            name=name,
+            phrase_token=phrase_token,
+        )
+
     async def createVendor(
         self, body: CreateVendorDto, phrase_token: Optional[str] = None
     ) -> VendorDto:
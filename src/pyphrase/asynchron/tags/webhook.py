@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
 
 if TYPE_CHECKING:
     from ..client import AsyncPhraseTMSClient
@@ -10,9 +10,11 @@ from ...models.phrase_models import (
     PageDtoWebhookCallDto,
     PageDtoWebHookDtoV2,
     ReplayRequestDto,
+    WebhookCallDto,
     WebHookDtoV2,
     WebhookPreviewsDto,
 )
+from ...pagination import apaginate_items
 
 
 class WebhookOperations:
@@ -62,6 +64,42 @@ class WebhookOperations:
 
         return PageDtoWebhookCallDto(**r)
 
+    def iter_getWebhookCallsList(
+        self,
+        parentUid: str = None,
+        webhookUid: str = None,
+        status: str = None,
+        events: List[str] = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[WebhookCallDto]:
+        """
+        Lists webhook calls, all pages
+
+        Yields the items of every page of getWebhookCallsList. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getWebhookCallsList except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of WebhookCallDto
+        """
+        return apaginate_items(
+            self.getWebhookCallsList,
+            pageSize,
+            concurrency,
+            prefetch,
+            parentUid=parentUid,
+            webhookUid=webhookUid,
+            status=status,
+            events=events,
+            phrase_token=phrase_token,
+        )
+
     async def replayWebhookCalls(
         self, body: ReplayRequestDto, phrase_token: Optional[str] = None
     ) -> None:
@@ -171,6 +209,50 @@ class WebhookOperations:
 
         return PageDtoWebHookDtoV2(**r)
 
+    def iter_getWebHookList_1(
+        self,
+        sortField: str = None,
+        modifiedBy: List[str] = None,
+        createdBy: List[str] = None,
+        events: List[str] = None,
+        url: str = None,
+        status: str = None,
+        name: str = None,
+        pageSize: int = 50,
+        sortTrend: str = "ASC",
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[WebHookDtoV2]:
+        """
+        Lists webhooks, all pages
+
+        Yields the items of every page of getWebHookList_1. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getWebHookList_1 except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of WebHookDtoV2
+        """
+        return apaginate_items(
+            self.getWebHookList_1,
+            pageSize,
+            concurrency,
+            prefetch,
+            sortField=sortField,
+            modifiedBy=modifiedBy,
+            createdBy=createdBy,
+            events=events,
+            url=url,
+            status=status,
+            name=name,
+            sortTrend=sortTrend,
+            phrase_token=phrase_token,
+        )
+
     async def createWebHook_1(
         self, body: CreateWebHookDto, phrase_token: Optional[str] = None
     ) -> WebHookDtoV2:
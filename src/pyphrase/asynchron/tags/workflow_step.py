@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
 if TYPE_CHECKING:
     from ..client import AsyncPhraseTMSClient
@@ -11,6 +11,7 @@ from ...models.phrase_models import (
     PageDtoWorkflowStepDto,
     WorkflowStepDto,
 )
+from ...pagination import apaginate_items
 
 
 class WorkflowStepOperations:
@@ -60,6 +61,42 @@ class WorkflowStepOperations:
 
         return PageDtoWorkflowStepDto(**r)
 
+    def iter_listWFSteps(
+        self,
+        abbr: str = None,
+        name: str = None,
+        pageSize: int = 50,
+        sort: str = "ID",
+        order: str = "ASC",
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncIterator[WorkflowStepDto]:
+        """
+        List workflow steps, all pages
+
+        Yields the items of every page of listWFSteps. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listWFSteps except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: AsyncIterator of WorkflowStepDto
+        """
+        return apaginate_items(
+            self.listWFSteps,
+            pageSize,
+            concurrency,
+            prefetch,
+            abbr=abbr,
+            name=name,
+            sort=sort,
+            order=order,
+            phrase_token=phrase_token,
+        )
+
     async def createWFStep(
         self, body: CreateWorkflowStepDto, phrase_token: Optional[str] = None
     ) -> WorkflowStepDto:
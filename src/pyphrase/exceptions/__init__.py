@@ -1,7 +1,25 @@
 from .exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
     NotAuthenticatedError,
     PhraseTMSClientException,
+    PhraseTMSException,
+    PhraseTmsServerError,
+    PhraseTmsTooManyRequestsError,
     UnableToAuthenticateError,
+    WaitTimeoutError,
+    exception_map,
 )
 
-__all__ = [UnableToAuthenticateError, PhraseTMSClientException, NotAuthenticatedError]
+__all__ = [
+    "UnableToAuthenticateError",
+    "PhraseTMSClientException",
+    "NotAuthenticatedError",
+    "PhraseTMSException",
+    "PhraseTmsTooManyRequestsError",
+    "PhraseTmsServerError",
+    "DeadlineExceededError",
+    "CircuitOpenError",
+    "WaitTimeoutError",
+    "exception_map",
+]
@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class PhraseTMSClientException(Exception):
     pass
 
@@ -8,3 +11,58 @@ class UnableToAuthenticateError(PhraseTMSClientException):
 
 class NotAuthenticatedError(PhraseTMSClientException):
     pass
+
+
+class DeadlineExceededError(PhraseTMSClientException):
+    pass
+
+
+class WaitTimeoutError(PhraseTMSClientException):
+    def __init__(
+        self,
+        msg: Optional[str] = None,
+        done: Optional[dict] = None,
+        pending: Optional[list] = None,
+    ):
+        super().__init__(msg)
+        self.done = done or {}
+        self.pending = pending or []
+
+
+class CircuitOpenError(PhraseTMSClientException):
+    def __init__(
+        self,
+        msg: Optional[str] = None,
+        family: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(msg)
+        self.family = family
+        self.retry_after = retry_after
+
+
+class PhraseTMSException(PhraseTMSClientException):
+    def __init__(
+        self,
+        msg: Optional[str] = None,
+        status_code: Optional[int] = None,
+        error_code: Optional[str] = None,
+        error_description: Optional[str] = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(msg)
+        self.status_code = status_code
+        self.error_code = error_code
+        self.error_description = error_description
+        self.retry_after = retry_after
+
+
+class PhraseTmsTooManyRequestsError(PhraseTMSException):
+    pass
+
+
+class PhraseTmsServerError(PhraseTMSException):
+    pass
+
+
+exception_map = {"TOO_MANY_REQUESTS": PhraseTmsTooManyRequestsError}
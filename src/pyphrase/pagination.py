@@ -0,0 +1,574 @@
+import asyncio
+import contextvars
+import itertools
+import math
+import queue
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional
+
+# Operation returning one page, called with pageNumber, pageSize and the filters of the caller
+PageOperation = Callable[..., Any]
+AsyncPageOperation = Callable[..., Awaitable[Any]]
+
+
+def page_items(page: Any, items: str = "content") -> List[Any]:
+    return getattr(page, items, None) or []
+
+
+def is_last_page(
+    page: Any, page_number: int, page_size: int, items: str = "content"
+) -> bool:
+    """
+    Whether there is no page after this one, judged by totalPages or totalCount if the page has them,
+    otherwise by a page that is not full
+    """
+    content = page_items(page, items)
+    if not content:
+        return True
+    total_pages = getattr(page, "totalPages", None)
+    if total_pages is not None:
+        return page_number + 1 >= total_pages
+    total_count = getattr(page, "totalCount", None)
+    if total_count is not None:
+        return (page_number + 1) * page_size >= total_count
+    return len(content) < page_size
+
+
+def total_pages(page: Any, page_size: int) -> Optional[int]:
+    """
+    Number of pages of the listing, from totalPages or totalCount of a page, None if the page has neither
+    """
+    total = getattr(page, "totalPages", None)
+    if total is not None:
+        return total
+    total_count = getattr(page, "totalCount", None)
+    if total_count is not None:
+        return math.ceil(total_count / page_size)
+    return None
+
+
+def iterate_pages(
+    operation: PageOperation,
+    page_size: int,
+    start_page: int = 0,
+    items: str = "content",
+    **kwargs,
+) -> Iterator[Any]:
+    """
+    Call a paginated operation page after page, the next page is fetched when the previous one has been used
+
+    :param operation: callable - operation taking pageNumber and pageSize, e.g. client.project.listProjects
+    :param page_size: int - items per page
+    :param start_page: int - first page number
+    :param items: string - attribute of the page holding its items
+    :param kwargs: further arguments of the operation
+    """
+    page_number = start_page
+    while True:
+        page = operation(pageNumber=page_number, pageSize=page_size, **kwargs)
+        yield page
+        if is_last_page(page, page_number, page_size, items):
+            return
+        page_number += 1
+
+
+def iterate_items(
+    operation: PageOperation,
+    page_size: int,
+    start_page: int = 0,
+    items: str = "content",
+    **kwargs,
+) -> Iterator[Any]:
+    """
+    Items of all pages of a paginated operation, only one page is held in memory at a time
+    """
+    for page in iterate_pages(operation, page_size, start_page, items, **kwargs):
+        yield from page_items(page, items)
+
+
+async def aiterate_pages(
+    operation: AsyncPageOperation,
+    page_size: int,
+    start_page: int = 0,
+    items: str = "content",
+    **kwargs,
+) -> AsyncIterator[Any]:
+    """
+    Async version of iterate_pages
+    """
+    page_number = start_page
+    while True:
+        page = await operation(pageNumber=page_number, pageSize=page_size, **kwargs)
+        yield page
+        if is_last_page(page, page_number, page_size, items):
+            return
+        page_number += 1
+
+
+async def aiterate_items(
+    operation: AsyncPageOperation,
+    page_size: int,
+    start_page: int = 0,
+    items: str = "content",
+    **kwargs,
+) -> AsyncIterator[Any]:
+    """
+    Async version of iterate_items
+    """
+    async for page in aiterate_pages(operation, page_size, start_page, items, **kwargs):
+        for item in page_items(page, items):
+            yield item
+
+
+def parallel_iterate_pages(
+    operation: PageOperation,
+    page_size: int,
+    workers: int = 8,
+    ordered: bool = True,
+    items: str = "content",
+    **kwargs,
+) -> Iterator[Any]:
+    """
+    Fetch the pages of a paginated operation from a thread pool. The first page tells the number of pages,
+    then up to `workers` of the remaining pages are in flight at a time, under the rate limiter of the client.
+    Falls back to fetching page after page if the operation does not report its totals.
+
+    :param operation: callable - operation taking pageNumber and pageSize, e.g. client.job.listPartsV2
+    :param page_size: int - items per page
+    :param workers: int - pages fetched at the same time
+    :param ordered: bool - yield pages in page order, otherwise as soon as they arrive
+    :param items: string - attribute of the page holding its items
+    :param kwargs: further arguments of the operation
+    """
+    first = operation(pageNumber=0, pageSize=page_size, **kwargs)
+    yield first
+    if is_last_page(first, 0, page_size, items):
+        return
+    pages = total_pages(first, page_size)
+    if pages is None:
+        yield from iterate_pages(operation, page_size, 1, items, **kwargs)
+        return
+
+    def submit(executor: ThreadPoolExecutor, page_number: int):
+        # Each page runs in a copy of the caller's context, so a deadline set around the loop applies
+        return executor.submit(
+            contextvars.copy_context().run,
+            operation,
+            pageNumber=page_number,
+            pageSize=page_size,
+            **kwargs,
+        )
+
+    page_numbers = iter(range(1, pages))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque(
+            submit(executor, page_number)
+            for page_number in _take(page_numbers, workers)
+        )
+        try:
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    done = [future for future in pending if future in finished]
+                    for future in done:
+                        pending.remove(future)
+                for future in done:
+                    page = future.result()
+                    for page_number in _take(page_numbers, 1):
+                        pending.append(submit(executor, page_number))
+                    yield page
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def parallel_iterate_items(
+    operation: PageOperation,
+    page_size: int,
+    workers: int = 8,
+    ordered: bool = True,
+    items: str = "content",
+    **kwargs,
+) -> Iterator[Any]:
+    """
+    Items of all pages of a paginated operation, fetched by parallel_iterate_pages
+    """
+    for page in parallel_iterate_pages(
+        operation, page_size, workers, ordered, items, **kwargs
+    ):
+        yield from page_items(page, items)
+
+
+async def aparallel_iterate_pages(
+    operation: AsyncPageOperation,
+    page_size: int,
+    concurrency: int = 8,
+    ordered: bool = True,
+    items: str = "content",
+    **kwargs,
+) -> AsyncIterator[Any]:
+    """
+    Async version of parallel_iterate_pages, up to `concurrency` pages are fetched by concurrent tasks
+    """
+    first = await operation(pageNumber=0, pageSize=page_size, **kwargs)
+    yield first
+    if is_last_page(first, 0, page_size, items):
+        return
+    pages = total_pages(first, page_size)
+    if pages is None:
+        async for page in aiterate_pages(operation, page_size, 1, items, **kwargs):
+            yield page
+        return
+
+    def submit(page_number: int) -> asyncio.Task:
+        return asyncio.ensure_future(
+            operation(pageNumber=page_number, pageSize=page_size, **kwargs)
+        )
+
+    page_numbers = iter(range(1, pages))
+    pending = deque(
+        submit(page_number) for page_number in _take(page_numbers, concurrency)
+    )
+    try:
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                finished, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                done = [task for task in pending if task in finished]
+                for task in done:
+                    pending.remove(task)
+            for task in done:
+                page = await task
+                for page_number in _take(page_numbers, 1):
+                    pending.append(submit(page_number))
+                yield page
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def aparallel_iterate_items(
+    operation: AsyncPageOperation,
+    page_size: int,
+    concurrency: int = 8,
+    ordered: bool = True,
+    items: str = "content",
+    **kwargs,
+) -> AsyncIterator[Any]:
+    """
+    Async version of parallel_iterate_items
+    """
+    async for page in aparallel_iterate_pages(
+        operation, page_size, concurrency, ordered, items, **kwargs
+    ):
+        for item in page_items(page, items):
+            yield item
+
+
+def prefetch_iterate_pages(
+    operation: PageOperation,
+    page_size: int,
+    prefetch: int = 2,
+    start_page: int = 0,
+    items: str = "content",
+    **kwargs,
+) -> Iterator[Any]:
+    """
+    Pages of a paginated operation, fetched by a helper thread while the caller works on the previous ones.
+    The thread waits once `prefetch` pages are ready and not yet taken.
+
+    :param prefetch: int - pages fetched ahead of the caller
+    """
+    buffer = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for page in iterate_pages(
+                operation, page_size, start_page, items, **kwargs
+            ):
+                if not put((page, None)):
+                    return
+        except Exception as e:
+            put((_DONE, e))
+            return
+        put((_DONE, None))
+
+    context = contextvars.copy_context()
+    producer = threading.Thread(
+        target=context.run, args=(produce,), name="pyphrase-prefetch", daemon=True
+    )
+    producer.start()
+    try:
+        while True:
+            page, error = buffer.get()
+            if error is not None:
+                raise error
+            if page is _DONE:
+                return
+            yield page
+    finally:
+        stop.set()
+
+
+def prefetch_iterate_items(
+    operation: PageOperation,
+    page_size: int,
+    prefetch: int = 2,
+    start_page: int = 0,
+    items: str = "content",
+    **kwargs,
+) -> Iterator[Any]:
+    """
+    Items of all pages of a paginated operation, fetched by prefetch_iterate_pages
+    """
+    for page in prefetch_iterate_pages(
+        operation, page_size, prefetch, start_page, items, **kwargs
+    ):
+        yield from page_items(page, items)
+
+
+async def aprefetch_iterate_pages(
+    operation: AsyncPageOperation,
+    page_size: int,
+    prefetch: int = 2,
+    start_page: int = 0,
+    items: str = "content",
+    **kwargs,
+) -> AsyncIterator[Any]:
+    """
+    Async version of prefetch_iterate_pages, the pages are fetched by a background task
+    """
+    buffer = asyncio.Queue(maxsize=prefetch)
+
+    async def produce() -> None:
+        try:
+            async for page in aiterate_pages(
+                operation, page_size, start_page, items, **kwargs
+            ):
+                await buffer.put((page, None))
+        except Exception as e:
+            await buffer.put((_DONE, e))
+            return
+        await buffer.put((_DONE, None))
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page, error = await buffer.get()
+            if error is not None:
+                raise error
+            if page is _DONE:
+                return
+            yield page
+    finally:
+        producer.cancel()
+
+
+async def aprefetch_iterate_items(
+    operation: AsyncPageOperation,
+    page_size: int,
+    prefetch: int = 2,
+    start_page: int = 0,
+    items: str = "content",
+    **kwargs,
+) -> AsyncIterator[Any]:
+    """
+    Async version of prefetch_iterate_items
+    """
+    async for page in aprefetch_iterate_pages(
+        operation, page_size, prefetch, start_page, items, **kwargs
+    ):
+        for item in page_items(page, items):
+            yield item
+
+
+def paginate_items(
+    operation: PageOperation,
+    page_size: int,
+    concurrency: int = 1,
+    prefetch: int = 0,
+    items: str = "content",
+    **kwargs,
+) -> Iterator[Any]:
+    """
+    Items of all pages as yielded by the iter_ methods of SyncPhraseTMSClient, e.g.
+    client.project.iter_listProjects(concurrency=4). Page after page by default, with concurrency above 1
+    by parallel_iterate_items, otherwise with prefetch above 0 by prefetch_iterate_items. Items come in
+    page order either way.
+
+    :param concurrency: int - pages fetched at the same time
+    :param prefetch: int - pages fetched ahead of the caller, used when concurrency is 1
+    """
+    if concurrency > 1:
+        return parallel_iterate_items(
+            operation, page_size, concurrency, items=items, **kwargs
+        )
+    if prefetch > 0:
+        return prefetch_iterate_items(
+            operation, page_size, prefetch, items=items, **kwargs
+        )
+    return iterate_items(operation, page_size, items=items, **kwargs)
+
+
+def apaginate_items(
+    operation: AsyncPageOperation,
+    page_size: int,
+    concurrency: int = 1,
+    prefetch: int = 0,
+    items: str = "content",
+    **kwargs,
+) -> AsyncIterator[Any]:
+    """
+    Async version of paginate_items, used by the iter_ methods of AsyncPhraseTMSClient
+    """
+    if concurrency > 1:
+        return aparallel_iterate_items(
+            operation, page_size, concurrency, items=items, **kwargs
+        )
+    if prefetch > 0:
+        return aprefetch_iterate_items(
+            operation, page_size, prefetch, items=items, **kwargs
+        )
+    return aiterate_items(operation, page_size, items=items, **kwargs)
+
+
+def iterate_windows(
+    operation: PageOperation,
+    window_size: int,
+    concurrency: int = 1,
+    begin_index: int = 0,
+    items: str = "segments",
+    **kwargs,
+) -> Iterator[Any]:
+    """
+    Call an operation taking beginIndex and endIndex, e.g. client.job.listSegments, window after window until a
+    window comes back short. With concurrency above 1 the next windows are fetched ahead from a thread pool,
+    windows are still yielded in order.
+
+    :param window_size: int - items per window, the range [beginIndex, endIndex) of one call
+    :param concurrency: int - windows fetched at the same time
+    :param begin_index: int - index of the first item
+    :param items: string - attribute of the response holding its items
+    """
+
+    def fetch(begin: int):
+        return operation(beginIndex=begin, endIndex=begin + window_size, **kwargs)
+
+    begins = itertools.count(begin_index, window_size)
+    if concurrency <= 1:
+        for begin in begins:
+            window = fetch(begin)
+            yield window
+            if len(page_items(window, items)) < window_size:
+                return
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = deque(
+            executor.submit(contextvars.copy_context().run, fetch, begin)
+            for begin in _take(begins, concurrency)
+        )
+        try:
+            while pending:
+                window = pending.popleft().result()
+                if len(page_items(window, items)) < window_size:
+                    yield window
+                    return
+                pending.append(
+                    executor.submit(contextvars.copy_context().run, fetch, next(begins))
+                )
+                yield window
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def iterate_window_items(
+    operation: PageOperation,
+    window_size: int,
+    concurrency: int = 1,
+    begin_index: int = 0,
+    items: str = "segments",
+    **kwargs,
+) -> Iterator[Any]:
+    """
+    Items of all windows fetched by iterate_windows, only `concurrency` windows are held in memory at a time
+    """
+    for window in iterate_windows(
+        operation, window_size, concurrency, begin_index, items, **kwargs
+    ):
+        yield from page_items(window, items)
+
+
+async def aiterate_windows(
+    operation: AsyncPageOperation,
+    window_size: int,
+    concurrency: int = 1,
+    begin_index: int = 0,
+    items: str = "segments",
+    **kwargs,
+) -> AsyncIterator[Any]:
+    """
+    Async version of iterate_windows, windows ahead are fetched by concurrent tasks
+    """
+
+    def fetch(begin: int) -> asyncio.Task:
+        return asyncio.ensure_future(
+            operation(beginIndex=begin, endIndex=begin + window_size, **kwargs)
+        )
+
+    begins = itertools.count(begin_index, window_size)
+    pending = deque(fetch(begin) for begin in _take(begins, max(1, concurrency)))
+    try:
+        while pending:
+            window = await pending.popleft()
+            if len(page_items(window, items)) < window_size:
+                yield window
+                return
+            pending.append(fetch(next(begins)))
+            yield window
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def aiterate_window_items(
+    operation: AsyncPageOperation,
+    window_size: int,
+    concurrency: int = 1,
+    begin_index: int = 0,
+    items: str = "segments",
+    **kwargs,
+) -> AsyncIterator[Any]:
+    """
+    Async version of iterate_window_items
+    """
+    async for window in aiterate_windows(
+        operation, window_size, concurrency, begin_index, items, **kwargs
+    ):
+        for item in page_items(window, items):
+            yield item
+
+
+# Marks the end of the pages handed over by a prefetching producer
+_DONE = object()
+
+
+def _take(iterator: Iterator[int], n: int) -> List[int]:
+    return [number for _, number in zip(range(n), iterator)]
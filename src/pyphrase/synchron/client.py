@@ -1,12 +1,68 @@
 import logging
-from json import JSONDecodeError
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Union,
+)
 
 import httpx
-from httpx import HTTPStatusError
 
-from ..exceptions import NotAuthenticatedError, UnableToAuthenticateError
+from ..exceptions import UnableToAuthenticateError
 from ..models import MemsourceAuthTokenModel
+from ..models.phrase_models import AsyncRequestDto, BackgroundTasksTbDto, LoginUserDto
+from ..transport import (
+    AuthMiddleware,
+    CacheMiddleware,
+    CircuitBreakerMiddleware,
+    CoalescingMiddleware,
+    CompressionMiddleware,
+    MetricsMiddleware,
+    Middleware,
+    Pipeline,
+    RateLimiter,
+    RateLimitMiddleware,
+    RequestContext,
+    RetryMiddleware,
+    RetryPolicy,
+    TimeoutMiddleware,
+    TimeoutPolicy,
+    deadline_context,
+    exception_from_response,
+)
+from ..transport.endpoints import (
+    MEMSOURCE_BASE_URL,
+    PROBE_PATH,
+    fastest_endpoint,
+    probe_endpoints,
+)
+from ..transport.pipeline import (
+    DEFAULT_TIMEOUT,
+    DOWNLOAD_TIMEOUT,
+    payload_to_dict,
+    response_json,
+)
+from ..transport.streaming import (
+    DEFAULT_CHUNK_SIZE,
+    DownloadDestination,
+    ProgressCallback,
+    UploadBody,
+    content_length,
+    open_destination,
+)
+from ..transport.timeouts import Deadline, TimeoutValue
+from ..waiters import (
+    BackgroundTask,
+    BackgroundTaskProgress,
+    PollingPolicy,
+    SyncAsyncRequestWaiter,
+    SyncBackgroundTaskWaiter,
+)
 from .tags import (
     AdditionalWorkflowStepOperations,
     AnalysisOperations,
@@ -55,24 +111,20 @@ from .tags import (
     XmlAssistantOperations,
 )
 
-MEMSOURCE_BASE_URL = "https://cloud.memsource.com/web"
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
 
 logger = logging.getLogger(__name__)
 
 
-class PhraseTMSException(Exception):
-    pass
-
-
-class PhraseTmsTooManyRequestsError(PhraseTMSException):
-    pass
-
-
-exception_map = {"TOO_MANY_REQUESTS": PhraseTmsTooManyRequestsError}
-
-
-def sync_get_phrase_tms_token(user: str, pw: str) -> MemsourceAuthTokenModel:
-    url = f"{MEMSOURCE_BASE_URL}/api2/v1/auth/login"
+def sync_get_phrase_tms_token(
+    user: str, pw: str, base_url: str = MEMSOURCE_BASE_URL
+) -> MemsourceAuthTokenModel:
+    """
+    :param base_url: string (optional) - data center or gateway to log in at, use the base_url of the client
+    """
+    url = f"{base_url}/api2/v1/auth/login"
     payload = {"userName": user, "password": pw}
     _r = httpx.post(url, json=payload)
     r = _r.json()
@@ -90,8 +142,88 @@ def sync_get_phrase_tms_token(user: str, pw: str) -> MemsourceAuthTokenModel:
 
 
 class SyncPhraseTMSClient:
-    def __init__(self, token: Optional[str] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        endpoints: Sequence[str] = (),
+        probe: bool = False,
+        limits: Optional[httpx.Limits] = None,
+        http_client: Optional[httpx.Client] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[CacheMiddleware] = None,
+        coalescing: Optional[CoalescingMiddleware] = None,
+        compression: Optional[CompressionMiddleware] = None,
+        circuit_breaker: Optional[CircuitBreakerMiddleware] = None,
+        timeouts: Optional[TimeoutPolicy] = None,
+        polling: Optional[PollingPolicy] = None,
+        middlewares: Sequence[Middleware] = (),
+    ):
+        """
+        :param token: string (optional) - default token used when an operation is called without one
+        :param base_url: string (optional) - data center or gateway to send calls to, defaults to MEMSOURCE_BASE_URL.
+            See PHRASE_TMS_ENDPOINTS for the data centers
+        :param endpoints: list of strings (optional) - further base URLs that select_endpoint may switch to
+        :param probe: bool (optional) - measure the round trip time of base_url and endpoints on creation and use
+            the fastest reachable one
+        :param limits: httpx.Limits (optional) - connection pool limits and keep-alive expiry,
+            defaults to DEFAULT_POOL_LIMITS
+        :param http_client: httpx.Client (optional) - existing client to send requests with,
+            it is not closed by this client
+        :param transport: httpx.BaseTransport (optional) - transport for the pooled client,
+            ignored when http_client is supplied
+        :param retry_policy: RetryPolicy (optional) - when failed calls are retried, defaults to RetryPolicy().
+            Use RetryPolicy.disabled() to raise on the first failure
+        :param rate_limiter: RateLimiter (optional) - paces requests before they are sent,
+            can be shared between clients
+        :param cache: CacheMiddleware (optional) - reuse successful GET responses for a while
+        :param coalescing: CoalescingMiddleware (optional) - share one call among identical GETs in flight
+        :param compression: CompressionMiddleware (optional) - negotiate compressed responses and compress
+            large request bodies
+        :param circuit_breaker: CircuitBreakerMiddleware (optional) - fail fast on endpoint families
+            that keep failing
+        :param timeouts: TimeoutPolicy (optional) - connect/read/write/pool timeout profiles per endpoint family,
+            defaults to TimeoutPolicy()
+        :param polling: PollingPolicy (optional) - how often wait_for checks on async requests,
+            defaults to PollingPolicy()
+        :param middlewares: list of Middleware (optional) - added to the end of the pipeline,
+            right before the request is sent
+        """
         self.token = token
+        self.base_url = (base_url or MEMSOURCE_BASE_URL).rstrip("/")
+        self.endpoints = list(endpoints)
+        self.endpoint_rtts = {}
+        self.probe = probe
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.timeouts = timeouts or TimeoutPolicy()
+        self.async_request_waiter = SyncAsyncRequestWaiter(self, polling)
+        self.background_task_waiter = SyncBackgroundTaskWaiter(self)
+        self.metrics = MetricsMiddleware()
+        self.pipeline = Pipeline(
+            [
+                AuthMiddleware(),
+                cache,
+                coalescing,
+                compression,
+                RetryMiddleware(self.retry_policy),
+                circuit_breaker,
+                rate_limiter and RateLimitMiddleware(rate_limiter),
+                TimeoutMiddleware(self.timeouts),
+                self.metrics,
+                *middlewares,
+            ]
+        )
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            http_client = httpx.Client(
+                limits=limits or DEFAULT_POOL_LIMITS, transport=transport
+            )
+        self.http_client = http_client
+        if probe:
+            self.select_endpoint()
         self.additional_workflow_step = AdditionalWorkflowStepOperations(self)
         self.analysis = AnalysisOperations(self)
         self.async_request = AsyncRequestOperations(self)
@@ -138,45 +270,264 @@ class SyncPhraseTMSClient:
         self.workflow_changes = WorkflowChangesOperations(self)
         self.provider = ProviderOperations(self)
 
-    def get_bytestream(
+    def select_endpoint(self, attempts: int = 3) -> str:
+        """
+        Measure the round trip time of base_url and endpoints and switch to the fastest reachable one.
+        Keeps base_url if none is reachable. The measurements are kept in endpoint_rtts.
+        """
+        candidates = list(dict.fromkeys([self.base_url, *self.endpoints]))
+        self.endpoint_rtts = probe_endpoints(self.http_client, candidates, attempts)
+        fastest = fastest_endpoint(self.endpoint_rtts)
+        if fastest is None:
+            logger.warning(f"No endpoint reachable, keeping {self.base_url}")
+        else:
+            logger.info(f"Using {fastest}, round trip times: {self.endpoint_rtts}")
+            self.base_url = fastest
+        return self.base_url
+
+    def warmup(
+        self,
+        connections: int = 1,
+        validate_token: bool = False,
+        phrase_token: Optional[str] = None,
+        timeout: float = 10.0,
+    ) -> Optional[LoginUserDto]:
+        """
+        Open pooled connections to base_url ahead of time, so that the first calls do not pay for DNS,
+        TCP and TLS. The connections are opened from parallel threads.
+
+        :param connections: int - connections to open at the same time, at most the keep-alive limit of the pool
+        :param validate_token: bool - check the token with whoAmI and return the user, raises if it is not valid
+        :param phrase_token: string (optional) - token to validate, defaults to the token of the client
+        :param timeout: float - seconds for each warm-up request
+        """
+        url = f"{self.base_url}{PROBE_PATH}"
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            list(
+                executor.map(
+                    lambda _: self.http_client.get(url, timeout=timeout),
+                    range(connections),
+                )
+            )
+        if validate_token:
+            return self.authentication.whoAmI(phrase_token)
+        return None
+
+    def __enter__(self) -> "SyncPhraseTMSClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the pooled connections, unless the http client was supplied by the caller
+        """
+        if self._owns_http_client:
+            self.http_client.close()
+
+    def wait_for(
         self,
+        requests: Iterable[Any],
+        timeout: Optional[float] = None,
+        phrase_token: Optional[str] = None,
+    ) -> Dict[str, AsyncRequestDto]:
+        """
+        Wait until all async requests are done, e.g. those returned by createJob or preTranslateV3.
+        Many requests are resolved with a scan of listPendingRequests instead of one getAsyncRequest each.
+
+        :param requests: list of async request ids, or objects with an id such as AsyncRequestReference
+        :param timeout: float (optional) - seconds to wait at most, raises WaitTimeoutError after that
+
+        :return: dict of async request id to its finished AsyncRequestDto
+        """
+        return self.async_request_waiter.wait_for(requests, timeout, phrase_token)
+
+    def wait_for_background_tasks(
+        self,
+        tasks: Iterable[BackgroundTask],
+        timeout: Optional[float] = None,
+        progress: Optional[BackgroundTaskProgress] = None,
+        phrase_token: Optional[str] = None,
+    ) -> Dict[str, BackgroundTasksTbDto]:
+        """
+        Wait until the imports and clears of translation memories and term bases are done, e.g. after
+        importTransMemoryV2 or clearTermBase. See BackgroundTask for how to describe them.
+
+        :param tasks: list of BackgroundTask, e.g. BackgroundTask.trans_memory(uid, async_request)
+        :param timeout: float (optional) - seconds to wait at most, raises WaitTimeoutError after that
+        :param progress: callable (optional) - called after every check with the tasks done and their number
+
+        :return: dict of memory or term base uid to its last background task
+        """
+        return self.background_task_waiter.wait_for(
+            tasks, timeout, progress, phrase_token
+        )
+
+    def deadline(self, seconds: float) -> ContextManager[Deadline]:
+        """
+        Context manager limiting all calls inside it, with their retries, to `seconds` in total,
+        e.g. with client.deadline(5): ... Raises DeadlineExceededError when the time is up.
+        """
+        return deadline_context(seconds)
+
+    def request(
+        self,
+        method: str,
         path: str,
         phrase_token: Optional[str] = None,
         params: Optional[dict] = None,
         payload: Optional[Any] = None,
         files: Optional[Any] = None,
         headers: Optional[dict] = None,
-        content: Optional[bytes] = None,
-    ) -> bytes:
-        token = phrase_token or self.token
-        if token is None:
-            raise NotAuthenticatedError
-
-        if params is None:
-            params = {}
-
-        url = f"{MEMSOURCE_BASE_URL}{path}"
-        header = {"Authorization": token}
-        if headers is not None:
-            header.update(headers)
-        logger.info(url, params)
-        r = httpx.get(url, params=params, headers=header, timeout=60.0)
+        content: Optional[Union[bytes, UploadBody]] = None,
+        timeout: TimeoutValue = DEFAULT_TIMEOUT,
+        stream: bool = False,
+        exclude_none: bool = False,
+    ) -> httpx.Response:
+        """
+        Send a call through the middleware pipeline. All verb methods use this.
+
+        :param method: string (required) - HTTP method
+        :param path: string (required) - endpoint path, e.g. /api2/v1/projects/{projectUid}
+        :param payload: dict or pydantic model (optional) - JSON body
+        :param timeout: TimeoutValue - name of a profile of the client's TimeoutPolicy, seconds or httpx.Timeout
+        :param stream: bool - leave the body unread, the caller must close the response
+        :param exclude_none: bool - leave fields that are None out of a pydantic payload
+        :raises PhraseTMSException: for error responses left after retries
+        """
+        context = RequestContext(
+            method,
+            path,
+            f"{self.base_url}{path}",
+            token=phrase_token or self.token,
+            params=params,
+            headers=headers,
+            json=payload_to_dict(payload, exclude_none=exclude_none),
+            content=content,
+            files=files,
+            timeout=timeout,
+            stream=stream,
+        )
+        logger.info(context.url)
+        response = self.pipeline.send(context, self._send)
+        if response.is_error:
+            if stream:
+                response.read()
+                response.close()
+            logger.error(f"Call failed: {response} // {context.url} - {context.params}")
+            raise exception_from_response(response)
+        return response
+
+    def _send(self, context: RequestContext) -> httpx.Response:
+        request = self.http_client.build_request(
+            context.method, context.url, **context.request_kwargs()
+        )
+        return self.http_client.send(request, stream=context.stream)
 
+    def _iter_response(
+        self,
+        response: httpx.Response,
+        progress: Optional[ProgressCallback] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        total = content_length(response)
+        received = 0
         try:
-            r.raise_for_status()
-        except HTTPStatusError as exc:
-            try:
-                loaded_errors = r.json()
-                error_code = loaded_errors.get("errorCode")
-                error_detail = loaded_errors.get("errorDescription")
-                msg = f"Call failed: {url=}, {params=}, {r.status_code=}, {error_code=}, {error_detail=}"
-                raise PhraseTMSException(msg)
-            except:
-                logger.exception(f"Call failed: {r} // {url} - {params}")
-                raise Exception from exc
+            for chunk in response.iter_bytes(chunk_size):
+                received += len(chunk)
+                if progress is not None:
+                    progress(received, total)
+                yield chunk
+        finally:
+            response.close()
+
+    def _write_response(
+        self,
+        response: httpx.Response,
+        destination: DownloadDestination,
+        progress: Optional[ProgressCallback] = None,
+    ) -> int:
+        written = 0
+        with open_destination(destination) as f:
+            for chunk in self._iter_response(response, progress):
+                f.write(chunk)
+                written += len(chunk)
+        return written
+
+    def iter_bytestream(
+        self,
+        path: str,
+        phrase_token: Optional[str] = None,
+        params: Optional[dict] = None,
+        payload: Optional[Any] = None,
+        headers: Optional[dict] = None,
+        method: str = "GET",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Iterator[bytes]:
+        """
+        Stream the body of a file download in chunks, without holding the whole file in memory
+
+        :param path: string (required) - endpoint path, e.g. /api2/v1/projects/{projectUid}/jobs/{jobUid}/original
+        :param method: string - GET, or POST for downloads that take a body
+        :param chunk_size: int - size of the yielded chunks in bytes
+        :param progress: callable (optional) - called with bytes received so far and total bytes, if known
+        """
+        r = self.request(
+            method,
+            path,
+            phrase_token,
+            params=params,
+            payload=payload,
+            headers=headers,
+            timeout=DOWNLOAD_TIMEOUT,
+            stream=True,
+        )
+        for chunk in self._iter_response(r, progress, chunk_size):
+            yield chunk
 
+    def _bytestream(
+        self,
+        method: str,
+        path: str,
+        destination: Optional[DownloadDestination],
+        progress: Optional[ProgressCallback],
+        **kwargs,
+    ) -> Union[bytes, int]:
+        r = self.request(
+            method,
+            path,
+            timeout=DOWNLOAD_TIMEOUT,
+            stream=destination is not None,
+            **kwargs,
+        )
+        if destination is not None:
+            return self._write_response(r, destination, progress)
         return r.content
 
+    def get_bytestream(
+        self,
+        path: str,
+        phrase_token: Optional[str] = None,
+        params: Optional[dict] = None,
+        payload: Optional[Any] = None,
+        files: Optional[Any] = None,
+        headers: Optional[dict] = None,
+        content: Optional[Union[bytes, UploadBody]] = None,
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
+        return self._bytestream(
+            "GET",
+            path,
+            destination,
+            progress,
+            phrase_token=phrase_token,
+            params=params,
+            headers=headers,
+        )
+
     def post_bytestream(
         self,
         path: str,
@@ -185,46 +536,23 @@ class SyncPhraseTMSClient:
         payload: Optional[Any] = None,
         files: Optional[Any] = None,
         headers: Optional[dict] = None,
-        content: Optional[bytes] = None,
-    ) -> bytes:
-        token = phrase_token or self.token
-        if token is None:
-            raise NotAuthenticatedError
-
-        if params is None:
-            params = {}
-
-        url = f"{MEMSOURCE_BASE_URL}{path}"
-        header = {"Authorization": token}
-        if headers is not None:
-            header.update(headers)
-
-        if payload is not None and type(payload) != dict:
-            try:
-                payload = payload.dict()
-            except Exception as e:
-                logger.exception(f"Payload could not be cast as dict: {e}")
-                raise Exception from e
-
-        logger.info(url, params)
-        r = httpx.post(
-            url,
-            json=payload,
-            headers=header,
+        content: Optional[Union[bytes, UploadBody]] = None,
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
+        return self._bytestream(
+            "POST",
+            path,
+            destination,
+            progress,
+            phrase_token=phrase_token,
             params=params,
+            payload=payload,
             files=files,
+            headers=headers,
             content=content,
-            timeout=30.0,
         )
 
-        try:
-            r.raise_for_status()
-        except HTTPStatusError as exc:
-            logger.exception(f"Call failed: {r.content} // {url} - {params}")
-            raise Exception from exc
-
-        return r.content
-
     def get(
         self,
         path: str,
@@ -233,41 +561,19 @@ class SyncPhraseTMSClient:
         payload: Optional[Any] = None,
         files: Optional[Any] = None,
         headers: Optional[dict] = None,
-        content: Optional[bytes] = None,
+        content: Optional[Union[bytes, UploadBody]] = None,
     ) -> dict | None:
-        token = phrase_token or self.token
-        if token is None:
-            raise NotAuthenticatedError
-
-        if params is None:
-            params = {}
-        params = {k: v for k, v in params.items() if v is not None}
-
-        url = f"{MEMSOURCE_BASE_URL}{path}"
-        header = {"Authorization": token}
-        if headers is not None:
-            header.update(headers)
-
-        logger.info(url)
-        resp = httpx.get(url, params=params, headers=header, timeout=30.0)
-        try:
-            resp.raise_for_status()
-        except HTTPStatusError as exc:
-            try:
-                loaded_errors = resp.json()
-                error_code = loaded_errors.get("errorCode")
-                error_detail = loaded_errors.get("errorDescription")
-
-                msg = f"Call failed: {url=}, {params=}, {resp.status_code=}, {error_code=}, {error_detail=}"
-                raise PhraseTMSException(msg)
-            except:
-                logger.exception(f"Call failed: {resp} // {url} - {params}")
-                raise Exception from exc
-
-        try:
-            return resp.json()
-        except JSONDecodeError:
-            return
+        r = self.request(
+            "GET",
+            path,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            headers=headers,
+            content=content,
+        )
+        return response_json(r)
 
     def post(
         self,
@@ -277,57 +583,20 @@ class SyncPhraseTMSClient:
         payload: Optional[Any] = None,
         files: Optional[Any] = None,
         headers: Optional[dict] = None,
-        content: Optional[bytes] = None,
+        content: Optional[Union[bytes, UploadBody]] = None,
     ) -> dict | None:
-        token = phrase_token or self.token
-        if token is None:
-            raise NotAuthenticatedError
-
-        url = f"{MEMSOURCE_BASE_URL}{path}"
-        header = {"Authorization": token}
-        if headers is not None:
-            header.update(headers)
-
-        if payload is not None and type(payload) != dict:
-            try:
-                payload = payload.dict(exclude_none=True)
-            except Exception as e:
-                logger.exception(f"Payload could not be cast as dict: {e}")
-                raise Exception from e
-        r = httpx.post(
-            url,
-            json=payload,
-            headers=header,
+        r = self.request(
+            "POST",
+            path,
+            phrase_token,
             params=params,
+            payload=payload,
             files=files,
+            headers=headers,
             content=content,
-            timeout=30.0,
+            exclude_none=True,
         )
-
-        try:
-            r.raise_for_status()
-        except HTTPStatusError as exc:
-            try:
-                loaded_errors = r.json()
-                error_code = loaded_errors.get("errorCode")
-                error_detail = loaded_errors.get("errorDescription")
-                msg = f"Call failed: {r.request.method=}, {url=}, {params=}, {r.status_code=}, {error_code=}, {error_detail=}"
-            except:
-                error_code = None
-                msg = None
-
-            if msg:
-                specific_exception = exception_map.get(error_code, PhraseTMSException)
-                raise specific_exception(msg)
-
-            else:
-                logger.exception(f"Call failed: {r} // {url} - {params}")
-                raise Exception from exc
-
-        try:
-            return r.json()
-        except JSONDecodeError:
-            return
+        return response_json(r)
 
     def put(
         self,
@@ -337,50 +606,19 @@ class SyncPhraseTMSClient:
         payload: Optional[Any] = None,
         files: Optional[Any] = None,
         headers: Optional[dict] = None,
-        content: Optional[bytes] = None,
+        content: Optional[Union[bytes, UploadBody]] = None,
     ) -> dict | None:
-        token = phrase_token or self.token
-        if token is None:
-            raise NotAuthenticatedError
-
-        url = f"{MEMSOURCE_BASE_URL}{path}"
-        header = {"Authorization": token}
-        if headers is not None:
-            header.update(headers)
-        if payload is not None and type(payload) != dict:
-            try:
-                payload = payload.dict()
-            except Exception as e:
-                logger.exception(f"Payload could not be cast as dict: {e}")
-                raise Exception from e
-
-        r = httpx.put(
-            url,
-            json=payload,
-            headers=header,
+        r = self.request(
+            "PUT",
+            path,
+            phrase_token,
             params=params,
+            payload=payload,
             files=files,
+            headers=headers,
             content=content,
-            timeout=30.0,
         )
-
-        try:
-            r.raise_for_status()
-        except HTTPStatusError as exc:
-            try:
-                loaded_errors = r.json()
-                error_code = loaded_errors.get("errorCode")
-                error_detail = loaded_errors.get("errorDescription")
-                msg = f"Call failed: {url=}, {params=}, {r.status_code=}, {error_code=}, {error_detail=}"
-                raise PhraseTMSException(msg)
-            except:
-                logger.exception(f"Call failed: {r} // {url} - {params}")
-                raise Exception from exc
-
-        try:
-            return r.json()
-        except JSONDecodeError:
-            return
+        return response_json(r)
 
     def patch(
         self,
@@ -390,50 +628,19 @@ class SyncPhraseTMSClient:
         payload: Optional[Any] = None,
         files: Optional[Any] = None,
         headers: Optional[dict] = None,
-        content: Optional[bytes] = None,
+        content: Optional[Union[bytes, UploadBody]] = None,
     ) -> dict | None:
-        token = phrase_token or self.token
-        if token is None:
-            raise NotAuthenticatedError
-
-        url = f"{MEMSOURCE_BASE_URL}{path}"
-        header = {"Authorization": token}
-        if headers is not None:
-            header.update(headers)
-        if payload is not None and type(payload) != dict:
-            try:
-                payload = payload.dict()
-            except Exception as e:
-                logger.exception(f"Payload could not be cast as dict: {e}")
-                raise Exception from e
-
-        r = httpx.patch(
-            url,
-            json=payload,
-            headers=header,
+        r = self.request(
+            "PATCH",
+            path,
+            phrase_token,
             params=params,
+            payload=payload,
             files=files,
+            headers=headers,
             content=content,
-            timeout=30.0,
         )
-
-        try:
-            r.raise_for_status()
-        except HTTPStatusError as exc:
-            try:
-                loaded_errors = r.json()
-                error_code = loaded_errors.get("errorCode")
-                error_detail = loaded_errors.get("errorDescription")
-                msg = f"Call failed: {url=}, {params=}, {r.status_code=}, {error_code=}, {error_detail=}"
-                raise PhraseTMSException(msg)
-            except:
-                logger.exception(f"Call failed: {r} // {url} - {params}")
-                raise Exception from exc
-
-        try:
-            return r.json()
-        except JSONDecodeError:
-            return
+        return response_json(r)
 
     def delete(
         self,
@@ -443,33 +650,16 @@ class SyncPhraseTMSClient:
         payload: Optional[Any] = None,
         files: Optional[Any] = None,
         headers: Optional[dict] = None,
-        content: Optional[bytes] = None,
+        content: Optional[Union[bytes, UploadBody]] = None,
     ) -> dict | None:
-        token = phrase_token or self.token
-        if token is None:
-            raise NotAuthenticatedError
-
-        url = f"{MEMSOURCE_BASE_URL}{path}"
-        header = {"Authorization": token}
-        if headers is not None:
-            header.update(headers)
-
-        r = httpx.delete(url, headers=header, params=params, timeout=30.0)
-
-        try:
-            r.raise_for_status()
-        except HTTPStatusError as exc:
-            try:
-                loaded_errors = r.json()
-                error_code = loaded_errors.get("errorCode")
-                error_detail = loaded_errors.get("errorDescription")
-                msg = f"Call failed: {url=}, {params=}, {r.status_code=}, {error_code=}, {error_detail=}"
-                raise PhraseTMSException(msg)
-            except:
-                logger.exception(f"Call failed: {r} // {url} - {params}")
-                raise Exception from exc
-
-        try:
-            return r.json()
-        except JSONDecodeError:
-            return
+        r = self.request(
+            "DELETE",
+            path,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            headers=headers,
+            content=content,
+        )
+        return response_json(r)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional, Union
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
@@ -10,6 +10,7 @@ from ...models.phrase_models import (
     AnalyseLanguagePartDto,
     AnalyseRecalculateRequestDto,
     AnalyseRecalculateResponseDto,
+    AnalyseReference,
     AnalysesV2Dto,
     AnalyseV2Dto,
     AnalyseV3Dto,
@@ -23,6 +24,8 @@ from ...models.phrase_models import (
     PageDtoAnalyseJobDto,
     PageDtoAnalyseReference,
 )
+from ...pagination import paginate_items
+from ...transport.streaming import DownloadDestination, ProgressCallback
 
 
 class AnalysisOperations:
@@ -221,6 +224,38 @@ class AnalysisOperations:
 
         return PageDtoAnalyseJobDto(**r)
 
+    def iter_listJobParts(
+        self,
+        analyseLanguagePartId: int,
+        analyseUid: str,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[AnalyseJobDto]:
+        """
+        List jobs of analyses, all pages
+
+        Yields the items of every page of listJobParts. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listJobParts except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of AnalyseJobDto
+        """
+        return paginate_items(
+            self.listJobParts,
+            pageSize,
+            concurrency,
+            prefetch,
+            analyseLanguagePartId=analyseLanguagePartId,
+            analyseUid=analyseUid,
+            phrase_token=phrase_token,
+        )
+
     def getJobPartAnalyse(
         self,
         jobUid: str,
@@ -250,8 +285,13 @@ class AnalysisOperations:
         return AnalyseJobDto(**r)
 
     def downloadAnalyse(
-        self, analyseUid: str, format: str, phrase_token: Optional[str] = None
-    ) -> bytes:
+        self,
+        analyseUid: str,
+        format: str,
+        phrase_token: Optional[str] = None,
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
         Download analysis
 
@@ -259,6 +299,9 @@ class AnalysisOperations:
         :param format: string (required), query.
 
         :param phrase_token: string (optional) - if not supplied, client will look token from init
+        :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+            the number of bytes written is returned
+        :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
         :return: None
         """
@@ -269,7 +312,13 @@ class AnalysisOperations:
         payload = None
 
         r = self.client.get_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
@@ -432,3 +481,35 @@ class AnalysisOperations:
         )
 
         return PageDtoAnalyseReference(**r)
+
+    def iter_listPartAnalyseV3(
+        self,
+        jobUid: str,
+        projectUid: str,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[AnalyseReference]:
+        """
+        List analyses, all pages
+
+        Yields the items of every page of listPartAnalyseV3. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listPartAnalyseV3 except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of AnalyseReference
+        """
+        return paginate_items(
+            self.listPartAnalyseV3,
+            pageSize,
+            concurrency,
+            prefetch,
+            jobUid=jobUid,
+            projectUid=projectUid,
+            phrase_token=phrase_token,
+        )
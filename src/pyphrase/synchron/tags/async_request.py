@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
@@ -10,6 +10,7 @@ from ...models.phrase_models import (
     AsyncRequestStatusDto,
     PageDtoAsyncRequestDto,
 )
+from ...pagination import paginate_items
 
 
 class AsyncRequestOperations:
@@ -95,6 +96,36 @@ class AsyncRequestOperations:
 
         return PageDtoAsyncRequestDto(**r)
 
+    def iter_listPendingRequests(
+        self,
+        all: bool = "False",
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[AsyncRequestDto]:
+        """
+        List pending requests, all pages
+
+        Yields the items of every page of listPendingRequests. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listPendingRequests except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of AsyncRequestDto
+        """
+        return paginate_items(
+            self.listPendingRequests,
+            pageSize,
+            concurrency,
+            prefetch,
+            all=all,
+            phrase_token=phrase_token,
+        )
+
     def getCurrentLimitStatus(
         self,
         phrase_token: Optional[str] = None,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
@@ -11,6 +11,7 @@ from ...models.phrase_models import (
     ProjectJobPartsDto,
     UploadBilingualFileRequestDto,
 )
+from ...transport.streaming import DownloadDestination, ProgressCallback
 
 
 class BilingualFileOperations:
@@ -18,8 +19,14 @@ class BilingualFileOperations:
         self.client = client
 
     def convertBilingualFile(
-        self, body: InputStream, to: str, frm: str, phrase_token: Optional[str] = None
-    ) -> bytes:
+        self,
+        body: InputStream,
+        to: str,
+        frm: str,
+        phrase_token: Optional[str] = None,
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
         Convert bilingual file
 
@@ -28,6 +35,9 @@ class BilingualFileOperations:
         :param frm: string (required), query.
 
         :param phrase_token: string (optional) - if not supplied, client will look token from init
+        :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+            the number of bytes written is returned
+        :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
         :return: None
         """
@@ -38,7 +48,13 @@ class BilingualFileOperations:
         payload = body
 
         r = self.client.post_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
@@ -72,14 +88,21 @@ class BilingualFileOperations:
         return ComparedSegmentsDto(**r)
 
     def getPreviewFile(
-        self, body: InputStream, phrase_token: Optional[str] = None
-    ) -> bytes:
+        self,
+        body: InputStream,
+        phrase_token: Optional[str] = None,
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
         Download preview
         Supports mxliff format
         :param body: InputStream (required), body.
 
         :param phrase_token: string (optional) - if not supplied, client will look token from init
+        :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+            the number of bytes written is returned
+        :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
         :return: None
         """
@@ -90,7 +113,13 @@ class BilingualFileOperations:
         payload = body
 
         r = self.client.post_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
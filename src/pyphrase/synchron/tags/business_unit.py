@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
@@ -10,6 +10,7 @@ from ...models.phrase_models import (
     BusinessUnitEditDto,
     PageDtoBusinessUnitDto,
 )
+from ...pagination import paginate_items
 
 
 class BusinessUnitOperations:
@@ -139,6 +140,42 @@ class BusinessUnitOperations:
 
         return PageDtoBusinessUnitDto(**r)
 
+    def iter_listBusinessUnits(
+        self,
+        createdBy: str = None,
+        name: str = None,
+        sort: str = "NAME",
+        order: str = "ASC",
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[BusinessUnitDto]:
+        """
+        List business units, all pages
+
+        Yields the items of every page of listBusinessUnits. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listBusinessUnits except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of BusinessUnitDto
+        """
+        return paginate_items(
+            self.listBusinessUnits,
+            pageSize,
+            concurrency,
+            prefetch,
+            createdBy=createdBy,
+            name=name,
+            sort=sort,
+            order=order,
+            phrase_token=phrase_token,
+        )
+
     def createBusinessUnit(
         self,
         body: BusinessUnitEditDto,
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
 
 from ...models.phrase_models import ClientDto, ClientEditDto, PageDtoClientDto
+from ...pagination import paginate_items
 
 
 class ClientOperations:
@@ -135,6 +136,42 @@ class ClientOperations:
 
         return PageDtoClientDto(**r)
 
+    def iter_listClients(
+        self,
+        createdBy: str = None,
+        name: str = None,
+        sort: str = "NAME",
+        order: str = "ASC",
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[ClientDto]:
+        """
+        List clients, all pages
+
+        Yields the items of every page of listClients. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listClients except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of ClientDto
+        """
+        return paginate_items(
+            self.listClients,
+            pageSize,
+            concurrency,
+            prefetch,
+            createdBy=createdBy,
+            name=name,
+            sort=sort,
+            order=order,
+            phrase_token=phrase_token,
+        )
+
     def createClient(
         self,
         body: ClientEditDto,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
@@ -8,9 +8,11 @@ if TYPE_CHECKING:
 from ...models.phrase_models import (
     CreateCustomFieldDto,
     CustomFieldDto,
+    CustomFieldOptionDto,
     PageDtoCustomFieldDto,
     PageDtoCustomFieldOptionDto,
 )
+from ...pagination import paginate_items
 
 
 class CustomFieldsOperations:
@@ -101,6 +103,52 @@ class CustomFieldsOperations:
 
         return PageDtoCustomFieldDto(**r)
 
+    def iter_getCustomFieldList(
+        self,
+        sortField: str = None,
+        required: bool = None,
+        uids: List[str] = None,
+        modifiedBy: List[str] = None,
+        createdBy: List[str] = None,
+        types: List[str] = None,
+        allowedEntities: List[str] = None,
+        name: str = None,
+        pageSize: int = 50,
+        sortTrend: str = "ASC",
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[CustomFieldDto]:
+        """
+        Lists custom fields, all pages
+
+        Yields the items of every page of getCustomFieldList. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getCustomFieldList except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of CustomFieldDto
+        """
+        return paginate_items(
+            self.getCustomFieldList,
+            pageSize,
+            concurrency,
+            prefetch,
+            sortField=sortField,
+            required=required,
+            uids=uids,
+            modifiedBy=modifiedBy,
+            createdBy=createdBy,
+            types=types,
+            allowedEntities=allowedEntities,
+            name=name,
+            sortTrend=sortTrend,
+            phrase_token=phrase_token,
+        )
+
     def createCustomField(
         self,
         body: CreateCustomFieldDto,
@@ -168,3 +216,39 @@ class CustomFieldsOperations:
         )
 
         return PageDtoCustomFieldOptionDto(**r)
+
+    def iter_getCustomFieldOptionList(
+        self,
+        fieldUid: str,
+        sortField: str = None,
+        name: str = None,
+        pageSize: int = 50,
+        sortTrend: str = "ASC",
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[CustomFieldOptionDto]:
+        """
+        Lists options of custom field, all pages
+
+        Yields the items of every page of getCustomFieldOptionList. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getCustomFieldOptionList except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of CustomFieldOptionDto
+        """
+        return paginate_items(
+            self.getCustomFieldOptionList,
+            pageSize,
+            concurrency,
+            prefetch,
+            fieldUid=fieldUid,
+            sortField=sortField,
+            name=name,
+            sortTrend=sortTrend,
+            phrase_token=phrase_token,
+        )
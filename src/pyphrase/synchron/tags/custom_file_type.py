@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
@@ -12,6 +12,7 @@ from ...models.phrase_models import (
     PageDtoCustomFileTypeDto,
     UpdateCustomFileTypeDto,
 )
+from ...pagination import paginate_items
 
 
 class CustomFileTypeOperations:
@@ -46,6 +47,34 @@ class CustomFileTypeOperations:
 
         return PageDtoCustomFileTypeDto(**r)
 
+    def iter_getAllCustomFileType(
+        self,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[CustomFileTypeDto]:
+        """
+        Get All Custom file type, all pages
+
+        Yields the items of every page of getAllCustomFileType. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getAllCustomFileType except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of CustomFileTypeDto
+        """
+        return paginate_items(
+            self.getAllCustomFileType,
+            pageSize,
+            concurrency,
+            prefetch,
+            phrase_token=phrase_token,
+        )
+
     def createCustomFileTypes(
         self,
         body: CreateCustomFileTypeDto,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
@@ -10,6 +10,7 @@ from ...models.phrase_models import (
     RemoteUploadedFileDto,
     UploadedFileDto,
 )
+from ...pagination import paginate_items
 
 
 class FileOperations:
@@ -59,6 +60,42 @@ class FileOperations:
 
         return PageDtoUploadedFileDto(**r)
 
+    def iter_getFiles(
+        self,
+        biggerThan: int = None,
+        createdBy: int = None,
+        types: List[str] = None,
+        name: str = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[UploadedFileDto]:
+        """
+        List files, all pages
+
+        Yields the items of every page of getFiles. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getFiles except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of UploadedFileDto
+        """
+        return paginate_items(
+            self.getFiles,
+            pageSize,
+            concurrency,
+            prefetch,
+            biggerThan=biggerThan,
+            createdBy=createdBy,
+            types=types,
+            name=name,
+            phrase_token=phrase_token,
+        )
+
     def createUrlFile(
         self,
         body: RemoteUploadedFileDto,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
@@ -11,6 +11,7 @@ from ...models.phrase_models import (
     GlossaryEditDto,
     PageDtoGlossaryDto,
 )
+from ...pagination import paginate_items
 
 
 class GlossaryOperations:
@@ -137,6 +138,38 @@ class GlossaryOperations:
 
         return PageDtoGlossaryDto(**r)
 
+    def iter_listGlossaries(
+        self,
+        lang: List[str] = None,
+        name: str = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[GlossaryDto]:
+        """
+        List glossaries, all pages
+
+        Yields the items of every page of listGlossaries. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listGlossaries except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of GlossaryDto
+        """
+        return paginate_items(
+            self.listGlossaries,
+            pageSize,
+            concurrency,
+            prefetch,
+            lang=lang,
+            name=name,
+            phrase_token=phrase_token,
+        )
+
     def createGlossary(
         self,
         body: GlossaryEditDto,
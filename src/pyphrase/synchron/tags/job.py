@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import json
 import urllib.parse
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional, Union
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
@@ -27,10 +28,12 @@ from ...models.phrase_models import (
     JobPartReadyDeleteTranslationDto,
     JobPartReadyReferences,
     JobPartReferences,
+    JobPartReferenceV2,
     JobPartsDto,
     JobPartStatusChangesDto,
     JobPartUpdateBatchDto,
     JobPartUpdateSingleDto,
+    JobSegmentDto,
     JobStatusChangeActionDto,
     JobUpdateSourceResponseDto,
     NotifyJobPartsRequestDto,
@@ -52,6 +55,13 @@ from ...models.phrase_models import (
     WebEditorLinkDtoV2,
     WildCardSearchByJobRequestDtoV3,
 )
+from ...pagination import iterate_window_items, paginate_items
+from ...transport.streaming import (
+    DownloadDestination,
+    ProgressCallback,
+    UploadBody,
+    UploadContent,
+)
 
 
 class JobOperations:
@@ -63,7 +73,9 @@ class JobOperations:
         projectUid: str,
         jobUid: List[str] = None,
         phrase_token: Optional[str] = None,
-    ) -> bytes:
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
                 Download handover file(s)
                 For downloading multiple files as ZIP file provide multiple IDs in query parameters.
@@ -73,6 +85,9 @@ class JobOperations:
                 :param jobUid: array (optional), query. JobPart Id of requested handover file.
 
                 :param phrase_token: string (optional) - if not supplied, client will look token from init
+                :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+                    the number of bytes written is returned
+                :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
                 :return: None
         """
@@ -83,7 +98,13 @@ class JobOperations:
         payload = None
 
         r = self.client.get_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
@@ -91,8 +112,10 @@ class JobOperations:
     def uploadHandoverFile(
         self,
         projectUid: str,
-        body: InputStream,
+        body: UploadContent,
         phrase_token: Optional[str] = None,
+        fileName: Optional[str] = None,
+        metadata: Optional[JobPartReferences] = None,
     ) -> FileHandoverDto:
         """
                 Upload handover file
@@ -102,20 +125,34 @@ class JobOperations:
         * Split jobs
         * Multilingual jobs
                 :param projectUid: string (required), path.
-                :param body: InputStream (required), body.
+                :param body: UploadContent (required), body. Bytes, path, binary file, memory map or iterator of byte chunks,
+                    streamed while it is sent
 
                 :param phrase_token: string (optional) - if not supplied, client will look token from init
+                :param fileName: string (optional) - name of the uploaded file, defaults to the name of the path or file in body
+                :param metadata: JobPartReferences (optional) - jobs the handover file belongs to, sent in the Memsource header
 
                 :return: FileHandoverDto
         """
         endpoint = f"/api2/v1/projects/{projectUid}/fileHandovers"
         params = {}
 
+        content = UploadBody(body)
+        headers = {"Content-Disposition": content.content_disposition(fileName)}
+        if metadata is not None:
+            headers["Memsource"] = metadata.json(exclude_none=True)
+
         files = None
-        payload = body
+        payload = None
 
         r = self.client.put(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            content=content,
+            files=files,
+            headers=headers,
         )
 
         return FileHandoverDto(**r)
@@ -603,9 +640,45 @@ class JobOperations:
 
         return SegmentListDto(**r)
 
+    def iter_listSegments(
+        self,
+        jobUid: str,
+        projectUid: str,
+        windowSize: int = 1000,
+        concurrency: int = 1,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[JobSegmentDto]:
+        """
+        Get segments, all of them
+
+        Yields the segments of the job, fetched by listSegments in windows of windowSize segments.
+
+        :param jobUid: string (required), path.
+        :param projectUid: string (required), path.
+        :param windowSize: integer (optional) - segments per listSegments call
+        :param concurrency: integer (optional) - windows fetched at the same time
+
+        :param phrase_token: string (optional) - if not supplied, client will look token from init
+
+        :return: Iterator of JobSegmentDto
+        """
+        return iterate_window_items(
+            self.listSegments,
+            windowSize,
+            concurrency,
+            jobUid=jobUid,
+            projectUid=projectUid,
+            phrase_token=phrase_token,
+        )
+
     def getOriginalFile(
-        self, jobUid: str, projectUid: str, phrase_token: Optional[str] = None
-    ) -> bytes:
+        self,
+        jobUid: str,
+        projectUid: str,
+        phrase_token: Optional[str] = None,
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
         Download original file
 
@@ -613,6 +686,9 @@ class JobOperations:
         :param projectUid: string (required), path.
 
         :param phrase_token: string (optional) - if not supplied, client will look token from init
+        :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+            the number of bytes written is returned
+        :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
         :return: None
         """
@@ -623,14 +699,25 @@ class JobOperations:
         payload = None
 
         r = self.client.get_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
 
     def filePreviewJob(
-        self, jobUid: str, projectUid: str, phrase_token: Optional[str] = None
-    ) -> bytes:
+        self,
+        jobUid: str,
+        projectUid: str,
+        phrase_token: Optional[str] = None,
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
         Download preview file
 
@@ -638,6 +725,9 @@ class JobOperations:
         :param projectUid: string (required), path.
 
         :param phrase_token: string (optional) - if not supplied, client will look token from init
+        :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+            the number of bytes written is returned
+        :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
         :return: None
         """
@@ -648,7 +738,13 @@ class JobOperations:
         payload = None
 
         r = self.client.get_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
@@ -659,7 +755,9 @@ class JobOperations:
         projectUid: str,
         body: InputStream,
         phrase_token: Optional[str] = None,
-    ) -> bytes:
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
         Download preview file
         Takes bilingual file (.mxliff only) as argument. If not passed, data will be taken from database
@@ -668,6 +766,9 @@ class JobOperations:
         :param body: InputStream (required), body.
 
         :param phrase_token: string (optional) - if not supplied, client will look token from init
+        :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+            the number of bytes written is returned
+        :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
         :return: None
         """
@@ -678,7 +779,13 @@ class JobOperations:
         payload = body
 
         r = self.client.post_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
@@ -744,7 +851,7 @@ class JobOperations:
     def createJob(
         self,
         projectUid: str,
-        body: bytes,
+        body: UploadContent,
         fileName: str,
         metadata: JobCreateRequestDto,
         phrase_token: Optional[str] = None,
@@ -860,7 +967,8 @@ class JobOperations:
         }
         ```
                 :param projectUid: string (required), path.
-                :param body: InputStream (required), body.
+                :param body: UploadContent (required), body. Bytes, path, binary file, memory map or iterator of byte chunks,
+                    streamed while it is sent
 
                 :param phrase_token: string (optional) - if not supplied, client will look token from init
 
@@ -877,7 +985,7 @@ class JobOperations:
             "Content-disposition": f"filename*=UTF-8''{encoded_filename}",
         }
         payload = None
-        content = body
+        content = UploadBody(body)
 
         files = None
 
@@ -1020,7 +1128,7 @@ class JobOperations:
     def updateSource(
         self,
         projectUid: str,
-        body: bytes,
+        body: UploadContent,
         fileName: str,
         metadata: UpdateSourceMetadataDto,
         phrase_token: Optional[str] = None,
@@ -1075,7 +1183,8 @@ class JobOperations:
         }
         ```
                 :param projectUid: string (required), path.
-                :param body: InputStream (required), body.
+                :param body: UploadContent (required), body. Bytes, path, binary file, memory map or iterator of byte chunks,
+                    streamed while it is sent
 
                 :param phrase_token: string (optional) - if not supplied, client will look token from init
 
@@ -1088,7 +1197,7 @@ class JobOperations:
             "Content-disposition": f"filename*=UTF-8''{fileName}",
         }
         payload = None
-        content = body
+        content = UploadBody(body)
 
         files = None
 
@@ -1106,8 +1215,10 @@ class JobOperations:
     def updateTarget(
         self,
         projectUid: str,
-        body: InputStream,
+        body: UploadContent,
         phrase_token: Optional[str] = None,
+        fileName: Optional[str] = None,
+        metadata: Optional[dict] = None,
     ) -> JobUpdateSourceResponseDto:
         """
                 Update target
@@ -1156,20 +1267,34 @@ class JobOperations:
         }
         ```
                 :param projectUid: string (required), path.
-                :param body: InputStream (required), body.
+                :param body: UploadContent (required), body. Bytes, path, binary file, memory map or iterator of byte chunks,
+                    streamed while it is sent
 
                 :param phrase_token: string (optional) - if not supplied, client will look token from init
+                :param fileName: string (optional) - name of the uploaded file, defaults to the name of the path or file in body
+                :param metadata: dict (optional) - jobs and options, sent in the Memsource header
 
                 :return: JobUpdateSourceResponseDto
         """
         endpoint = f"/api2/v1/projects/{projectUid}/jobs/target"
         params = {}
 
+        content = UploadBody(body)
+        headers = {"Content-Disposition": content.content_disposition(fileName)}
+        if metadata is not None:
+            headers["Memsource"] = json.dumps(metadata)
+
         files = None
-        payload = body
+        payload = None
 
         r = self.client.post(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            content=content,
+            files=files,
+            headers=headers,
         )
 
         return JobUpdateSourceResponseDto(**r)
@@ -1302,7 +1427,9 @@ class JobOperations:
         format: str = "MXLF",
         preview: bool = "True",
         phrase_token: Optional[str] = None,
-    ) -> bytes:
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
                 Download bilingual file
                 This API call generates a bilingual file in the chosen format by merging all submitted jobs together.
@@ -1324,6 +1451,9 @@ class JobOperations:
                 :param preview: boolean (optional), query.
 
                 :param phrase_token: string (optional) - if not supplied, client will look token from init
+                :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+                    the number of bytes written is returned
+                :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
                 :return: None
         """
@@ -1334,7 +1464,13 @@ class JobOperations:
         payload = body
 
         r = self.client.post_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
@@ -1533,6 +1669,54 @@ class JobOperations:
 
         return PageDtoJobPartReferenceV2(**r)
 
+    def iter_listPartsV2(
+        self,
+        projectUid: str,
+        notReady: bool = None,
+        assignedVendor: int = None,
+        targetLang: str = None,
+        filename: str = None,
+        dueInHours: int = None,
+        assignedUser: int = None,
+        status: List[str] = None,
+        pageSize: int = 50,
+        count: bool = "False",
+        workflowLevel: int = "1",
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[JobPartReferenceV2]:
+        """
+        List jobs, all pages
+
+        Yields the items of every page of listPartsV2. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listPartsV2 except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of JobPartReferenceV2
+        """
+        return paginate_items(
+            self.listPartsV2,
+            pageSize,
+            concurrency,
+            prefetch,
+            projectUid=projectUid,
+            notReady=notReady,
+            assignedVendor=assignedVendor,
+            targetLang=targetLang,
+            filename=filename,
+            dueInHours=dueInHours,
+            assignedUser=assignedUser,
+            status=status,
+            count=count,
+            workflowLevel=workflowLevel,
+            phrase_token=phrase_token,
+        )
+
     def webEditorLinkV2(
         self,
         projectUid: str,
@@ -1737,7 +1921,9 @@ class JobOperations:
         projectUid: str,
         format: str = "ORIGINAL",
         phrase_token: Optional[str] = None,
-    ) -> bytes:
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
                 Download target file based on async request
                 This call will return target file with translation. This means even for other jobs that were created via
@@ -1751,6 +1937,9 @@ class JobOperations:
                 :param format: string (optional), query.
 
                 :param phrase_token: string (optional) - if not supplied, client will look token from init
+                :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+                    the number of bytes written is returned
+                :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
                 :return: None
         """
@@ -1761,7 +1950,13 @@ class JobOperations:
         payload = None
 
         r = self.client.get_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
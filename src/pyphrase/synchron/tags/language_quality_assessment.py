@@ -1,18 +1,24 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
 
+from ...transport.streaming import DownloadDestination, ProgressCallback
+
 
 class LanguageQualityAssessmentOperations:
     def __init__(self, client: SyncPhraseTMSClient):
         self.client = client
 
     def downloadLqaReports(
-        self, jobParts: str, phrase_token: Optional[str] = None
-    ) -> bytes:
+        self,
+        jobParts: str,
+        phrase_token: Optional[str] = None,
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
                 Download LQA Assessment XLSX reports
                 Returns a single xlsx report or ZIP archive with multiple reports.
@@ -21,6 +27,9 @@ class LanguageQualityAssessmentOperations:
                 :param jobParts: string (required), query. Comma separated list of JobPart UIDs, between 1 and 100 UIDs.
 
                 :param phrase_token: string (optional) - if not supplied, client will look token from init
+                :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+                    the number of bytes written is returned
+                :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
                 :return: None
         """
@@ -31,7 +40,13 @@ class LanguageQualityAssessmentOperations:
         payload = None
 
         r = self.client.get_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
@@ -11,6 +11,7 @@ from ...models.phrase_models import (
     PageDtoMachineTranslateSettingsPbmDto,
     TypesDto,
 )
+from ...pagination import paginate_items
 
 
 class MachineTranslationSettingsOperations:
@@ -83,6 +84,40 @@ class MachineTranslationSettingsOperations:
 
         return PageDtoMachineTranslateSettingsPbmDto(**r)
 
+    def iter_getList(
+        self,
+        name: str = None,
+        pageSize: int = 50,
+        sort: str = "NAME",
+        order: str = "asc",
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[MachineTranslateSettingsPbmDto]:
+        """
+        List machine translate settings, all pages
+
+        Yields the items of every page of getList. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getList except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of MachineTranslateSettingsPbmDto
+        """
+        return paginate_items(
+            self.getList,
+            pageSize,
+            concurrency,
+            prefetch,
+            name=name,
+            sort=sort,
+            order=order,
+            phrase_token=phrase_token,
+        )
+
     def getMTSettings(
         self,
         mtsUid: str,
@@ -149,6 +184,40 @@ class MachineTranslationSettingsOperations:
 
         return PageDtoMachineTranslateSettingsPbmDto(**r)
 
+    def iter_getThirdPartyEnginesList(
+        self,
+        name: str = None,
+        pageSize: int = 100,
+        sort: str = "NAME",
+        order: str = "asc",
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[MachineTranslateSettingsPbmDto]:
+        """
+        List third party machine translate settings, all pages
+
+        Yields the items of every page of getThirdPartyEnginesList. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getThirdPartyEnginesList except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 100
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of MachineTranslateSettingsPbmDto
+        """
+        return paginate_items(
+            self.getThirdPartyEnginesList,
+            pageSize,
+            concurrency,
+            prefetch,
+            name=name,
+            sort=sort,
+            order=order,
+            phrase_token=phrase_token,
+        )
+
     def getMTTypes(
         self,
         phrase_token: Optional[str] = None,
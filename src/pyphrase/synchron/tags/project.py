@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
@@ -11,6 +11,7 @@ from ...models.phrase_models import (
     AddTargetLangDto,
     AddWorkflowStepsDto,
     AdminProjectManager,
+    AnalyseReference,
     AnalyseSettingsDto,
     AssignableTemplatesDto,
     AssignVendorDto,
@@ -51,16 +52,21 @@ from ...models.phrase_models import (
     ProjectTransMemoryListDtoV3,
     ProjectWorkflowStepListDtoV2,
     ProviderListDtoV2,
+    ProviderReference,
     QASettingsDtoV2,
+    QuoteDto,
     SearchResponseListTmDto,
     SearchTMRequestDto,
     SetFinancialSettingsDto,
     SetProjectStatusDto,
     SetProjectTransMemoriesV3Dto,
     SetTermBaseDto,
+    TermBaseDto,
+    TransMemoryDto,
     UpdateCustomFieldInstanceDto,
     UpdateCustomFieldInstancesDto,
 )
+from ...pagination import paginate_items
 
 
 class ProjectOperations:
@@ -336,6 +342,80 @@ class ProjectOperations:
 
         return PageDtoAbstractProjectDto(**r)
 
+    def iter_listProjects(
+        self,
+        nameOrInternalId: str = None,
+        buyerId: int = None,
+        jobStatusGroup: str = None,
+        jobStatuses: List[str] = None,
+        ownerId: int = None,
+        sourceLangs: List[str] = None,
+        createdInLastHours: int = None,
+        dueInHours: int = None,
+        costCenterName: str = None,
+        costCenterId: int = None,
+        subDomainName: str = None,
+        subDomainId: int = None,
+        domainName: str = None,
+        domainId: int = None,
+        targetLangs: List[str] = None,
+        statuses: List[str] = None,
+        businessUnitName: str = None,
+        businessUnitId: int = None,
+        clientName: str = None,
+        clientId: int = None,
+        name: str = None,
+        pageSize: int = 50,
+        includeArchived: bool = "False",
+        archivedOnly: bool = "False",
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[AbstractProjectDto]:
+        """
+        List projects, all pages
+
+        Yields the items of every page of listProjects. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listProjects except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of AbstractProjectDto
+        """
+        return paginate_items(
+            self.listProjects,
+            pageSize,
+            concurrency,
+            prefetch,
+            nameOrInternalId=nameOrInternalId,
+            buyerId=buyerId,
+            jobStatusGroup=jobStatusGroup,
+            jobStatuses=jobStatuses,
+            ownerId=ownerId,
+            sourceLangs=sourceLangs,
+            createdInLastHours=createdInLastHours,
+            dueInHours=dueInHours,
+            costCenterName=costCenterName,
+            costCenterId=costCenterId,
+            subDomainName=subDomainName,
+            subDomainId=subDomainId,
+            domainName=domainName,
+            domainId=domainId,
+            targetLangs=targetLangs,
+            statuses=statuses,
+            businessUnitName=businessUnitName,
+            businessUnitId=businessUnitId,
+            clientName=clientName,
+            clientId=clientId,
+            name=name,
+            includeArchived=includeArchived,
+            archivedOnly=archivedOnly,
+            phrase_token=phrase_token,
+        )
+
     def assignableTemplates(
         self,
         projectUid: str,
@@ -543,6 +623,38 @@ class ProjectOperations:
 
         return PageDtoProviderReference(**r)
 
+    def iter_getProjectAssignments(
+        self,
+        projectUid: str,
+        providerName: str = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[ProviderReference]:
+        """
+        List project providers, all pages
+
+        Yields the items of every page of getProjectAssignments. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getProjectAssignments except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of ProviderReference
+        """
+        return paginate_items(
+            self.getProjectAssignments,
+            pageSize,
+            concurrency,
+            prefetch,
+            projectUid=projectUid,
+            providerName=providerName,
+            phrase_token=phrase_token,
+        )
+
     def setProjectStatus(
         self,
         projectUid: str,
@@ -764,6 +876,36 @@ class ProjectOperations:
 
         return PageDtoQuoteDto(**r)
 
+    def iter_getQuotesForProject(
+        self,
+        projectUid: str,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[QuoteDto]:
+        """
+        List quotes, all pages
+
+        Yields the items of every page of getQuotesForProject. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getQuotesForProject except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of QuoteDto
+        """
+        return paginate_items(
+            self.getQuotesForProject,
+            pageSize,
+            concurrency,
+            prefetch,
+            projectUid=projectUid,
+            phrase_token=phrase_token,
+        )
+
     def setMtSettingsPerLanguageForProject(
         self,
         projectUid: str,
@@ -971,6 +1113,44 @@ class ProjectOperations:
 
         return PageDtoCustomFieldInstanceDto(**r)
 
+    def iter_getCustomFieldsPage(
+        self,
+        projectUid: str,
+        sortField: str = None,
+        modifiedBy: List[str] = None,
+        createdBy: List[str] = None,
+        pageSize: int = 50,
+        sortTrend: str = "ASC",
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[CustomFieldInstanceDto]:
+        """
+        Get custom fields of project (page), all pages
+
+        Yields the items of every page of getCustomFieldsPage. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getCustomFieldsPage except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of CustomFieldInstanceDto
+        """
+        return paginate_items(
+            self.getCustomFieldsPage,
+            pageSize,
+            concurrency,
+            prefetch,
+            projectUid=projectUid,
+            sortField=sortField,
+            modifiedBy=modifiedBy,
+            createdBy=createdBy,
+            sortTrend=sortTrend,
+            phrase_token=phrase_token,
+        )
+
     def createCustomFields(
         self,
         projectUid: str,
@@ -1218,6 +1398,48 @@ class ProjectOperations:
 
         return PageDtoTermBaseDto(**r)
 
+    def iter_relevantTermBases(
+        self,
+        projectUid: str,
+        targetLangs: List[str] = None,
+        subDomainName: str = None,
+        clientName: str = None,
+        domainName: str = None,
+        name: str = None,
+        strictLangMatching: bool = "False",
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[TermBaseDto]:
+        """
+        List project relevant term bases, all pages
+
+        Yields the items of every page of relevantTermBases. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of relevantTermBases except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of TermBaseDto
+        """
+        return paginate_items(
+            self.relevantTermBases,
+            pageSize,
+            concurrency,
+            prefetch,
+            projectUid=projectUid,
+            targetLangs=targetLangs,
+            subDomainName=subDomainName,
+            clientName=clientName,
+            domainName=domainName,
+            name=name,
+            strictLangMatching=strictLangMatching,
+            phrase_token=phrase_token,
+        )
+
     def relevantTransMemories_1(
         self,
         projectUid: str,
@@ -1269,6 +1491,48 @@ class ProjectOperations:
 
         return PageDtoTransMemoryDto(**r)
 
+    def iter_relevantTransMemories_1(
+        self,
+        projectUid: str,
+        targetLangs: List[str] = None,
+        subDomainName: str = None,
+        clientName: str = None,
+        domainName: str = None,
+        name: str = None,
+        strictLangMatching: bool = "False",
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[TransMemoryDto]:
+        """
+        List project relevant translation memories, all pages
+
+        Yields the items of every page of relevantTransMemories_1. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of relevantTransMemories_1 except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of TransMemoryDto
+        """
+        return paginate_items(
+            self.relevantTransMemories_1,
+            pageSize,
+            concurrency,
+            prefetch,
+            projectUid=projectUid,
+            targetLangs=targetLangs,
+            subDomainName=subDomainName,
+            clientName=clientName,
+            domainName=domainName,
+            name=name,
+            strictLangMatching=strictLangMatching,
+            phrase_token=phrase_token,
+        )
+
     def searchSegment_1(
         self,
         projectUid: str,
@@ -1569,6 +1833,46 @@ class ProjectOperations:
 
         return PageDtoAnalyseReference(**r)
 
+    def iter_listByProjectV3(
+        self,
+        projectUid: str,
+        onlyOwnerOrg: bool = None,
+        uid: str = None,
+        name: str = None,
+        pageSize: int = 50,
+        sort: str = "DATE_CREATED",
+        order: str = "desc",
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[AnalyseReference]:
+        """
+        List analyses by project, all pages
+
+        Yields the items of every page of listByProjectV3. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listByProjectV3 except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of AnalyseReference
+        """
+        return paginate_items(
+            self.listByProjectV3,
+            pageSize,
+            concurrency,
+            prefetch,
+            projectUid=projectUid,
+            onlyOwnerOrg=onlyOwnerOrg,
+            uid=uid,
+            name=name,
+            sort=sort,
+            order=order,
+            phrase_token=phrase_token,
+        )
+
     def createProjectV3(
         self,
         body: CreateProjectV3Dto,
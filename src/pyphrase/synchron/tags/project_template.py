@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
@@ -24,15 +24,18 @@ from ...models.phrase_models import (
     ProjectTemplate,
     ProjectTemplateCreateActionDto,
     ProjectTemplateEditDto,
+    ProjectTemplateReference,
     ProjectTemplateTermBaseListDto,
     ProjectTemplateTransMemoryListDtoV3,
     ProjectTemplateTransMemoryListV2Dto,
     QASettingsDtoV2,
     SetProjectTemplateTermBaseDto,
     SetProjectTemplateTransMemoriesV2Dto,
+    TransMemoryDto,
     UpdateCustomFieldInstanceDto,
     UpdateCustomFieldInstancesDto,
 )
+from ...pagination import paginate_items
 
 
 class ProjectTemplateOperations:
@@ -146,6 +149,48 @@ class ProjectTemplateOperations:
 
         return PageDtoTransMemoryDto(**r)
 
+    def iter_relevantTransMemories(
+        self,
+        projectTemplateUid: str,
+        targetLangs: List[str] = None,
+        subDomainName: str = None,
+        clientName: str = None,
+        domainName: str = None,
+        name: str = None,
+        strictLangMatching: bool = "False",
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[TransMemoryDto]:
+        """
+        List project template relevant translation memories, all pages
+
+        Yields the items of every page of relevantTransMemories. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of relevantTransMemories except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of TransMemoryDto
+        """
+        return paginate_items(
+            self.relevantTransMemories,
+            pageSize,
+            concurrency,
+            prefetch,
+            projectTemplateUid=projectTemplateUid,
+            targetLangs=targetLangs,
+            subDomainName=subDomainName,
+            clientName=clientName,
+            domainName=domainName,
+            name=name,
+            strictLangMatching=strictLangMatching,
+            phrase_token=phrase_token,
+        )
+
     def getProjectTemplates(
         self,
         businessUnitName: str = None,
@@ -236,6 +281,56 @@ class ProjectTemplateOperations:
 
         return PageDtoProjectTemplateReference(**r)
 
+    def iter_getProjectTemplates(
+        self,
+        businessUnitName: str = None,
+        costCenterName: str = None,
+        costCenterId: int = None,
+        subDomainName: str = None,
+        domainName: str = None,
+        ownerUid: str = None,
+        clientName: str = None,
+        clientId: int = None,
+        name: str = None,
+        sort: str = "dateCreated",
+        direction: str = "desc",
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[ProjectTemplateReference]:
+        """
+        List project templates, all pages
+
+        Yields the items of every page of getProjectTemplates. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getProjectTemplates except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of ProjectTemplateReference
+        """
+        return paginate_items(
+            self.getProjectTemplates,
+            pageSize,
+            concurrency,
+            prefetch,
+            businessUnitName=businessUnitName,
+            costCenterName=costCenterName,
+            costCenterId=costCenterId,
+            subDomainName=subDomainName,
+            domainName=domainName,
+            ownerUid=ownerUid,
+            clientName=clientName,
+            clientId=clientId,
+            name=name,
+            sort=sort,
+            direction=direction,
+            phrase_token=phrase_token,
+        )
+
     def createProjectTemplate(
         self,
         body: ProjectTemplateCreateActionDto,
@@ -629,6 +724,44 @@ class ProjectTemplateOperations:
 
         return PageDtoCustomFieldInstanceDto(**r)
 
+    def iter_getCustomFieldsPage_1(
+        self,
+        projectTemplateUid: str,
+        sortField: str = None,
+        modifiedBy: List[str] = None,
+        createdBy: List[str] = None,
+        pageSize: int = 50,
+        sortTrend: str = "ASC",
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[CustomFieldInstanceDto]:
+        """
+        Get custom fields of project template (page), all pages
+
+        Yields the items of every page of getCustomFieldsPage_1. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getCustomFieldsPage_1 except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of CustomFieldInstanceDto
+        """
+        return paginate_items(
+            self.getCustomFieldsPage_1,
+            pageSize,
+            concurrency,
+            prefetch,
+            projectTemplateUid=projectTemplateUid,
+            sortField=sortField,
+            modifiedBy=modifiedBy,
+            createdBy=createdBy,
+            sortTrend=sortTrend,
+            phrase_token=phrase_token,
+        )
+
     def createCustomFields_1(
         self,
         projectTemplateUid: str,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
@@ -10,7 +10,9 @@ from ...models.phrase_models import (
     InputStream,
     PageDtoSegmentationRuleReference,
     SegmentationRuleDto,
+    SegmentationRuleReference,
 )
+from ...pagination import paginate_items
 
 
 class SegmentationRulesOperations:
@@ -127,6 +129,36 @@ class SegmentationRulesOperations:
 
         return PageDtoSegmentationRuleReference(**r)
 
+    def iter_getListOfSegmentationRules(
+        self,
+        locales: List[str] = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[SegmentationRuleReference]:
+        """
+        List segmentation rules, all pages
+
+        Yields the items of every page of getListOfSegmentationRules. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getListOfSegmentationRules except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of SegmentationRuleReference
+        """
+        return paginate_items(
+            self.getListOfSegmentationRules,
+            pageSize,
+            concurrency,
+            prefetch,
+            locales=locales,
+            phrase_token=phrase_token,
+        )
+
     def createSegmentationRule(
         self,
         body: InputStream,
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Iterator, List, Optional, Union
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
 
 from ...models.phrase_models import (
+    AbstractProjectDto,
     AsyncExportTMByQueryResponseDto,
     AsyncExportTMResponseDto,
     AsyncRequestWrapperDto,
@@ -14,7 +15,6 @@ from ...models.phrase_models import (
     CleanedTransMemoriesDto,
     ExportByQueryDto,
     ExportTMDto,
-    InputStream,
     MetadataResponse,
     PageDtoAbstractProjectDto,
     PageDtoTransMemoryDto,
@@ -29,6 +29,13 @@ from ...models.phrase_models import (
     TransMemoryEditDto,
     WildCardSearchRequestDto,
 )
+from ...pagination import paginate_items
+from ...transport.streaming import (
+    DownloadDestination,
+    ProgressCallback,
+    UploadBody,
+    UploadContent,
+)
 
 
 class TranslationMemoryOperations:
@@ -149,6 +156,48 @@ class TranslationMemoryOperations:
 
         return PageDtoTransMemoryDto(**r)
 
+    def iter_listTransMemories(
+        self,
+        businessUnitId: str = None,
+        subDomainId: str = None,
+        domainId: str = None,
+        clientId: str = None,
+        targetLang: str = None,
+        sourceLang: str = None,
+        name: str = None,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[TransMemoryDto]:
+        """
+        List translation memories, all pages
+
+        Yields the items of every page of listTransMemories. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listTransMemories except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of TransMemoryDto
+        """
+        return paginate_items(
+            self.listTransMemories,
+            pageSize,
+            concurrency,
+            prefetch,
+            businessUnitId=businessUnitId,
+            subDomainId=subDomainId,
+            domainId=domainId,
+            clientId=clientId,
+            targetLang=targetLang,
+            sourceLang=sourceLang,
+            name=name,
+            phrase_token=phrase_token,
+        )
+
     def createTransMemory(
         self,
         body: TransMemoryCreateDto,
@@ -312,14 +361,21 @@ class TranslationMemoryOperations:
         return AsyncRequestWrapperDto(**r)
 
     def downloadCleanedTM(
-        self, asyncRequestId: str, phrase_token: Optional[str] = None
-    ) -> bytes:
+        self,
+        asyncRequestId: str,
+        phrase_token: Optional[str] = None,
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
         Download cleaned TM
 
         :param asyncRequestId: string (required), path. Request ID.
 
         :param phrase_token: string (optional) - if not supplied, client will look token from init
+        :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+            the number of bytes written is returned
+        :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
         :return: None
         """
@@ -330,7 +386,13 @@ class TranslationMemoryOperations:
         payload = None
 
         r = self.client.get_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
@@ -419,6 +481,36 @@ class TranslationMemoryOperations:
 
         return PageDtoAbstractProjectDto(**r)
 
+    def iter_getRelatedProjects(
+        self,
+        transMemoryUid: str,
+        pageSize: int = 50,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[AbstractProjectDto]:
+        """
+        List related projects, all pages
+
+        Yields the items of every page of getRelatedProjects. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of getRelatedProjects except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 50
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of AbstractProjectDto
+        """
+        return paginate_items(
+            self.getRelatedProjects,
+            pageSize,
+            concurrency,
+            prefetch,
+            transMemoryUid=transMemoryUid,
+            phrase_token=phrase_token,
+        )
+
     def getMetadata(
         self,
         transMemoryUid: str,
@@ -597,7 +689,9 @@ class TranslationMemoryOperations:
         fields: List[str] = None,
         format: str = "TMX",
         phrase_token: Optional[str] = None,
-    ) -> bytes:
+        destination: Optional[DownloadDestination] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Union[bytes, int]:
         """
         Download export
 
@@ -606,6 +700,9 @@ class TranslationMemoryOperations:
         :param format: string (optional), query.
 
         :param phrase_token: string (optional) - if not supplied, client will look token from init
+        :param destination: path or binary file object (optional) - stream the file there instead of returning it,
+            the number of bytes written is returned
+        :param progress: callable (optional) - called with bytes received so far and total bytes, if known
 
         :return: None
         """
@@ -616,7 +713,13 @@ class TranslationMemoryOperations:
         payload = None
 
         r = self.client.get_bytestream(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            files=files,
+            destination=destination,
+            progress=progress,
         )
 
         return r
@@ -706,20 +809,23 @@ class TranslationMemoryOperations:
     def importTransMemoryV2(
         self,
         transMemoryUid: str,
-        body: InputStream,
+        body: UploadContent,
         strictLangMatching: bool = "False",
         stripNativeCodes: bool = "True",
         phrase_token: Optional[str] = None,
+        fileName: Optional[str] = None,
     ) -> AsyncRequestWrapperV2Dto:
         """
         Import TMX
 
         :param transMemoryUid: string (required), path.
-        :param body: InputStream (required), body.
+        :param body: UploadContent (required), body. Bytes, path, binary file, memory map or iterator of byte chunks,
+            streamed while it is sent
         :param strictLangMatching: boolean (optional), query.
         :param stripNativeCodes: boolean (optional), query.
 
         :param phrase_token: string (optional) - if not supplied, client will look token from init
+        :param fileName: string (optional) - name of the uploaded file, defaults to the name of the path or file in body
 
         :return: AsyncRequestWrapperV2Dto
         """
@@ -729,11 +835,20 @@ class TranslationMemoryOperations:
             "stripNativeCodes": stripNativeCodes,
         }
 
+        content = UploadBody(body)
+        headers = {"Content-Disposition": content.content_disposition(fileName)}
+
         files = None
-        payload = body
+        payload = None
 
         r = self.client.post(
-            endpoint, phrase_token, params=params, payload=payload, files=files
+            endpoint,
+            phrase_token,
+            params=params,
+            payload=payload,
+            content=content,
+            files=files,
+            headers=headers,
         )
 
         return AsyncRequestWrapperV2Dto(**r)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
 if TYPE_CHECKING:
     from ..client import SyncPhraseTMSClient
 
-from ...models.phrase_models import PageDtoXmlAssistantProfileListDto
+from ...models.phrase_models import (
+    PageDtoXmlAssistantProfileListDto,
+    XmlAssistantProfileListDto,
+)
+from ...pagination import paginate_items
 
 
 class XmlAssistantOperations:
@@ -69,3 +73,49 @@ class XmlAssistantOperations:
         )
 
         return PageDtoXmlAssistantProfileListDto(**r)
+
+    def iter_listXmlAssistantProfiles(
+        self,
+        order: str = None,
+        sort: str = None,
+        search: str = None,
+        updatedAt: str = None,
+        createdAt: str = None,
+        updatedBy: str = None,
+        createdBy: str = None,
+        description: str = None,
+        name: str = None,
+        pageSize: int = 1000,
+        concurrency: int = 1,
+        prefetch: int = 0,
+        phrase_token: Optional[str] = None,
+    ) -> Iterator[XmlAssistantProfileListDto]:
+        """
+        Get XML assistant profiles for organization, all pages
+
+        Yields the items of every page of listXmlAssistantProfiles. A page is fetched only when the previous one is used up,
+        unless concurrency or prefetch have pages fetched in parallel or ahead of the caller.
+        Takes the parameters of listXmlAssistantProfiles except pageNumber.
+
+        :param pageSize: integer (optional) - items per page, between 1 and 1000
+        :param concurrency: integer (optional) - pages fetched at the same time, items still come in page order
+        :param prefetch: integer (optional) - pages fetched ahead while the caller works on the current one
+
+        :return: Iterator of XmlAssistantProfileListDto
+        """
+        return paginate_items(
+            self.listXmlAssistantProfiles,
+            pageSize,
+            concurrency,
+            prefetch,
+            order=order,
+            sort=sort,
+            search=search,
+            updatedAt=updatedAt,
+            createdAt=createdAt,
+            updatedBy=updatedBy,
+            createdBy=createdBy,
+            description=description,
+            name=name,
+            phrase_token=phrase_token,
+        )
@@ -0,0 +1,86 @@
+from .circuit_breaker import CircuitBreaker, endpoint_family
+from .concurrency import AdaptiveConcurrencyLimiter
+from .endpoints import (
+    MEMSOURCE_BASE_URL,
+    MEMSOURCE_US_BASE_URL,
+    PHRASE_TMS_ENDPOINTS,
+    aprobe_endpoints,
+    fastest_endpoint,
+    probe_endpoints,
+)
+from .middleware import (
+    AuthMiddleware,
+    CacheMiddleware,
+    CircuitBreakerMiddleware,
+    CoalescingMiddleware,
+    CompressionMiddleware,
+    ConcurrencyMiddleware,
+    HedgeAdmissionMiddleware,
+    HedgingMiddleware,
+    MetricsMiddleware,
+    RateLimitMiddleware,
+    RetryMiddleware,
+    TimeoutMiddleware,
+)
+from .pipeline import Middleware, Pipeline, RequestContext
+from .rate_limit import (
+    InMemoryRateLimiterBackend,
+    RateLimiter,
+    RateLimiterBackend,
+    RateLimitRule,
+    TokenBucket,
+)
+from .rate_limit_backends import FileRateLimiterBackend, RedisRateLimiterBackend
+from .retry import RetryPolicy, RetryState, exception_from_response, parse_retry_after
+from .timeouts import (
+    DEFAULT_TIMEOUT_PROFILES,
+    Deadline,
+    TimeoutPolicy,
+    TimeoutRule,
+    current_deadline,
+    deadline_context,
+)
+
+__all__ = [
+    "RetryPolicy",
+    "RetryState",
+    "exception_from_response",
+    "parse_retry_after",
+    "RateLimiter",
+    "RateLimitRule",
+    "RateLimiterBackend",
+    "InMemoryRateLimiterBackend",
+    "TokenBucket",
+    "FileRateLimiterBackend",
+    "RedisRateLimiterBackend",
+    "AdaptiveConcurrencyLimiter",
+    "Pipeline",
+    "Middleware",
+    "RequestContext",
+    "AuthMiddleware",
+    "CacheMiddleware",
+    "CircuitBreakerMiddleware",
+    "CoalescingMiddleware",
+    "CompressionMiddleware",
+    "ConcurrencyMiddleware",
+    "HedgeAdmissionMiddleware",
+    "HedgingMiddleware",
+    "MetricsMiddleware",
+    "RateLimitMiddleware",
+    "RetryMiddleware",
+    "TimeoutMiddleware",
+    "TimeoutPolicy",
+    "TimeoutRule",
+    "DEFAULT_TIMEOUT_PROFILES",
+    "Deadline",
+    "current_deadline",
+    "deadline_context",
+    "MEMSOURCE_BASE_URL",
+    "MEMSOURCE_US_BASE_URL",
+    "PHRASE_TMS_ENDPOINTS",
+    "probe_endpoints",
+    "aprobe_endpoints",
+    "fastest_endpoint",
+    "CircuitBreaker",
+    "endpoint_family",
+]
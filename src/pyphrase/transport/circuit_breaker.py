@@ -0,0 +1,165 @@
+import logging
+import re
+import threading
+import time
+from typing import List, Optional
+
+from .path_templates import PATH_TEMPLATES
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+_API_VERSION = re.compile(r"^/api2/v\d+")
+# Only for paths missing from PATH_TEMPLATES: path words of the API are camel case, identifiers usually are not
+_STATIC_SEGMENT = re.compile(r"^[A-Za-z][a-z]+(?:[A-Z][a-z]+)*[A-Z]?$")
+_template_tree: Optional[dict] = None
+
+
+def _templates() -> dict:
+    """
+    PATH_TEMPLATES as nested dicts of segments, "" marks the end of a template
+    """
+    global _template_tree
+    if _template_tree is None:
+        tree: dict = {}
+        for template in PATH_TEMPLATES:
+            node = tree
+            for segment in template.split("/"):
+                node = node.setdefault(segment, {})
+            node[""] = {}
+        _template_tree = tree
+    return _template_tree
+
+
+def _match(node: dict, segments: List[str]) -> Optional[List[str]]:
+    if not segments:
+        return [] if "" in node else None
+    segment, rest = segments[0], segments[1:]
+    # A path word takes precedence over a parameter, e.g. projects/*/jobs/search over projects/*/jobs/*
+    for key in (segment, "*"):
+        if key and key in node:
+            matched = _match(node[key], rest)
+            if matched is not None:
+                return [key] + matched
+    return None
+
+
+def endpoint_family(path: str) -> str:
+    """
+    Path template of a call with the API version left out and identifiers replaced by *,
+    e.g. /api2/v1/transMemories/a1B2c3/search -> transMemories/*/search
+    """
+    segments = _API_VERSION.sub("", path.split("?", 1)[0]).strip("/").split("/")
+    matched = _match(_templates(), segments)
+    if matched is not None:
+        return "/".join(matched)
+    return "/".join(
+        segment if _STATIC_SEGMENT.match(segment) else "*" for segment in segments
+    )
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        family: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        """
+        Closed, open and half-open states of one endpoint family.
+
+        Closed lets every call through and opens after failure_threshold failures in a row. Open rejects calls
+        until recovery_timeout has passed, then half-open lets half_open_max_calls trial calls through. A successful
+        trial closes the breaker again, a failed one opens it for another recovery_timeout.
+        """
+        self.family = family
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.rejected = 0
+        self.times_opened = 0
+        self._trials = 0
+        self._lock = threading.Lock()
+
+    def retry_after(self) -> float:
+        """
+        Seconds until an open breaker lets a trial call through
+        """
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.recovery_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        """
+        Whether a call may be sent now. Every allowed call must be followed by record_success,
+        record_failure or release.
+        """
+        with self._lock:
+            if self.state == OPEN:
+                if self.retry_after() > 0:
+                    self.rejected += 1
+                    return False
+                self._set_state(HALF_OPEN)
+            if self.state == HALF_OPEN:
+                if self._trials >= self.half_open_max_calls:
+                    self.rejected += 1
+                    return False
+                self._trials += 1
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            if self.state == HALF_OPEN:
+                self._trials = max(0, self._trials - 1)
+                self._set_state(CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN:
+                self._trials = max(0, self._trials - 1)
+                self._open()
+            elif self.state == CLOSED and self.failures >= self.failure_threshold:
+                self._open()
+
+    def release(self) -> None:
+        """
+        End an allowed call whose outcome says nothing about the endpoint, e.g. a cancelled call
+        """
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._trials = max(0, self._trials - 1)
+
+    def _open(self) -> None:
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+        self._set_state(OPEN)
+
+    def _set_state(self, state: str) -> None:
+        if state == self.state:
+            return
+        log = logger.info if state == CLOSED else logger.warning
+        log(
+            f"Circuit breaker for {self.family} {self.state} -> {state} after {self.failures} failures"
+        )
+        self.state = state
+        if state != HALF_OPEN:
+            self._trials = 0
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "times_opened": self.times_opened,
+                "retry_after": self.retry_after() if self.state == OPEN else 0.0,
+            }
@@ -0,0 +1,73 @@
+import gzip
+import zlib
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import httpx
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional, pip install pyphrase[brotli]
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional, pip install pyphrase[zstd]
+    zstandard = None
+
+
+@lru_cache(maxsize=None)
+def _httpx_decodes(encoding: str) -> bool:
+    """
+    Whether httpx decodes response bodies in the encoding, e.g. zstd only from httpx 0.27.1. Checked by
+    decoding a small body, httpx passes bodies in encodings it does not know through unchanged.
+    """
+    probe = b"pyphrase"
+    response = httpx.Response(
+        200, headers={"Content-Encoding": encoding}, content=compress(probe, encoding)
+    )
+    try:
+        return response.content == probe
+    except httpx.DecodingError:
+        return False
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """
+    Content encodings that can be both sent and decoded here, most compact first
+    """
+    encodings = []
+    if zstandard is not None and _httpx_decodes("zstd"):
+        encodings.append("zstd")
+    if brotli is not None and _httpx_decodes("br"):
+        encodings.append("br")
+    encodings.extend(["gzip", "deflate"])
+    return tuple(encodings)
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """
+    Compress a request body
+
+    :param data: bytes - body to compress
+    :param encoding: string - gzip, deflate, br or zstd
+    :param level: int (optional) - compression level, defaults to 6 for gzip and deflate, 3 for zstd
+        and the encoder default for br
+    """
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=6 if level is None else level)
+    if encoding == "deflate":
+        return zlib.compress(data, -1 if level is None else level)
+    if encoding == "br" and brotli is not None:
+        if level is None:
+            return brotli.compress(data)
+        return brotli.compress(data, quality=level)
+    if encoding == "zstd" and zstandard is not None:
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return compressor.compress(data)
+    raise ValueError(
+        f"Unsupported content encoding {encoding!r}, available: {', '.join(available_encodings())}"
+    )
@@ -0,0 +1,155 @@
+import asyncio
+import time
+from typing import Optional
+
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(
+        self,
+        initial: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        latency_threshold: Optional[float] = None,
+        smoothing: float = 0.05,
+        baseline_smoothing: float = 0.002,
+        warmup: int = 20,
+    ):
+        """
+        Limit on the number of requests in flight that adapts with additive increase, multiplicative decrease (AIMD).
+
+        Every healthy response grows the window by increase / window, so roughly by `increase` per round trip
+        of the whole window. A 429 or 5xx response, a transport error or rising latency shrinks the window
+        by decrease_factor, at most once per smoothed latency so that one burst of failures counts once.
+
+        Latency is judged on averages rather than single responses, a few slow calls are normal. It is rising when
+        the smoothed latency of recent responses exceeds latency_tolerance times the long-term baseline, or
+        latency_threshold seconds.
+
+        :param initial: int - starting window
+        :param min_limit: int - smallest window
+        :param max_limit: int - largest window
+        :param increase: float - window growth per round trip while healthy
+        :param decrease_factor: float - factor applied to the window on congestion
+        :param latency_tolerance: float - ratio of the smoothed to the baseline latency that counts as congestion
+        :param latency_threshold: float (optional) - smoothed latency in seconds that counts as congestion
+        :param smoothing: float - weight of a new sample in the smoothed latency
+        :param baseline_smoothing: float - weight of a new sample in the baseline latency, much smaller than smoothing
+        :param warmup: int - responses to observe before latency can signal congestion
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.latency_threshold = latency_threshold
+        self.smoothing = smoothing
+        self.baseline_smoothing = baseline_smoothing
+        self.warmup = warmup
+        self._window = float(min(max(initial, min_limit), max_limit))
+        self.in_flight = 0
+        self.samples = 0
+        self.smoothed_latency: Optional[float] = None
+        self.baseline_latency: Optional[float] = None
+        self.decreases = 0
+        self._last_decrease = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+
+    @property
+    def window(self) -> int:
+        """
+        Number of requests currently allowed in flight
+        """
+        return int(self._window)
+
+    def _get_condition(self) -> asyncio.Condition:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < self.window)
+            self.in_flight += 1
+
+    async def release(self, latency: float, congested: bool) -> None:
+        """
+        Return a slot and adapt the window to how the request went
+
+        :param latency: float - seconds the request took
+        :param congested: bool - the server signalled overload (429, 5xx or transport error)
+        """
+        if not congested:
+            # Throttled and failed calls return early, their latency says nothing about the backend's speed
+            self._record_latency(latency)
+        if congested or self.latency_rising():
+            self._decrease(latency)
+        else:
+            self._window = min(
+                float(self.max_limit), self._window + self.increase / self._window
+            )
+
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight -= 1
+            condition.notify_all()
+
+    async def cancel(self) -> None:
+        """
+        Return the slot of a request that was cancelled, e.g. the losing call of a hedge, without adapting the window
+        """
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight -= 1
+            condition.notify_all()
+
+    def latency_rising(self) -> bool:
+        """
+        Whether recent responses are markedly slower than usual
+        """
+        if self.samples < self.warmup or self.smoothed_latency is None:
+            return False
+        if (
+            self.latency_threshold is not None
+            and self.smoothed_latency > self.latency_threshold
+        ):
+            return True
+        return self.smoothed_latency > self.baseline_latency * self.latency_tolerance
+
+    def _record_latency(self, latency: float) -> None:
+        self.samples += 1
+        if self.smoothed_latency is None or self.baseline_latency is None:
+            self.smoothed_latency = self.baseline_latency = latency
+            return
+        # Plain averages over the first samples, so that a slow first call does not skew the baseline for long
+        average = 1 / self.samples
+        self.smoothed_latency += max(self.smoothing, average) * (
+            latency - self.smoothed_latency
+        )
+        self.baseline_latency += max(self.baseline_smoothing, average) * (
+            latency - self.baseline_latency
+        )
+
+    def _decrease(self, latency: float) -> None:
+        now = time.monotonic()
+        # Before any healthy response, the failed call's own latency stands in for the round trip
+        round_trip = (
+            self.smoothed_latency if self.smoothed_latency is not None else latency
+        )
+        if now - self._last_decrease < round_trip:
+            return
+        self._last_decrease = now
+        self._window = max(float(self.min_limit), self._window * self.decrease_factor)
+        self.decreases += 1
+
+    def snapshot(self) -> dict:
+        return {
+            "window": self.window,
+            "in_flight": self.in_flight,
+            "smoothed_latency": self.smoothed_latency,
+            "baseline_latency": self.baseline_latency,
+            "decreases": self.decreases,
+        }
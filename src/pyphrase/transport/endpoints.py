@@ -0,0 +1,89 @@
+import asyncio
+import logging
+import statistics
+import time
+from typing import Dict, Optional, Sequence
+
+import httpx
+
+MEMSOURCE_BASE_URL = "https://cloud.memsource.com/web"
+MEMSOURCE_US_BASE_URL = "https://us.cloud.memsource.com/web"
+
+# Data centers by region
+PHRASE_TMS_ENDPOINTS = {"eu": MEMSOURCE_BASE_URL, "us": MEMSOURCE_US_BASE_URL}
+
+# Answers quickly without a token (401), so only the round trip is measured
+PROBE_PATH = "/api2/v1/auth/whoAmI"
+
+logger = logging.getLogger(__name__)
+
+
+def _probe_result(endpoint: str, rtts: list) -> Optional[float]:
+    if not rtts:
+        logger.warning(f"Endpoint {endpoint} is not reachable")
+        return None
+    return statistics.median(rtts)
+
+
+def probe_endpoints(
+    http_client: httpx.Client,
+    endpoints: Sequence[str],
+    attempts: int = 3,
+    timeout: float = 5.0,
+) -> Dict[str, Optional[float]]:
+    """
+    Round trip time of each endpoint, the median of `attempts` requests, or None if it could not be reached.
+    The first request also opens the connection, so later calls measure the latency of a pooled connection.
+
+    :param http_client: httpx.Client - client to send the probes with, so proxies and transports apply
+    :param endpoints: list of strings - base URLs, e.g. PHRASE_TMS_ENDPOINTS.values()
+    """
+    results = {}
+    for endpoint in endpoints:
+        rtts = []
+        for _ in range(attempts):
+            started = time.monotonic()
+            try:
+                http_client.get(f"{endpoint}{PROBE_PATH}", timeout=timeout)
+            except httpx.HTTPError as e:
+                logger.debug(f"Probe of {endpoint} failed: {e!r}")
+                break
+            rtts.append(time.monotonic() - started)
+        results[endpoint] = _probe_result(endpoint, rtts)
+    return results
+
+
+async def aprobe_endpoints(
+    http_client: httpx.AsyncClient,
+    endpoints: Sequence[str],
+    attempts: int = 3,
+    timeout: float = 5.0,
+) -> Dict[str, Optional[float]]:
+    """
+    Async version of probe_endpoints, the endpoints are probed concurrently
+    """
+
+    async def probe(endpoint: str) -> Optional[float]:
+        rtts = []
+        for _ in range(attempts):
+            started = time.monotonic()
+            try:
+                await http_client.get(f"{endpoint}{PROBE_PATH}", timeout=timeout)
+            except httpx.HTTPError as e:
+                logger.debug(f"Probe of {endpoint} failed: {e!r}")
+                break
+            rtts.append(time.monotonic() - started)
+        return _probe_result(endpoint, rtts)
+
+    rtts = await asyncio.gather(*(probe(endpoint) for endpoint in endpoints))
+    return dict(zip(endpoints, rtts))
+
+
+def fastest_endpoint(rtts: Dict[str, Optional[float]]) -> Optional[str]:
+    """
+    Reachable endpoint with the lowest round trip time, None if none was reachable
+    """
+    reachable = {endpoint: rtt for endpoint, rtt in rtts.items() if rtt is not None}
+    if not reachable:
+        return None
+    return min(reachable, key=reachable.get)
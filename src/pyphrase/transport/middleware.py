@@ -0,0 +1,826 @@
+import asyncio
+import json
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from typing import Callable, Dict, Optional, Sequence, Set, Tuple
+
+import httpx
+
+from ..exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    NotAuthenticatedError,
+)
+from .circuit_breaker import CircuitBreaker, endpoint_family
+from .compression import available_encodings, compress
+from .concurrency import AdaptiveConcurrencyLimiter
+from .pipeline import (
+    DEFAULT_TIMEOUT,
+    UPLOAD_TIMEOUT,
+    AsyncSendFunction,
+    Middleware,
+    RequestContext,
+    SendFunction,
+)
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+from .streaming import UploadBody
+from .timeouts import TimeoutPolicy
+
+
+class AuthMiddleware(Middleware):
+    """
+    Sends the token of the call as Authorization header
+    """
+
+    def _authorize(self, context: RequestContext) -> None:
+        if context.token is None:
+            raise NotAuthenticatedError
+        context.headers["Authorization"] = context.token
+
+    def handle(
+        self, context: RequestContext, call_next: SendFunction
+    ) -> httpx.Response:
+        self._authorize(context)
+        return call_next(context)
+
+    async def ahandle(
+        self, context: RequestContext, call_next: AsyncSendFunction
+    ) -> httpx.Response:
+        self._authorize(context)
+        return await call_next(context)
+
+
+class RetryMiddleware(Middleware):
+    def __init__(self, policy: Optional[RetryPolicy] = None):
+        """
+        Sends the call again according to the retry policy. The last response is returned as it is,
+        raising for error responses is left to the client.
+        """
+        self.policy = policy or RetryPolicy()
+
+    def _new_state(self, context: RequestContext):
+        if not context.replayable:
+            return RetryPolicy.disabled().new_state()
+        return self.policy.new_state(context.deadline)
+
+    def handle(
+        self, context: RequestContext, call_next: SendFunction
+    ) -> httpx.Response:
+        retry_state = self._new_state(context)
+        while True:
+            try:
+                response = call_next(context)
+            except httpx.TransportError as exc:
+                delay = retry_state.delay_for_exception(context.method, exc)
+                if delay is None:
+                    raise
+            else:
+                if not response.is_error:
+                    return response
+                delay = retry_state.delay_for_response(response)
+                if delay is None:
+                    return response
+                response.read()
+                response.close()
+            time.sleep(delay)
+            context.attempt += 1
+
+    async def ahandle(
+        self, context: RequestContext, call_next: AsyncSendFunction
+    ) -> httpx.Response:
+        retry_state = self._new_state(context)
+        while True:
+            try:
+                response = await call_next(context)
+            except httpx.TransportError as exc:
+                delay = retry_state.delay_for_exception(context.method, exc)
+                if delay is None:
+                    raise
+            else:
+                if not response.is_error:
+                    return response
+                delay = retry_state.delay_for_response(response)
+                if delay is None:
+                    return response
+                await response.aread()
+                await response.aclose()
+            await asyncio.sleep(delay)
+            context.attempt += 1
+
+
+class RateLimitMiddleware(Middleware):
+    def __init__(self, limiter: RateLimiter):
+        """
+        Waits for the rate limiter before every attempt
+        """
+        self.limiter = limiter
+
+    def handle(
+        self, context: RequestContext, call_next: SendFunction
+    ) -> httpx.Response:
+        self.limiter.acquire(context.path, context.token)
+        return call_next(context)
+
+    async def ahandle(
+        self, context: RequestContext, call_next: AsyncSendFunction
+    ) -> httpx.Response:
+        await self.limiter.acquire_async(context.path, context.token)
+        return await call_next(context)
+
+
+class ConcurrencyMiddleware(Middleware):
+    def __init__(self, limiter: AdaptiveConcurrencyLimiter):
+        """
+        Holds a slot of the adaptive concurrency limiter while a request is in flight. Async client only,
+        sync calls pass through unchanged.
+        """
+        self.limiter = limiter
+
+    async def ahandle(
+        self, context: RequestContext, call_next: AsyncSendFunction
+    ) -> httpx.Response:
+        await self.limiter.acquire()
+        started = time.monotonic()
+        congested = True
+        try:
+            response = await call_next(context)
+            congested = response.status_code == 429 or response.status_code >= 500
+        except asyncio.CancelledError:
+            # A cancelled call, e.g. the losing call of a hedge, says nothing about congestion
+            await self.limiter.cancel()
+            raise
+        except BaseException:
+            await self.limiter.release(time.monotonic() - started, congested)
+            raise
+        await self.limiter.release(time.monotonic() - started, congested)
+        return response
+
+
+def _response_bytes_saved(context: RequestContext, response: httpx.Response) -> int:
+    """
+    Difference between the decoded body and the encoded body on the wire, 0 for uncompressed and streamed responses
+    """
+    if (
+        context.stream
+        or response.headers.get("Content-Encoding", "identity") == "identity"
+    ):
+        return 0
+    wire = response.num_bytes_downloaded or int(
+        response.headers.get("Content-Length", 0)
+    )
+    if not wire:
+        return 0
+    return max(0, len(response.content) - wire)
+
+
+class CircuitBreakerMiddleware(Middleware):
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        failure_status_codes: Sequence[int] = (500, 502, 503, 504),
+        thresholds: Optional[Dict[str, int]] = None,
+        family: Callable[[str], str] = endpoint_family,
+    ):
+        """
+        One circuit breaker per endpoint family. While the breaker of a family is open, its calls fail fast with
+        CircuitOpenError instead of being sent. Failures are transport errors and failure_status_codes,
+        every attempt of a retried call counts. Can be shared between clients.
+
+        :param failure_threshold: int - failures in a row that open a breaker
+        :param recovery_timeout: float - seconds a breaker stays open before a trial call is let through
+        :param half_open_max_calls: int - trial calls let through at the same time while half-open
+        :param failure_status_codes: list of ints - response status codes counted as failures
+        :param thresholds: dict of family to int (optional) - failure_threshold of particular families,
+            e.g. {"transMemories/*/search": 3}
+        :param family: callable (optional) - maps a request path to its family, defaults to endpoint_family
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_status_codes = set(failure_status_codes)
+        self.thresholds = thresholds or {}
+        self.family = family
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, path: str) -> CircuitBreaker:
+        family = self.family(path)
+        with self._lock:
+            breaker = self.breakers.get(family)
+            if breaker is None:
+                breaker = self.breakers[family] = CircuitBreaker(
+                    family,
+                    failure_threshold=self.thresholds.get(
+                        family, self.failure_threshold
+                    ),
+                    recovery_timeout=self.recovery_timeout,
+                    half_open_max_calls=self.half_open_max_calls,
+                )
+        return breaker
+
+    def _allow(self, context: RequestContext) -> CircuitBreaker:
+        breaker = self.breaker(context.path)
+        if not breaker.allow():
+            retry_after = breaker.retry_after()
+            raise CircuitOpenError(
+                f"Circuit breaker for {breaker.family} is open, {context.method} {context.url} not sent "
+                f"(retry in {retry_after:.1f}s)",
+                family=breaker.family,
+                retry_after=retry_after,
+            )
+        return breaker
+
+    def _record(self, breaker: CircuitBreaker, response: httpx.Response) -> None:
+        if response.status_code in self.failure_status_codes:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+    def handle(
+        self, context: RequestContext, call_next: SendFunction
+    ) -> httpx.Response:
+        breaker = self._allow(context)
+        try:
+            response = call_next(context)
+        except httpx.TransportError:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        self._record(breaker, response)
+        return response
+
+    async def ahandle(
+        self, context: RequestContext, call_next: AsyncSendFunction
+    ) -> httpx.Response:
+        breaker = self._allow(context)
+        try:
+            response = await call_next(context)
+        except httpx.TransportError:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        self._record(breaker, response)
+        return response
+
+    def reset(self) -> None:
+        with self._lock:
+            self.breakers.clear()
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        State of the breaker of every family seen so far
+        """
+        with self._lock:
+            breakers = list(self.breakers.values())
+        return {breaker.family: breaker.snapshot() for breaker in breakers}
+
+
+class HedgeAdmissionMiddleware(Middleware):
+    """
+    Marks the moment a call has passed the rate and concurrency limiters, so that HedgingMiddleware times
+    the call from there. Belongs after the limiters, see HedgingMiddleware.admission.
+    """
+
+    def __init__(self):
+        self.seen = False
+
+    async def ahandle(
+        self, context: RequestContext, call_next: AsyncSendFunction
+    ) -> httpx.Response:
+        self.seen = True
+        context.extensions["admitted_at"] = time.monotonic()
+        admitted = context.extensions.get("admitted")
+        if admitted is not None:
+            admitted.set()
+        return await call_next(context)
+
+
+class HedgingMiddleware(Middleware):
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_delay: float = 0.05,
+        min_samples: int = 20,
+        max_hedge_ratio: float = 0.1,
+        methods: Sequence[str] = ("GET", "HEAD"),
+        latency_samples: int = 200,
+    ):
+        """
+        Sends a duplicate of a slow idempotent call, async client only. When a call of an endpoint family has not
+        been answered within the given percentile of the family's recent latencies, the same call is sent once more,
+        the first response wins and the other call is cancelled. The duplicate goes through the rate limiter and
+        the rest of the chain like any other call, and is counted as hedged_requests by MetricsMiddleware.
+        Streamed downloads are not hedged.
+
+        Latencies are measured from the moment a call passes the limiters, time spent waiting for the rate limiter
+        or a concurrency slot neither counts nor triggers a duplicate. This needs self.admission placed after
+        the limiters in the chain, as AsyncPhraseTMSClient does, otherwise calls are timed from this middleware.
+
+        :param percentile: float - percentile of recent latencies after which the duplicate is sent
+        :param min_delay: float - shortest delay before a duplicate is sent, in seconds
+        :param min_samples: int - latencies of a family needed before its calls are hedged
+        :param max_hedge_ratio: float - most duplicates per call, caps the extra load on the server
+        :param methods: list of strings - HTTP methods that are hedged
+        :param latency_samples: int - recent latencies kept per family
+        """
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.methods = {m.upper() for m in methods}
+        self.latency_samples = latency_samples
+        self.admission = HedgeAdmissionMiddleware()
+        self.latencies: Dict[str, deque] = {}
+        self.calls = 0
+        self.hedges = 0
+        self.hedges_won = 0
+
+    def _delay(self, family: str) -> Optional[float]:
+        samples = self.latencies.get(family)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        if self.hedges >= self.calls * self.max_hedge_ratio:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return max(self.min_delay, ordered[index])
+
+    def _record(self, family: str, latency: float) -> None:
+        samples = self.latencies.get(family)
+        if samples is None:
+            samples = self.latencies[family] = deque(maxlen=self.latency_samples)
+        samples.append(latency)
+
+    async def _hedge_after(
+        self, context: RequestContext, primary: asyncio.Future, delay: float
+    ) -> bool:
+        """
+        Wait until the primary call has been admitted and delay has passed since, False if it completed first
+        """
+        if self.admission.seen:
+            admitted = asyncio.ensure_future(context.extensions["admitted"].wait())
+            try:
+                await asyncio.wait(
+                    {primary, admitted}, return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                admitted.cancel()
+            if primary.done():
+                return False
+        started = context.extensions.get("admitted_at", time.monotonic())
+        remaining = started + delay - time.monotonic()
+        if remaining > 0:
+            await asyncio.wait({primary}, timeout=remaining)
+        return not primary.done()
+
+    async def ahandle(
+        self, context: RequestContext, call_next: AsyncSendFunction
+    ) -> httpx.Response:
+        if context.method not in self.methods or context.stream:
+            return await call_next(context)
+
+        family = endpoint_family(context.path)
+        delay = self._delay(family)
+        self.calls += 1
+        entered = time.monotonic()
+        # Fresh for every attempt of a retried call
+        context.extensions.pop("admitted_at", None)
+        context.extensions["admitted"] = asyncio.Event()
+        primary = asyncio.ensure_future(call_next(context))
+        calls = {primary: context}
+        tasks = {primary}
+        try:
+            if delay is not None and await self._hedge_after(context, primary, delay):
+                duplicate = context.copy()
+                duplicate.extensions["hedge"] = True
+                hedge = asyncio.ensure_future(call_next(duplicate))
+                calls[hedge] = duplicate
+                tasks.add(hedge)
+                self.hedges += 1
+
+            error = None
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.hedges_won += 1
+                        admitted_at = calls[task].extensions.get("admitted_at", entered)
+                        self._record(family, time.monotonic() - admitted_at)
+                        return task.result()
+                    if task is primary or error is None:
+                        error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def snapshot(self) -> dict:
+        return {
+            "calls": self.calls,
+            "hedges": self.hedges,
+            "hedges_won": self.hedges_won,
+            "delays": {family: self._delay(family) for family in self.latencies},
+        }
+
+
+class TimeoutMiddleware(Middleware):
+    def __init__(self, policy: Optional[TimeoutPolicy] = None):
+        """
+        Resolves the timeout profile of a call and cuts the timeout down to the deadline of the call, if any.
+        Raises DeadlineExceededError once the deadline has passed.
+        """
+        self.policy = policy or TimeoutPolicy()
+
+    def _prepare(self, context: RequestContext) -> None:
+        if context.timeout == DEFAULT_TIMEOUT and (
+            isinstance(context.content, UploadBody) or context.files is not None
+        ):
+            context.timeout = UPLOAD_TIMEOUT
+        context.timeout = self.policy.resolve(
+            context.method, context.path, context.timeout
+        )
+        if context.deadline is None:
+            return
+        if context.deadline.expired:
+            raise DeadlineExceededError(
+                f"Deadline of {context.deadline.seconds}s exceeded before {context.method} {context.url} "
+                f"(attempt {context.attempt})"
+            )
+        context.timeout = context.deadline.clamp(context.timeout)
+
+    def _deadline_error(
+        self, context: RequestContext, exc: httpx.TimeoutException
+    ) -> Optional[DeadlineExceededError]:
+        if context.deadline is None or not context.deadline.expired:
+            return None
+        return DeadlineExceededError(
+            f"Deadline of {context.deadline.seconds}s exceeded during {context.method} {context.url}: {exc!r}"
+        )
+
+    def handle(
+        self, context: RequestContext, call_next: SendFunction
+    ) -> httpx.Response:
+        self._prepare(context)
+        try:
+            return call_next(context)
+        except httpx.TimeoutException as exc:
+            error = self._deadline_error(context, exc)
+            if error is None:
+                raise
+            raise error from exc
+
+    async def ahandle(
+        self, context: RequestContext, call_next: AsyncSendFunction
+    ) -> httpx.Response:
+        self._prepare(context)
+        try:
+            return await call_next(context)
+        except httpx.TimeoutException as exc:
+            error = self._deadline_error(context, exc)
+            if error is None:
+                raise
+            raise error from exc
+
+
+class MetricsMiddleware(Middleware):
+    def __init__(self, latency_samples: int = 1000):
+        """
+        Counts requests, responses and bytes, and keeps the latency of recent requests.
+        Every attempt of a retried call is counted.
+
+        :param latency_samples: int - number of recent latencies kept for percentiles
+        """
+        self.requests = 0
+        self.retries = 0
+        self.transport_errors = 0
+        self.status_codes = Counter()
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.hedged_requests = 0
+        self.request_bytes_saved = 0
+        self.response_bytes_saved = 0
+        self.total_latency = 0.0
+        self.latencies = deque(maxlen=latency_samples)
+        self._lock = threading.Lock()
+
+    def _record(
+        self,
+        context: RequestContext,
+        started: float,
+        response: Optional[httpx.Response],
+    ) -> None:
+        latency = time.monotonic() - started
+        with self._lock:
+            self.requests += 1
+            if context.attempt > 1:
+                self.retries += 1
+            if context.extensions.get("hedge"):
+                self.hedged_requests += 1
+            self.total_latency += latency
+            self.latencies.append(latency)
+            if response is None:
+                self.transport_errors += 1
+                return
+            self.status_codes[response.status_code] += 1
+            self.bytes_sent += int(response.request.headers.get("Content-Length", 0))
+            self.bytes_received += response.num_bytes_downloaded
+            compressed = context.extensions.get("request_compression")
+            if compressed is not None:
+                self.request_bytes_saved += compressed[0] - compressed[1]
+            self.response_bytes_saved += _response_bytes_saved(context, response)
+
+    def handle(
+        self, context: RequestContext, call_next: SendFunction
+    ) -> httpx.Response:
+        started = time.monotonic()
+        response = None
+        try:
+            response = call_next(context)
+            return response
+        finally:
+            self._record(context, started, response)
+
+    async def ahandle(
+        self, context: RequestContext, call_next: AsyncSendFunction
+    ) -> httpx.Response:
+        started = time.monotonic()
+        response = None
+        try:
+            response = await call_next(context)
+            return response
+        finally:
+            self._record(context, started, response)
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """
+        Latency in seconds below which the given percentage (0-100) of the recent requests completed
+        """
+        with self._lock:
+            samples = sorted(self.latencies)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * percentile / 100))
+        return samples[index]
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "hedged_requests": self.hedged_requests,
+                "transport_errors": self.transport_errors,
+                "status_codes": dict(self.status_codes),
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "request_bytes_saved": self.request_bytes_saved,
+                "response_bytes_saved": self.response_bytes_saved,
+                "average_latency": (
+                    self.total_latency / self.requests if self.requests else None
+                ),
+            }
+
+
+def _request_key(context: RequestContext, methods: Set[str]) -> Optional[Tuple]:
+    """
+    Identity of a call without a body, for sharing its response. None for other methods and streamed calls
+    """
+    if context.method not in methods or context.stream:
+        return None
+    params = tuple(sorted((k, str(v)) for k, v in context.params.items()))
+    return context.method, context.url, params, context.token
+
+
+class CacheMiddleware(Middleware):
+    def __init__(self, ttl: float = 30.0, max_entries: int = 1024):
+        """
+        Keeps successful GET responses for ttl seconds, keyed by URL, query parameters and token.
+        Streamed downloads are not cached.
+
+        :param ttl: float - seconds a response is reused
+        :param max_entries: int - least recently used responses are dropped beyond this
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, Tuple[float, httpx.Response]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: Tuple) -> Optional[httpx.Response]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def _store(self, key: Tuple, response: httpx.Response) -> None:
+        if response.is_error:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def handle(
+        self, context: RequestContext, call_next: SendFunction
+    ) -> httpx.Response:
+        key = _request_key(context, {"GET"})
+        if key is None:
+            return call_next(context)
+        response = self._lookup(key)
+        if response is None:
+            response = call_next(context)
+            self._store(key, response)
+        return response
+
+    async def ahandle(
+        self, context: RequestContext, call_next: AsyncSendFunction
+    ) -> httpx.Response:
+        key = _request_key(context, {"GET"})
+        if key is None:
+            return await call_next(context)
+        response = self._lookup(key)
+        if response is None:
+            response = await call_next(context)
+            self._store(key, response)
+        return response
+
+
+class _InflightCall:
+    def __init__(self):
+        self.done = threading.Event()
+        self.response: Optional[httpx.Response] = None
+        self.error: Optional[BaseException] = None
+
+
+class CoalescingMiddleware(Middleware):
+    def __init__(self, methods: Sequence[str] = ("GET", "HEAD")):
+        """
+        Shares one network call among identical calls in flight at the same time (singleflight), keyed by
+        method, URL, query parameters and token. Callers that arrive while the call is running get its response,
+        or its exception. Streamed downloads are not shared.
+
+        :param methods: list of strings - HTTP methods without a body whose calls are shared
+        """
+        self.methods = {m.upper() for m in methods}
+        self.coalesced = 0
+        self._calls: Dict[Tuple, _InflightCall] = {}
+        self._tasks: Dict[Tuple, asyncio.Task] = {}
+        self._lock = threading.Lock()
+
+    def handle(
+        self, context: RequestContext, call_next: SendFunction
+    ) -> httpx.Response:
+        key = _request_key(context, self.methods)
+        if key is None:
+            return call_next(context)
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _InflightCall()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.response
+
+        try:
+            call.response = call_next(context)
+            return call.response
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def ahandle(
+        self, context: RequestContext, call_next: AsyncSendFunction
+    ) -> httpx.Response:
+        key = _request_key(context, self.methods)
+        if key is None:
+            return await call_next(context)
+
+        task = self._tasks.get(key)
+        if task is None:
+            # A task of its own, so that the call goes on for the others if the first caller is cancelled
+            task = asyncio.ensure_future(call_next(context))
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def snapshot(self) -> dict:
+        return {
+            "coalesced": self.coalesced,
+            "in_flight": len(self._calls) + len(self._tasks),
+        }
+
+
+class CompressionMiddleware(Middleware):
+    def __init__(
+        self,
+        accept_encodings: Optional[Sequence[str]] = None,
+        min_request_size: Optional[int] = None,
+        request_encoding: str = "gzip",
+        level: Optional[int] = None,
+    ):
+        """
+        Asks for compressed responses, and compresses JSON and bytes request bodies of at least min_request_size
+        bytes. Uploads streamed from files or iterators and multipart bodies are sent as they are. The bytes saved
+        are counted by MetricsMiddleware.
+
+        :param accept_encodings: list of strings (optional) - encodings offered in Accept-Encoding, in order of
+            preference. Defaults to every encoding available here: zstd (pip install pyphrase[zstd]),
+            br (pip install pyphrase[brotli]), gzip and deflate
+        :param min_request_size: int (optional) - smallest request body that is compressed, request bodies
+            are not compressed if not given
+        :param request_encoding: string - gzip, deflate, br or zstd, the server has to accept it
+        :param level: int (optional) - compression level, see compression.compress
+        """
+        available = available_encodings()
+        if accept_encodings is None:
+            accept_encodings = available
+        unsupported = [e for e in accept_encodings if e not in available]
+        if unsupported or request_encoding not in available:
+            raise ValueError(
+                f"Unsupported content encoding {unsupported or request_encoding}, available: {', '.join(available)}"
+            )
+        self.accept_encoding = ", ".join(accept_encodings)
+        self.min_request_size = min_request_size
+        self.request_encoding = request_encoding
+        self.level = level
+
+    def _compress_request(self, context: RequestContext) -> None:
+        if (
+            self.min_request_size is None
+            or context.files is not None
+            or "Content-Encoding" in context.headers
+        ):
+            return
+        if context.json is not None:
+            # Serialized like httpx does for json=
+            body = json.dumps(
+                context.json, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+            ).encode("utf-8")
+        elif isinstance(context.content, bytes):
+            body = context.content
+        else:
+            return
+        if len(body) < self.min_request_size:
+            return
+
+        compressed = compress(body, self.request_encoding, self.level)
+        if len(compressed) >= len(body):
+            return
+        if context.json is not None:
+            context.headers.setdefault("Content-Type", "application/json")
+            context.json = None
+        context.content = compressed
+        context.headers["Content-Encoding"] = self.request_encoding
+        context.extensions["request_compression"] = (len(body), len(compressed))
+
+    def _prepare(self, context: RequestContext) -> None:
+        context.headers.setdefault("Accept-Encoding", self.accept_encoding)
+        self._compress_request(context)
+
+    def handle(
+        self, context: RequestContext, call_next: SendFunction
+    ) -> httpx.Response:
+        self._prepare(context)
+        return call_next(context)
+
+    async def ahandle(
+        self, context: RequestContext, call_next: AsyncSendFunction
+    ) -> httpx.Response:
+        self._prepare(context)
+        return await call_next(context)
@@ -0,0 +1,274 @@
+# Paths of api_yaml/memsource-api.yaml with the API version left out and parameters replaced by *.
+# Regenerate together with the tag modules when the spec changes.
+PATH_TEMPLATES = (
+    "additionalWorkflowSteps",
+    "additionalWorkflowSteps/*",
+    "analyses",
+    "analyses/*",
+    "analyses/*/analyseLanguageParts/*",
+    "analyses/*/analyseLanguageParts/*/jobs",
+    "analyses/*/download",
+    "analyses/*/jobs/*",
+    "analyses/bulk",
+    "analyses/byLanguages",
+    "analyses/byProviders",
+    "analyses/recalculate",
+    "async",
+    "async/*",
+    "async/status",
+    "auth/login",
+    "auth/loginOther",
+    "auth/loginToSession",
+    "auth/loginWithApple/code",
+    "auth/loginWithApple/refreshToken",
+    "auth/loginWithGoogle",
+    "auth/logout",
+    "auth/refreshAppleToken",
+    "auth/whoAmI",
+    "bilingualFiles",
+    "bilingualFiles/compare",
+    "bilingualFiles/convert",
+    "bilingualFiles/preview",
+    "businessUnits",
+    "businessUnits/*",
+    "clients",
+    "clients/*",
+    "connectors",
+    "connectors/*",
+    "connectors/*/folders",
+    "connectors/*/folders/*",
+    "connectors/*/folders/*/files/*",
+    "connectors/*/folders/*/files/*/tasks/*",
+    "connectors/*/folders/*/files/*/upload",
+    "costCenters",
+    "costCenters/*",
+    "customFields",
+    "customFields/*",
+    "customFields/*/options",
+    "customFileTypes",
+    "customFileTypes/*",
+    "customFileTypes/find",
+    "domains",
+    "domains/*",
+    "emailTemplates",
+    "emailTemplates/*",
+    "files",
+    "files/*",
+    "glossaries",
+    "glossaries/*",
+    "glossaries/*/activate",
+    "importSettings",
+    "importSettings/*",
+    "importSettings/default",
+    "jobs",
+    "jobs/*/conversations",
+    "jobs/*/conversations/lqas",
+    "jobs/*/conversations/lqas/*",
+    "jobs/*/conversations/lqas/*/comments",
+    "jobs/*/conversations/lqas/*/comments/*",
+    "jobs/*/conversations/plains",
+    "jobs/*/conversations/plains/*",
+    "jobs/*/conversations/plains/*/comments",
+    "jobs/*/conversations/plains/*/comments/*",
+    "jobs/conversations/find",
+    "jobs/workflowChanges",
+    "languages",
+    "lqa/assessments/reports",
+    "lqa/profiles",
+    "lqa/profiles/*",
+    "lqa/profiles/*/default",
+    "lqa/profiles/*/duplicate",
+    "lqa/profiles/authors",
+    "lqa/profiles/defaultValues",
+    "machineTranslateSettings",
+    "machineTranslateSettings/*",
+    "machineTranslateSettings/*/status",
+    "machineTranslateSettings/thirdPartyEngines",
+    "machineTranslateSettings/types",
+    "machineTranslations/*/translate",
+    "mappings/tasks/*",
+    "mtuUsage",
+    "netRateSchemes",
+    "netRateSchemes/*",
+    "netRateSchemes/*/workflowStepNetSchemes",
+    "netRateSchemes/*/workflowStepNetSchemes/*",
+    "priceLists",
+    "priceLists/*",
+    "priceLists/*/priceSets",
+    "priceLists/*/priceSets/*/*",
+    "priceLists/*/priceSets/minimumPrices",
+    "priceLists/*/priceSets/prices",
+    "projectTemplates",
+    "projectTemplates/*",
+    "projectTemplates/*/accessSettings",
+    "projectTemplates/*/analyseSettings",
+    "projectTemplates/*/customFields",
+    "projectTemplates/*/customFields/*",
+    "projectTemplates/*/importSettings",
+    "projectTemplates/*/mtSettings",
+    "projectTemplates/*/preTranslateSettings",
+    "projectTemplates/*/qaSettings",
+    "projectTemplates/*/termBases",
+    "projectTemplates/*/transMemories",
+    "projectTemplates/*/transMemories/relevant",
+    "projects",
+    "projects/*",
+    "projects/*/accessSettings",
+    "projects/*/analyseSettings",
+    "projects/*/analyses",
+    "projects/*/applyTemplate/*/assignProviders",
+    "projects/*/applyTemplate/*/assignProviders/forJobParts",
+    "projects/*/assignVendor",
+    "projects/*/assignableTemplates",
+    "projects/*/clone",
+    "projects/*/customFields",
+    "projects/*/customFields/*",
+    "projects/*/fileHandovers",
+    "projects/*/fileNamingSettings",
+    "projects/*/financialSettings",
+    "projects/*/importSettings",
+    "projects/*/jobs",
+    "projects/*/jobs/*",
+    "projects/*/jobs/*/analyses",
+    "projects/*/jobs/*/copySourceToTarget",
+    "projects/*/jobs/*/downloadTargetFile/*",
+    "projects/*/jobs/*/importSettings",
+    "projects/*/jobs/*/original",
+    "projects/*/jobs/*/preview",
+    "projects/*/jobs/*/previewUrl",
+    "projects/*/jobs/*/providers/suggest",
+    "projects/*/jobs/*/pseudoTranslate",
+    "projects/*/jobs/*/qualityAssurances/ignoreChecks",
+    "projects/*/jobs/*/qualityAssurances/ignoredWarnings",
+    "projects/*/jobs/*/qualityAssurances/run",
+    "projects/*/jobs/*/qualityAssurances/settings",
+    "projects/*/jobs/*/segments",
+    "projects/*/jobs/*/setStatus",
+    "projects/*/jobs/*/split",
+    "projects/*/jobs/*/statusChanges",
+    "projects/*/jobs/*/targetFile",
+    "projects/*/jobs/*/targetFileWarnings",
+    "projects/*/jobs/*/termBases/createByJob",
+    "projects/*/jobs/*/termBases/searchByJob",
+    "projects/*/jobs/*/termBases/searchInTextByJob",
+    "projects/*/jobs/*/transMemories/search",
+    "projects/*/jobs/*/transMemories/searchSegment",
+    "projects/*/jobs/*/transMemories/wildCardSearch",
+    "projects/*/jobs/*/translationResources",
+    "projects/*/jobs/*/translations/translateWithMachineTranslation",
+    "projects/*/jobs/*/workflowStep",
+    "projects/*/jobs/batch",
+    "projects/*/jobs/bilingualFile",
+    "projects/*/jobs/compare",
+    "projects/*/jobs/connectorTask",
+    "projects/*/jobs/copySourceToTarget",
+    "projects/*/jobs/export",
+    "projects/*/jobs/humanTranslate",
+    "projects/*/jobs/notifyAssigned",
+    "projects/*/jobs/preTranslate",
+    "projects/*/jobs/pseudoTranslate",
+    "projects/*/jobs/qualityAssurances/ignoredWarnings",
+    "projects/*/jobs/qualityAssurances/run",
+    "projects/*/jobs/qualityAssurances/segments/run",
+    "projects/*/jobs/qualityAssurances/settings",
+    "projects/*/jobs/search",
+    "projects/*/jobs/segmentsCount",
+    "projects/*/jobs/source",
+    "projects/*/jobs/target",
+    "projects/*/jobs/translations",
+    "projects/*/jobs/webEditor",
+    "projects/*/lqaSettings",
+    "projects/*/mtSettings",
+    "projects/*/mtSettingsPerLanguage",
+    "projects/*/preTranslateSettings",
+    "projects/*/providers",
+    "projects/*/providers/suggest",
+    "projects/*/qaSettings",
+    "projects/*/qaSettingsChecks",
+    "projects/*/quotes",
+    "projects/*/references",
+    "projects/*/references/*",
+    "projects/*/references/creators",
+    "projects/*/references/download",
+    "projects/*/setStatus",
+    "projects/*/targetLangs",
+    "projects/*/termBases",
+    "projects/*/termBases/relevant",
+    "projects/*/transMemories",
+    "projects/*/transMemories/relevant",
+    "projects/*/transMemories/searchSegmentInProject",
+    "projects/*/workflowSteps",
+    "projects/applyTemplate/*",
+    "projects/applyTemplate/async/*",
+    "quotes",
+    "quotes/*",
+    "quotes/email",
+    "scim/ResourceTypes",
+    "scim/Schemas",
+    "scim/Schemas/*",
+    "scim/ServiceProviderConfig",
+    "scim/Users",
+    "scim/Users/*",
+    "segmentationRules",
+    "segmentationRules/*",
+    "spellCheck/check",
+    "spellCheck/check/*",
+    "spellCheck/suggest",
+    "spellCheck/words",
+    "subDomains",
+    "subDomains/*",
+    "termBases",
+    "termBases/*",
+    "termBases/*/browse",
+    "termBases/*/concepts",
+    "termBases/*/concepts/*",
+    "termBases/*/concepts/*/terms",
+    "termBases/*/export",
+    "termBases/*/lastBackgroundTask",
+    "termBases/*/metadata",
+    "termBases/*/search",
+    "termBases/*/terms",
+    "termBases/*/terms/*",
+    "termBases/*/upload",
+    "transMemories",
+    "transMemories/*",
+    "transMemories/*/export",
+    "transMemories/*/exportByQueryAsync",
+    "transMemories/*/import",
+    "transMemories/*/lastBackgroundTask",
+    "transMemories/*/metadata",
+    "transMemories/*/relatedProjects",
+    "transMemories/*/search",
+    "transMemories/*/segments",
+    "transMemories/*/segments/*",
+    "transMemories/*/segments/*/lang/*",
+    "transMemories/*/targetLanguages",
+    "transMemories/*/wildCardSearch",
+    "transMemories/downloadCleaned/*",
+    "transMemories/downloadExport/*",
+    "transMemories/extractCleaned",
+    "users",
+    "users/*",
+    "users/*/disableTwoFactorAuth",
+    "users/*/emailLoginInformation",
+    "users/*/jobs",
+    "users/*/loginStatistics",
+    "users/*/projects",
+    "users/*/targetLangs",
+    "users/*/undelete",
+    "users/*/updatePassword",
+    "users/*/workflowSteps",
+    "users/lastLogins",
+    "vendors",
+    "vendors/*",
+    "webhooks",
+    "webhooks/*",
+    "webhooks/*/test",
+    "webhooks/previews",
+    "webhooksCalls",
+    "webhooksCalls/replay",
+    "webhooksCalls/replay/latest",
+    "workflowSteps",
+    "workflowSteps/*",
+    "xmlAssistantProfiles",
+)
@@ -0,0 +1,191 @@
+import copy
+import logging
+from functools import partial
+from json import JSONDecodeError
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, Type
+
+import httpx
+
+from .streaming import UploadBody
+from .timeouts import TimeoutValue, current_deadline
+
+# Timeout profiles of TimeoutPolicy
+DEFAULT_TIMEOUT = "default"
+DOWNLOAD_TIMEOUT = "download"
+UPLOAD_TIMEOUT = "upload"
+
+logger = logging.getLogger(__name__)
+
+
+class RequestContext:
+    def __init__(
+        self,
+        method: str,
+        path: str,
+        url: str,
+        token: Optional[str] = None,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        json: Optional[Any] = None,
+        content: Optional[Any] = None,
+        files: Optional[Any] = None,
+        timeout: TimeoutValue = DEFAULT_TIMEOUT,
+        stream: bool = False,
+    ):
+        """
+        A call on its way through the middleware chain. Middlewares may change the request fields, and keep
+        their own state for the call in extensions.
+
+        :param method: string - HTTP method
+        :param path: string - endpoint path as used by the operations, e.g. /api2/v1/projects/{projectUid}
+        :param url: string - full URL of the endpoint
+        :param token: string (optional) - API token of the call
+        :param timeout: TimeoutValue - profile name, resolved by TimeoutMiddleware, or explicit timeout
+        """
+        self.method = method.upper()
+        self.path = path
+        self.url = url
+        self.token = token
+        self.params = {k: v for k, v in (params or {}).items() if v is not None}
+        self.headers = dict(headers or {})
+        self.json = json
+        self.content = content
+        self.files = files
+        self.timeout = timeout
+        self.stream = stream
+        self.attempt = 1
+        self.deadline = current_deadline()
+        self.extensions: dict = {}
+
+        if isinstance(content, UploadBody) and content.length is not None:
+            self.headers.setdefault("Content-Length", str(content.length))
+
+    @property
+    def replayable(self) -> bool:
+        """
+        Whether the request body can be sent more than once
+        """
+        return not isinstance(self.content, UploadBody) or self.content.replayable
+
+    def copy(self) -> "RequestContext":
+        """
+        Independent copy for sending the same call again in parallel, extensions are not carried over
+        """
+        duplicate = copy.copy(self)
+        duplicate.params = dict(self.params)
+        duplicate.headers = dict(self.headers)
+        duplicate.extensions = {}
+        return duplicate
+
+    def request_kwargs(self) -> dict:
+        return {
+            "params": self.params,
+            "headers": self.headers,
+            "json": self.json,
+            "content": self.content,
+            "files": self.files,
+            "timeout": self.timeout,
+        }
+
+
+SendFunction = Callable[[RequestContext], httpx.Response]
+AsyncSendFunction = Callable[[RequestContext], Awaitable[httpx.Response]]
+
+
+class Middleware:
+    """
+    One step of the request pipeline. handle is used by SyncPhraseTMSClient and ahandle by AsyncPhraseTMSClient,
+    both get the context and the rest of the chain, and return the response of the rest of the chain, or
+    one of their own. The default implementations pass the call on unchanged.
+    """
+
+    def handle(
+        self, context: RequestContext, call_next: SendFunction
+    ) -> httpx.Response:
+        return call_next(context)
+
+    async def ahandle(
+        self, context: RequestContext, call_next: AsyncSendFunction
+    ) -> httpx.Response:
+        return await call_next(context)
+
+
+class Pipeline:
+    def __init__(self, middlewares: Sequence[Optional[Middleware]] = ()):
+        """
+        Ordered middleware chain, the first middleware sees the call first and the response last.
+        None entries are skipped, so optional middlewares can be listed in place.
+        """
+        self.middlewares: List[Middleware] = [m for m in middlewares if m is not None]
+
+    def get(self, middleware_class: Type[Middleware]) -> Optional[Middleware]:
+        for middleware in self.middlewares:
+            if isinstance(middleware, middleware_class):
+                return middleware
+        return None
+
+    def add(
+        self,
+        middleware: Middleware,
+        before: Optional[Type[Middleware]] = None,
+    ) -> None:
+        """
+        Add a middleware in front of the first middleware of class before, or last in the chain
+        """
+        if before is not None:
+            for index, existing in enumerate(self.middlewares):
+                if isinstance(existing, before):
+                    self.middlewares.insert(index, middleware)
+                    return
+        self.middlewares.append(middleware)
+
+    def remove(self, middleware_class: Type[Middleware]) -> None:
+        self.middlewares = [
+            m for m in self.middlewares if not isinstance(m, middleware_class)
+        ]
+
+    def send(self, context: RequestContext, send: SendFunction) -> httpx.Response:
+        return self._call(0, send, context)
+
+    def _call(
+        self, index: int, send: SendFunction, context: RequestContext
+    ) -> httpx.Response:
+        if index == len(self.middlewares):
+            return send(context)
+        return self.middlewares[index].handle(
+            context, partial(self._call, index + 1, send)
+        )
+
+    async def asend(
+        self, context: RequestContext, send: AsyncSendFunction
+    ) -> httpx.Response:
+        return await self._acall(0, send, context)
+
+    async def _acall(
+        self, index: int, send: AsyncSendFunction, context: RequestContext
+    ) -> httpx.Response:
+        if index == len(self.middlewares):
+            return await send(context)
+        return await self.middlewares[index].ahandle(
+            context, partial(self._acall, index + 1, send)
+        )
+
+
+def payload_to_dict(payload: Any, exclude_none: bool = False) -> Any:
+    if payload is None or isinstance(payload, (dict, list)):
+        return payload
+    try:
+        return payload.dict(exclude_none=exclude_none)
+    except Exception as e:
+        logger.exception(f"Payload could not be cast as dict: {e}")
+        raise TypeError(f"Payload could not be cast as dict: {e}") from e
+
+
+def response_json(response: httpx.Response) -> Optional[Any]:
+    """
+    Decoded JSON body, or None for empty and non-JSON bodies
+    """
+    try:
+        return response.json()
+    except (JSONDecodeError, UnicodeDecodeError):
+        return None
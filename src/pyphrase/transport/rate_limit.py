@@ -0,0 +1,190 @@
+import asyncio
+import hashlib
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        """
+        Token bucket that hands out reservations instead of refusing callers.
+
+        A reservation always succeeds and may leave the bucket in debt, the caller is told how long to wait
+        until its token would have been available. Callers are thereby paced at `rate` per second, after an
+        initial burst of `capacity`.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def reserve(self, tokens: float = 1.0, now: Optional[float] = None) -> float:
+        """
+        Take tokens from the bucket and return the seconds to wait before using them
+        """
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        self.tokens -= tokens
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    def snapshot(self, now: Optional[float] = None) -> dict:
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        return {"tokens": self.tokens, "rate": self.rate, "capacity": self.capacity}
+
+
+class RateLimiterBackend:
+    """
+    Storage of the token buckets of a RateLimiter. Subclasses decide where the bucket state lives and
+    how access to it is serialized.
+
+    Backends that wait on locks, files or the network set `blocking`, async callers then reserve from a
+    worker thread instead of the event loop.
+    """
+
+    blocking = True
+
+    def reserve(
+        self, key: str, rate: float, capacity: float, tokens: float = 1.0
+    ) -> float:
+        raise NotImplementedError
+
+    def snapshot(self) -> Dict[str, dict]:
+        raise NotImplementedError
+
+
+class InMemoryRateLimiterBackend(RateLimiterBackend):
+    """
+    Buckets kept in this process, shared by all threads and event loops using the limiter
+    """
+
+    blocking = False
+
+    def __init__(self):
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def reserve(
+        self, key: str, rate: float, capacity: float, tokens: float = 1.0
+    ) -> float:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(rate, capacity)
+            return bucket.reserve(tokens)
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {key: bucket.snapshot() for key, bucket in self._buckets.items()}
+
+
+class RateLimitRule:
+    def __init__(self, pattern: str, rate: float, burst: Optional[float] = None):
+        """
+        Separate budget for an endpoint family, on top of the limiter's overall budget
+
+        :param pattern: regular expression searched for in the request path,
+            e.g. "/api2/v1/async" or r"/transMemories/[^/]+/search"
+        :param rate: float - requests per second
+        :param burst: float (optional) - bucket size, defaults to one second worth of requests
+        """
+        self.pattern = pattern
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._regex = re.compile(pattern)
+
+    def matches(self, path: str) -> bool:
+        return self._regex.search(path) is not None
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        rules: Sequence[RateLimitRule] = (),
+        per_token: bool = True,
+        backend: Optional[RateLimiterBackend] = None,
+    ):
+        """
+        Client side pacing of requests, consulted before every request is sent (including retries).
+        One limiter can be shared by several sync and async clients.
+
+        :param rate: float - requests per second allowed overall
+        :param burst: float (optional) - requests that can be sent at once after an idle period,
+            defaults to one second worth of requests
+        :param rules: list of RateLimitRule - additional budgets for endpoint families, the first matching rule applies
+        :param per_token: bool - keep a separate budget per API token, otherwise all tokens share one budget
+        :param backend: RateLimiterBackend (optional) - where the buckets live, defaults to this process
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self.rules = list(rules)
+        self.per_token = per_token
+        self.backend = backend or InMemoryRateLimiterBackend()
+        self.requests = 0
+        self.delayed_requests = 0
+        self.total_delay = 0.0
+
+    @staticmethod
+    def _token_key(token: Optional[str]) -> str:
+        if token is None:
+            return "anonymous"
+        return hashlib.sha256(token.encode()).hexdigest()[:12]
+
+    def _buckets(
+        self, path: str, token: Optional[str]
+    ) -> List[Tuple[str, float, float]]:
+        prefix = self._token_key(token) if self.per_token else "all"
+        buckets = [(prefix, self.rate, self.burst)]
+        for rule in self.rules:
+            if rule.matches(path):
+                buckets.append((f"{prefix}:{rule.pattern}", rule.rate, rule.burst))
+                break
+        return buckets
+
+    def reserve(self, path: str, token: Optional[str] = None) -> float:
+        """
+        Reserve a request to path and return the seconds to wait before sending it
+        """
+        delay = 0.0
+        for key, rate, capacity in self._buckets(path, token):
+            delay = max(delay, self.backend.reserve(key, rate, capacity))
+        self.requests += 1
+        if delay > 0:
+            self.delayed_requests += 1
+            self.total_delay += delay
+        return delay
+
+    def acquire(self, path: str, token: Optional[str] = None) -> None:
+        delay = self.reserve(path, token)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, path: str, token: Optional[str] = None) -> None:
+        if self.backend.blocking:
+            delay = await asyncio.to_thread(self.reserve, path, token)
+        else:
+            delay = self.reserve(path, token)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def snapshot(self) -> dict:
+        """
+        Current state of the buckets (keyed by a hash of the token and the rule pattern) and request counters
+        """
+        return {
+            "buckets": self.backend.snapshot(),
+            "requests": self.requests,
+            "delayed_requests": self.delayed_requests,
+            "total_delay": self.total_delay,
+        }
@@ -0,0 +1,176 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Set
+
+from .rate_limit import RateLimiterBackend, TokenBucket
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+def _reserve_in_state(
+    state: Dict[str, dict],
+    key: str,
+    rate: float,
+    capacity: float,
+    tokens: float,
+    now: float,
+) -> float:
+    bucket = TokenBucket(rate, capacity)
+    stored = state.get(key)
+    if stored is not None:
+        bucket.tokens = stored["tokens"]
+        bucket.updated = stored["updated"]
+    else:
+        bucket.updated = now
+    delay = bucket.reserve(tokens, now=now)
+    state[key] = {
+        "tokens": bucket.tokens,
+        "updated": bucket.updated,
+        "rate": rate,
+        "capacity": capacity,
+        "granted": (stored or {}).get("granted", 0) + tokens,
+    }
+    return delay
+
+
+class FileRateLimiterBackend(RateLimiterBackend):
+    def __init__(self, path: str):
+        """
+        Buckets stored in a JSON file guarded by an exclusive file lock, shared by all processes on a host
+        that use the same path. The file is created if it does not exist.
+
+        :param path: string - location of the state file, e.g. /tmp/pyphrase-rate-limit.json
+        """
+        if fcntl is None:
+            raise RuntimeError("FileRateLimiterBackend requires fcntl (POSIX only)")
+        self.path = path
+        self._thread_lock = threading.Lock()
+
+    def _locked_update(self, update) -> Any:
+        with self._thread_lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            with os.fdopen(fd, "r+") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    raw = f.read()
+                    state = json.loads(raw) if raw else {}
+                    result = update(state)
+                    f.seek(0)
+                    f.truncate()
+                    json.dump(state, f)
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+        return result
+
+    def reserve(
+        self, key: str, rate: float, capacity: float, tokens: float = 1.0
+    ) -> float:
+        return self._locked_update(
+            lambda state: _reserve_in_state(
+                state, key, rate, capacity, tokens, time.time()
+            )
+        )
+
+    def snapshot(self) -> Dict[str, dict]:
+        def refill(state: Dict[str, dict]) -> Dict[str, dict]:
+            now = time.time()
+            for key, stored in state.items():
+                _reserve_in_state(
+                    state, key, stored["rate"], stored["capacity"], 0, now
+                )
+            return {key: dict(stored) for key, stored in state.items()}
+
+        return self._locked_update(refill)
+
+
+# Refill, take and store in one atomic step. Returns the delay as a string,
+# numbers returned from Lua are truncated to integers.
+_REDIS_RESERVE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local tokens = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local available = tonumber(state[1])
+local updated = tonumber(state[2])
+if available == nil then
+    available = capacity
+    updated = now
+end
+available = math.min(capacity, available + math.max(0, now - updated) * rate)
+available = available - tokens
+redis.call('HMSET', KEYS[1], 'tokens', tostring(available), 'updated', tostring(now),
+    'rate', tostring(rate), 'capacity', tostring(capacity))
+redis.call('HINCRBYFLOAT', KEYS[1], 'granted', tokens)
+redis.call('EXPIRE', KEYS[1], math.ceil((capacity - available) / rate) + 60)
+if available >= 0 then
+    return '0'
+end
+return tostring(-available / rate)
+"""
+
+
+class RedisRateLimiterBackend(RateLimiterBackend):
+    def __init__(self, redis_client: Any, prefix: str = "pyphrase:rate-limit:"):
+        """
+        Buckets stored in Redis, or any server speaking the Redis protocol, so that processes on several
+        hosts share one budget. Each reservation is a single atomic Lua script.
+
+        :param redis_client: client with a redis-py compatible eval(script, numkeys, *keys_and_args) and
+            hgetall(key), e.g. redis.Redis or a stand-in for tests
+        :param prefix: string - prefix of the Redis keys holding the buckets
+        """
+        self.redis_client = redis_client
+        self.prefix = prefix
+        self._keys: Set[str] = set()
+
+    @classmethod
+    def from_url(
+        cls, url: str, prefix: str = "pyphrase:rate-limit:"
+    ) -> "RedisRateLimiterBackend":
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "RedisRateLimiterBackend.from_url requires redis, install pyphrase[redis]"
+            ) from e
+        return cls(redis.Redis.from_url(url), prefix=prefix)
+
+    def reserve(
+        self, key: str, rate: float, capacity: float, tokens: float = 1.0
+    ) -> float:
+        redis_key = f"{self.prefix}{key}"
+        self._keys.add(redis_key)
+        delay = self.redis_client.eval(
+            _REDIS_RESERVE_SCRIPT, 1, redis_key, rate, capacity, tokens
+        )
+        if isinstance(delay, bytes):
+            delay = delay.decode()
+        return float(delay)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Stored state of the buckets used by this process, without refill since the last reservation
+        """
+        snapshot = {}
+        for redis_key in sorted(self._keys):
+            stored = self.redis_client.hgetall(redis_key)
+            if not stored:
+                continue
+            snapshot[redis_key[len(self.prefix) :]] = {
+                _decode(field): float(_decode(value)) for field, value in stored.items()
+            }
+        return snapshot
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, bytes):
+        return value.decode()
+    return value
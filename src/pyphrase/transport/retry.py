@@ -0,0 +1,196 @@
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+import httpx
+
+from ..exceptions import (
+    PhraseTMSException,
+    PhraseTmsServerError,
+    PhraseTmsTooManyRequestsError,
+    exception_map,
+)
+from .timeouts import Deadline
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Raised before any byte of the request reached the server, so the request
+# can be repeated whatever the method is.
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """
+    Seconds to wait according to the Retry-After header, which is either a number of seconds or an HTTP date
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def exception_from_response(response: httpx.Response) -> PhraseTMSException:
+    """
+    Typed exception for a failed response, carrying status code and the errorCode of the Phrase TMS error body
+    """
+    try:
+        loaded_errors = response.json()
+        error_code = loaded_errors.get("errorCode")
+        error_detail = loaded_errors.get("errorDescription")
+    except (ValueError, AttributeError):
+        error_code = None
+        error_detail = None
+
+    method = response.request.method
+    url = str(response.request.url)
+    status_code = response.status_code
+    msg = f"Call failed: {method=}, {url=}, {status_code=}, {error_code=}, {error_detail=}"
+
+    if status_code == 429:
+        exception_class = PhraseTmsTooManyRequestsError
+    elif status_code >= 500:
+        exception_class = PhraseTmsServerError
+    else:
+        exception_class = exception_map.get(error_code, PhraseTMSException)
+
+    return exception_class(
+        msg,
+        status_code=status_code,
+        error_code=error_code,
+        error_description=error_detail,
+        retry_after=parse_retry_after(response),
+    )
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        max_elapsed: Optional[float] = 120.0,
+        retry_status_codes: FrozenSet[int] = RETRY_STATUS_CODES,
+        idempotent_methods: FrozenSet[str] = IDEMPOTENT_METHODS,
+        respect_retry_after: bool = True,
+    ):
+        """
+        When and how long to wait before a failed call is sent again.
+
+        Idempotent methods are retried on any of retry_status_codes and on transport errors. Other methods
+        (POST, PATCH) are only retried when the server refused the request with 429, or the connection
+        failed before the request was sent. Delays use decorrelated jitter between base_delay and max_delay,
+        but never less than the Retry-After header asks for.
+
+        :param max_attempts: int - total number of attempts, 1 disables retries
+        :param base_delay: float - smallest delay in seconds
+        :param max_delay: float - largest jittered delay in seconds
+        :param max_elapsed: float (optional) - give up when the next attempt would start later than this
+            many seconds after the first one
+        :param retry_status_codes: set of status codes that can be retried
+        :param idempotent_methods: set of HTTP methods that are safe to send more than once
+        :param respect_retry_after: bool - wait at least as long as the Retry-After header says
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_elapsed = max_elapsed
+        self.retry_status_codes = retry_status_codes
+        self.idempotent_methods = idempotent_methods
+        self.respect_retry_after = respect_retry_after
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        return cls(max_attempts=1)
+
+    def is_retryable_status(self, method: str, status_code: int) -> bool:
+        if status_code not in self.retry_status_codes:
+            return False
+        return status_code == 429 or method.upper() in self.idempotent_methods
+
+    def is_retryable_exception(self, method: str, exc: Exception) -> bool:
+        if isinstance(exc, NOT_SENT_ERRORS):
+            return True
+        return (
+            isinstance(exc, httpx.TransportError)
+            and method.upper() in self.idempotent_methods
+        )
+
+    def new_state(self, deadline: Optional[Deadline] = None) -> "RetryState":
+        return RetryState(self, deadline)
+
+
+class RetryState:
+    def __init__(self, policy: RetryPolicy, deadline: Optional[Deadline] = None):
+        """
+        Bookkeeping for the attempts of a single call. No retry is scheduled past the deadline, if given.
+        """
+        self.policy = policy
+        self.deadline = deadline
+        self.attempt = 1
+        self.started = time.monotonic()
+        self.previous_delay = policy.base_delay
+
+    def _next_delay(self, retry_after: Optional[float]) -> Optional[float]:
+        policy = self.policy
+        if self.attempt >= policy.max_attempts:
+            return None
+
+        delay = min(
+            policy.max_delay,
+            random.uniform(policy.base_delay, self.previous_delay * 3),
+        )
+        if retry_after is not None and policy.respect_retry_after:
+            delay = max(delay, retry_after)
+
+        if policy.max_elapsed is not None:
+            elapsed = time.monotonic() - self.started
+            if elapsed + delay > policy.max_elapsed:
+                return None
+        if self.deadline is not None and delay >= self.deadline.remaining():
+            return None
+
+        self.previous_delay = delay
+        self.attempt += 1
+        return delay
+
+    def delay_for_response(self, response: httpx.Response) -> Optional[float]:
+        """
+        Seconds to wait before sending again, or None if the response should not be retried
+        """
+        if not self.policy.is_retryable_status(
+            response.request.method, response.status_code
+        ):
+            return None
+        delay = self._next_delay(parse_retry_after(response))
+        if delay is not None:
+            logger.warning(
+                f"Retrying {response.request.method} {response.request.url} in {delay:.2f}s "
+                f"after status {response.status_code} (attempt {self.attempt})"
+            )
+        return delay
+
+    def delay_for_exception(self, method: str, exc: Exception) -> Optional[float]:
+        """
+        Seconds to wait before sending again, or None if the exception should be raised
+        """
+        if not self.policy.is_retryable_exception(method, exc):
+            return None
+        delay = self._next_delay(None)
+        if delay is not None:
+            logger.warning(
+                f"Retrying {method} in {delay:.2f}s after {exc!r} (attempt {self.attempt})"
+            )
+        return delay
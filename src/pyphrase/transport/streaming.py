@@ -0,0 +1,194 @@
+import asyncio
+import mmap
+import os
+import urllib.parse
+from contextlib import contextmanager
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+import httpx
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# A path to write to, or an open binary file object
+DownloadDestination = Union[str, os.PathLike, BinaryIO]
+
+# Bytes, a path (str or os.PathLike), an open binary file, a memory map or a sync/async iterator of byte chunks
+UploadContent = Union[
+    bytes, str, os.PathLike, BinaryIO, mmap.mmap, Iterable[bytes], AsyncIterable[bytes]
+]
+
+# Called after every chunk with the bytes received so far and the total from Content-Length, if known
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+def content_length(response: httpx.Response) -> Optional[int]:
+    """
+    Size of the decoded body, if the server announced it
+    """
+    if response.headers.get("Content-Encoding", "identity") != "identity":
+        return None
+    value = response.headers.get("Content-Length")
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+@contextmanager
+def open_destination(destination: DownloadDestination) -> Iterator[BinaryIO]:
+    """
+    Binary file to write a download to. Paths are opened here and removed again if the download fails,
+    file objects are used as they are and left open.
+    """
+    if hasattr(destination, "write"):
+        yield destination
+        return
+
+    path = os.fspath(destination)
+    f = open(path, "wb")
+    try:
+        yield f
+    except BaseException:
+        f.close()
+        os.remove(path)
+        raise
+    f.close()
+
+
+_BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+_PATH_TYPES = (str, os.PathLike)
+
+
+class UploadBody:
+    def __init__(self, source: UploadContent, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Request body read in chunks while it is sent, so that memory use does not grow with the file size.
+
+        Paths are opened when the body is sent, files are read from their current position and memory maps
+        are sliced. These can be sent again when a call is retried, iterators can only be sent once.
+
+        :param source: UploadContent - what to upload, a str is taken as a path
+        :param chunk_size: int - bytes read at a time
+        """
+        self.source = source
+        self.chunk_size = chunk_size
+        self._start = None
+        self._consumed = False
+        if (
+            not isinstance(source, _BUFFER_TYPES)
+            and hasattr(source, "read")
+            and getattr(source, "seekable", lambda: False)()
+        ):
+            self._start = source.tell()
+
+    @property
+    def name(self) -> Optional[str]:
+        """
+        File name of the source, if it has one
+        """
+        if isinstance(self.source, _PATH_TYPES):
+            return os.path.basename(os.fspath(self.source))
+        name = getattr(self.source, "name", None)
+        if isinstance(name, str):
+            return os.path.basename(name)
+        return None
+
+    def content_disposition(self, file_name: Optional[str] = None) -> str:
+        """
+        Content-Disposition header value naming the uploaded file, file_name defaults to the name of the source
+        """
+        file_name = file_name or self.name
+        if file_name is None:
+            raise ValueError(
+                "A file name is required unless the body is a path or named file"
+            )
+        return f"filename*=UTF-8''{urllib.parse.quote(file_name, encoding='utf-8')}"
+
+    @property
+    def length(self) -> Optional[int]:
+        """
+        Bytes that will be sent, if known up front
+        """
+        source = self.source
+        if isinstance(source, _BUFFER_TYPES):
+            return len(source)
+        if isinstance(source, _PATH_TYPES):
+            return os.path.getsize(source)
+        if self._start is not None:
+            try:
+                return os.fstat(source.fileno()).st_size - self._start
+            except (AttributeError, OSError, ValueError):
+                return None
+        return None
+
+    @property
+    def replayable(self) -> bool:
+        return (
+            isinstance(self.source, _BUFFER_TYPES + _PATH_TYPES)
+            or self._start is not None
+        )
+
+    def _check_replay(self) -> None:
+        if self._consumed and not self.replayable:
+            raise RuntimeError("Upload body from an iterator can only be sent once")
+        self._consumed = True
+
+    def _iter_buffer(self, buffer) -> Iterator[bytes]:
+        for offset in range(0, len(buffer), self.chunk_size):
+            yield buffer[offset : offset + self.chunk_size]
+
+    def __iter__(self) -> Iterator[bytes]:
+        self._check_replay()
+        source = self.source
+        if isinstance(source, _BUFFER_TYPES):
+            yield from self._iter_buffer(source)
+        elif isinstance(source, _PATH_TYPES):
+            with open(source, "rb") as f:
+                yield from iter(lambda: f.read(self.chunk_size), b"")
+        elif hasattr(source, "read"):
+            if self._start is not None:
+                source.seek(self._start)
+            yield from iter(lambda: source.read(self.chunk_size), b"")
+        elif hasattr(source, "__aiter__"):
+            raise TypeError(
+                "Async iterators can only be uploaded with the async client"
+            )
+        else:
+            yield from source
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self.aiter_chunks()
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        self._check_replay()
+        source = self.source
+        if isinstance(source, _BUFFER_TYPES):
+            for chunk in self._iter_buffer(source):
+                yield chunk
+        elif isinstance(source, _PATH_TYPES):
+            f = await asyncio.to_thread(open, source, "rb")
+            try:
+                while chunk := await asyncio.to_thread(f.read, self.chunk_size):
+                    yield chunk
+            finally:
+                f.close()
+        elif hasattr(source, "read"):
+            if self._start is not None:
+                source.seek(self._start)
+            while chunk := await asyncio.to_thread(source.read, self.chunk_size):
+                yield chunk
+        elif hasattr(source, "__aiter__"):
+            async for chunk in source:
+                yield chunk
+        else:
+            for chunk in source:
+                yield chunk
@@ -0,0 +1,147 @@
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional, Sequence, Union
+
+import httpx
+
+# A profile name, seconds for every phase, an httpx.Timeout, or None for no timeout
+TimeoutValue = Union[str, float, httpx.Timeout, None]
+
+DEFAULT_TIMEOUT_PROFILES = {
+    "interactive": httpx.Timeout(10.0, connect=5.0, pool=5.0),
+    "default": httpx.Timeout(30.0),
+    "download": httpx.Timeout(60.0),
+    "upload": httpx.Timeout(120.0, connect=10.0, write=300.0),
+    "bulk": httpx.Timeout(300.0, connect=10.0, pool=30.0),
+}
+
+
+class TimeoutRule:
+    def __init__(
+        self, pattern: str, profile: str, methods: Optional[Sequence[str]] = None
+    ):
+        """
+        Timeout profile for an endpoint family
+
+        :param pattern: regular expression searched for in the request path, e.g. r"/jobs/bilingualFile"
+        :param profile: string - name of the profile used for matching calls
+        :param methods: list of strings (optional) - HTTP methods the rule applies to, all if not given
+        """
+        self.pattern = pattern
+        self.profile = profile
+        self.methods = {m.upper() for m in methods} if methods else None
+        self._regex = re.compile(pattern)
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.methods is not None and method.upper() not in self.methods:
+            return False
+        return self._regex.search(path) is not None
+
+
+# Exports and bilingual files of large jobs take minutes to produce
+DEFAULT_TIMEOUT_RULES = (
+    TimeoutRule(r"/export\b|/exportByQueryAsync\b", "bulk"),
+    TimeoutRule(r"/bilingualFiles?\b", "bulk"),
+    TimeoutRule(r"/download(Export|Cleaned|TargetFile)/", "bulk"),
+)
+
+
+class TimeoutPolicy:
+    def __init__(
+        self,
+        profiles: Optional[Dict[str, httpx.Timeout]] = None,
+        rules: Sequence[TimeoutRule] = (),
+    ):
+        """
+        Named connect/read/write/pool timeouts and the rules choosing them per endpoint family.
+
+        Calls use the "default" profile, downloads "download" and streamed uploads "upload", unless a rule matches
+        the call. Timeouts given explicitly as seconds or httpx.Timeout are used as they are.
+
+        :param profiles: dict of profile name to httpx.Timeout (optional) - added to, or replacing,
+            DEFAULT_TIMEOUT_PROFILES
+        :param rules: list of TimeoutRule (optional) - checked before DEFAULT_TIMEOUT_RULES, the first matching
+            rule wins
+        """
+        self.profiles = {**DEFAULT_TIMEOUT_PROFILES, **(profiles or {})}
+        self.rules = [*rules, *DEFAULT_TIMEOUT_RULES]
+
+    def resolve(
+        self, method: str, path: str, timeout: TimeoutValue
+    ) -> Union[httpx.Timeout, float, None]:
+        """
+        Timeout to send a call with
+
+        :param timeout: profile name the operation asks for, or an explicit timeout
+        """
+        if not isinstance(timeout, str):
+            return timeout
+        for rule in self.rules:
+            if rule.matches(method, path):
+                timeout = rule.profile
+                break
+        try:
+            return self.profiles[timeout]
+        except KeyError:
+            raise ValueError(f"Unknown timeout profile {timeout!r}") from None
+
+
+class Deadline:
+    def __init__(self, seconds: float):
+        """
+        Point in time by which a unit of work has to be done
+        """
+        self.seconds = seconds
+        self.expires = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires
+
+    def clamp(self, timeout: Union[httpx.Timeout, float, None]) -> httpx.Timeout:
+        """
+        The timeout with every phase cut down to the remaining time
+        """
+        timeout = httpx.Timeout(timeout)
+        remaining = self.remaining()
+
+        def cut(value: Optional[float]) -> float:
+            return remaining if value is None else min(value, remaining)
+
+        return httpx.Timeout(
+            connect=cut(timeout.connect),
+            read=cut(timeout.read),
+            write=cut(timeout.write),
+            pool=cut(timeout.pool),
+        )
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar(
+    "pyphrase_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_context(seconds: float) -> Iterator[Deadline]:
+    """
+    Limit every call made inside the block, including retries and backoff, to a total of `seconds`.
+    A deadline inside another one can only shorten it. Applies to the current thread or asyncio task.
+    """
+    deadline = Deadline(seconds)
+    outer = _current_deadline.get()
+    if outer is not None and outer.expires < deadline.expires:
+        deadline = outer
+    reset_token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(reset_token)
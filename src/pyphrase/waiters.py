@@ -0,0 +1,561 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+)
+
+from .exceptions import WaitTimeoutError
+from .models.phrase_models import AsyncRequestDto, BackgroundTasksTbDto
+
+if TYPE_CHECKING:
+    from .asynchron.client import AsyncPhraseTMSClient
+    from .synchron.client import SyncPhraseTMSClient
+
+logger = logging.getLogger(__name__)
+
+
+class PollingPolicy:
+    def __init__(
+        self,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        multiplier: float = 1.5,
+        samples: int = 100,
+    ):
+        """
+        How often to check on work running on the server, learning from how long it took before.
+
+        Without history, checks start after initial_interval and back off by multiplier up to max_interval.
+        Once completion times have been observed, the first check waits until the median completion time,
+        and backing off starts from there.
+
+        :param initial_interval: float - seconds before the first check and between early checks
+        :param max_interval: float - longest wait between two checks
+        :param multiplier: float - growth of the wait after each check
+        :param samples: int - completion times remembered
+        """
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self._durations = deque(maxlen=samples)
+        self._lock = threading.Lock()
+
+    def observe(self, duration: float) -> None:
+        """
+        Record how long a piece of work took to complete
+        """
+        with self._lock:
+            self._durations.append(duration)
+
+    def expected_duration(self) -> Optional[float]:
+        """
+        Median of the observed completion times, None before the first one
+        """
+        with self._lock:
+            if not self._durations:
+                return None
+            return statistics.median(self._durations)
+
+    def interval(self, elapsed: float, checks: int) -> float:
+        """
+        Seconds to wait before the next check
+
+        :param elapsed: float - seconds since waiting started
+        :param checks: int - checks done so far
+        """
+        expected = self.expected_duration()
+        if expected is not None and elapsed < expected:
+            interval = expected - elapsed
+        else:
+            interval = self.initial_interval * self.multiplier**checks
+        return min(self.max_interval, max(self.initial_interval, interval))
+
+
+def async_request_ids(requests: Iterable[Any]) -> List[str]:
+    """
+    Ids of async requests given as ids or as objects with an id, e.g. the asyncRequest of a JobListDto
+    """
+    ids = (getattr(request, "id", request) for request in requests)
+    return list(dict.fromkeys(str(request_id) for request_id in ids))
+
+
+def _is_done(request: AsyncRequestDto) -> bool:
+    return request.asyncResponse is not None
+
+
+class _AsyncRequestWaiterBase:
+    def __init__(self, polling: Optional[PollingPolicy] = None, scan_from: int = 5):
+        """
+        Wait for many async requests at once. While at least scan_from requests are pending, one scan of
+        listPendingRequests finds those that left the queue, and only these are fetched with getAsyncRequest.
+        Fewer requests are checked with getAsyncRequest directly.
+
+        :param polling: PollingPolicy (optional) - check intervals, learns from completion times
+        :param scan_from: int - pending requests from which listPendingRequests is scanned
+        """
+        self.polling = polling or PollingPolicy()
+        self.scan_from = scan_from
+
+    def _timed_out(
+        self, ids: List[str], done: Dict[str, AsyncRequestDto], timeout: float
+    ):
+        pending = [request_id for request_id in ids if request_id not in done]
+        return WaitTimeoutError(
+            f"{len(pending)} of {len(ids)} async requests not done after {timeout}s",
+            done=done,
+            pending=pending,
+        )
+
+
+class SyncAsyncRequestWaiter(_AsyncRequestWaiterBase):
+    def __init__(
+        self,
+        client: SyncPhraseTMSClient,
+        polling: Optional[PollingPolicy] = None,
+        scan_from: int = 5,
+    ):
+        super().__init__(polling, scan_from)
+        self.client = client
+
+    def wait_for(
+        self,
+        requests: Iterable[Any],
+        timeout: Optional[float] = None,
+        phrase_token: Optional[str] = None,
+    ) -> Dict[str, AsyncRequestDto]:
+        """
+        Block until all async requests are done
+
+        :param requests: list of async request ids, or objects with an id such as AsyncRequestReference
+        :param timeout: float (optional) - seconds to wait at most, raises WaitTimeoutError with the requests
+            done so far after that
+        :param phrase_token: string (optional) - if not supplied, client will look token from init
+
+        :return: dict of async request id to its finished AsyncRequestDto, in the given order.
+            Failed requests have errorCode set in asyncResponse
+        """
+        ids = async_request_ids(requests)
+        started = time.monotonic()
+        done: Dict[str, AsyncRequestDto] = {}
+        checks = 0
+        while len(done) < len(ids):
+            elapsed = time.monotonic() - started
+            interval = self.polling.interval(elapsed, checks)
+            if timeout is not None:
+                if elapsed >= timeout:
+                    raise self._timed_out(ids, done, timeout)
+                interval = min(interval, timeout - elapsed)
+            time.sleep(interval)
+            pending = {request_id for request_id in ids if request_id not in done}
+            for request_id, request in self._check(pending, phrase_token).items():
+                done[request_id] = request
+                self.polling.observe(time.monotonic() - started)
+            checks += 1
+        return {request_id: done[request_id] for request_id in ids}
+
+    def _check(
+        self, pending: Set[str], phrase_token: Optional[str]
+    ) -> Dict[str, AsyncRequestDto]:
+        candidates = pending
+        if len(pending) >= self.scan_from:
+            queued = {
+                str(request.id)
+                for request in self.client.async_request.iter_listPendingRequests(
+                    phrase_token=phrase_token
+                )
+            }
+            candidates = pending - queued
+        logger.debug(f"{len(candidates)} of {len(pending)} async requests to fetch")
+        finished = {}
+        for request_id in candidates:
+            request = self.client.async_request.getAsyncRequest(
+                request_id, phrase_token
+            )
+            if _is_done(request):
+                finished[request_id] = request
+        return finished
+
+
+class AsyncAsyncRequestWaiter(_AsyncRequestWaiterBase):
+    def __init__(
+        self,
+        client: AsyncPhraseTMSClient,
+        polling: Optional[PollingPolicy] = None,
+        scan_from: int = 5,
+        workers: int = 8,
+    ):
+        """
+        :param workers: int - async requests fetched at the same time
+        """
+        super().__init__(polling, scan_from)
+        self.client = client
+        self.workers = workers
+
+    async def wait_for(
+        self,
+        requests: Iterable[Any],
+        timeout: Optional[float] = None,
+        phrase_token: Optional[str] = None,
+    ) -> Dict[str, AsyncRequestDto]:
+        """
+        Async version of SyncAsyncRequestWaiter.wait_for, requests leaving the queue are fetched concurrently
+        """
+        ids = async_request_ids(requests)
+        started = time.monotonic()
+        done: Dict[str, AsyncRequestDto] = {}
+        checks = 0
+        while len(done) < len(ids):
+            elapsed = time.monotonic() - started
+            interval = self.polling.interval(elapsed, checks)
+            if timeout is not None:
+                if elapsed >= timeout:
+                    raise self._timed_out(ids, done, timeout)
+                interval = min(interval, timeout - elapsed)
+            await asyncio.sleep(interval)
+            pending = {request_id for request_id in ids if request_id not in done}
+            finished = await self._check(pending, phrase_token)
+            for request_id, request in finished.items():
+                done[request_id] = request
+                self.polling.observe(time.monotonic() - started)
+            checks += 1
+        return {request_id: done[request_id] for request_id in ids}
+
+    async def _check(
+        self, pending: Set[str], phrase_token: Optional[str]
+    ) -> Dict[str, AsyncRequestDto]:
+        candidates = pending
+        if len(pending) >= self.scan_from:
+            queued = {
+                str(request.id)
+                async for request in self.client.async_request.iter_listPendingRequests(
+                    phrase_token=phrase_token
+                )
+            }
+            candidates = pending - queued
+        logger.debug(f"{len(candidates)} of {len(pending)} async requests to fetch")
+        candidates = list(candidates)
+        semaphore = asyncio.Semaphore(self.workers)
+
+        async def get(request_id: str) -> AsyncRequestDto:
+            async with semaphore:
+                return await self.client.async_request.getAsyncRequest(
+                    request_id, phrase_token
+                )
+
+        requests = await asyncio.gather(*(get(request_id) for request_id in candidates))
+        return {
+            request_id: request
+            for request_id, request in zip(candidates, requests)
+            if _is_done(request)
+        }
+
+
+TRANS_MEMORY = "transMemory"
+TERM_BASE = "termBase"
+
+# Statuses of a background task that is still queued or running
+RUNNING_STATUSES = frozenset({"PENDING", "QUEUED", "RUNNING", "IN_PROGRESS"})
+
+# Called after every check with the tasks done so far and the number of tasks
+BackgroundTaskProgress = Callable[[int, int], None]
+
+
+class BackgroundTask:
+    def __init__(self, kind: str, uid: str, async_request: Any = None):
+        """
+        Import or clear running in the background of a translation memory or term base
+
+        :param kind: string - TRANS_MEMORY or TERM_BASE
+        :param uid: string - uid of the translation memory or term base
+        :param async_request: async request id or object with an id (optional) - the async request the import
+            returned, e.g. of importTransMemoryV2. Until the last background task shows it, an earlier task is
+            not taken for this one. Clears return no async request, record the task before them with the mark
+            method of the waiter instead
+        """
+        self.kind = kind
+        self.uid = uid
+        # Last background task before this one was started, set by mark
+        self.previous: Optional[BackgroundTasksTbDto] = None
+        self.async_request_id = (
+            str(getattr(async_request, "id", async_request))
+            if async_request is not None
+            else None
+        )
+
+    @classmethod
+    def trans_memory(cls, uid: str, async_request: Any = None) -> "BackgroundTask":
+        return cls(TRANS_MEMORY, uid, async_request)
+
+    @classmethod
+    def term_base(cls, uid: str, async_request: Any = None) -> "BackgroundTask":
+        return cls(TERM_BASE, uid, async_request)
+
+    def is_done(self, task: BackgroundTasksTbDto) -> bool:
+        """
+        Whether the last background task reported for the memory or term base is this one, and finished
+        """
+        request = task.asyncRequest
+        if self.async_request_id is not None and (
+            request is None or str(request.id) != self.async_request_id
+        ):
+            return False
+        if self.previous is not None and not _is_newer(task, self.previous):
+            return False
+        if request is not None:
+            return request.asyncResponse is not None
+        return (task.status or "").upper() not in RUNNING_STATUSES
+
+
+def _is_newer(task: BackgroundTasksTbDto, previous: BackgroundTasksTbDto) -> bool:
+    request, before = task.asyncRequest, previous.asyncRequest
+    if request is not None and before is not None:
+        if request.id is not None and before.id is not None:
+            return str(request.id) != str(before.id)
+        if request.dateCreated is not None and before.dateCreated is not None:
+            return request.dateCreated > before.dateCreated
+    return task != previous
+
+
+def background_task_failed(task: BackgroundTasksTbDto) -> bool:
+    """
+    Whether a finished background task reported an error
+    """
+    request = task.asyncRequest
+    if request is not None and request.asyncResponse is not None:
+        if request.asyncResponse.errorCode:
+            return True
+    return bool(task.lastTaskError)
+
+
+class _BackgroundTaskWaiterBase:
+    def __init__(self, polling: Optional[PollingPolicy] = None):
+        """
+        Wait for imports and clears of many translation memories and term bases at once. Each check asks for
+        the last background task of every memory or term base still running, the wait between checks adapts
+        to how long earlier tasks took.
+
+        :param polling: PollingPolicy (optional) - check intervals, learns from completion times
+        """
+        self.polling = polling or PollingPolicy()
+        self.progress = (0, 0)
+
+    def _report(
+        self, done: int, total: int, progress: Optional[BackgroundTaskProgress]
+    ) -> None:
+        self.progress = (done, total)
+        if progress is not None:
+            progress(done, total)
+
+    def _check_marked(self, tasks: List[BackgroundTask]) -> None:
+        unmarked = [
+            task.uid
+            for task in tasks
+            if task.async_request_id is None and task.previous is None
+        ]
+        if unmarked:
+            logger.warning(
+                f"{len(unmarked)} background tasks, e.g. of {unmarked[0]}, have neither an async request "
+                "nor a mark, an earlier finished task may be taken for them"
+            )
+
+    def _timed_out(
+        self,
+        tasks: List[BackgroundTask],
+        done: Dict[str, BackgroundTasksTbDto],
+        timeout: float,
+    ):
+        pending = [task.uid for task in tasks if task.uid not in done]
+        return WaitTimeoutError(
+            f"{len(pending)} of {len(tasks)} background tasks not done after {timeout}s",
+            done=done,
+            pending=pending,
+        )
+
+
+class SyncBackgroundTaskWaiter(_BackgroundTaskWaiterBase):
+    def __init__(
+        self,
+        client: SyncPhraseTMSClient,
+        polling: Optional[PollingPolicy] = None,
+        workers: int = 8,
+    ):
+        """
+        :param workers: int - last background tasks fetched at the same time
+        """
+        super().__init__(polling)
+        self.client = client
+        self.workers = workers
+
+    def wait_for(
+        self,
+        tasks: Iterable[BackgroundTask],
+        timeout: Optional[float] = None,
+        progress: Optional[BackgroundTaskProgress] = None,
+        phrase_token: Optional[str] = None,
+    ) -> Dict[str, BackgroundTasksTbDto]:
+        """
+        Block until the background tasks of all memories and term bases are done
+
+        :param tasks: list of BackgroundTask, e.g. BackgroundTask.trans_memory(uid, async_request), or tasks
+            recorded with mark before they were started
+        :param timeout: float (optional) - seconds to wait at most, raises WaitTimeoutError with the tasks
+            done so far after that
+        :param progress: callable (optional) - called after every check with the tasks done and their number
+
+        :return: dict of memory or term base uid to its last background task, check failures with
+            background_task_failed
+        """
+        tasks = list(tasks)
+        self._check_marked(tasks)
+        started = time.monotonic()
+        done: Dict[str, BackgroundTasksTbDto] = {}
+        checks = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while len(done) < len(tasks):
+                elapsed = time.monotonic() - started
+                interval = self.polling.interval(elapsed, checks)
+                if timeout is not None:
+                    if elapsed >= timeout:
+                        raise self._timed_out(tasks, done, timeout)
+                    interval = min(interval, timeout - elapsed)
+                time.sleep(interval)
+                pending = [task for task in tasks if task.uid not in done]
+                results = self._last_tasks(executor, pending, phrase_token)
+                for task, result in zip(pending, results):
+                    if task.is_done(result):
+                        done[task.uid] = result
+                        self.polling.observe(time.monotonic() - started)
+                checks += 1
+                self._report(len(done), len(tasks), progress)
+        return {task.uid: done[task.uid] for task in tasks}
+
+    def mark(
+        self, tasks: Iterable[BackgroundTask], phrase_token: Optional[str] = None
+    ) -> None:
+        """
+        Record the last background task of each memory or term base, so that wait_for only accepts a newer one.
+        Call it before starting the imports or clears, e.g. clearTransMemoryV2 and clearTermBase, which return
+        no async request to wait for.
+        """
+        tasks = list(tasks)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for task, last in zip(
+                tasks, self._last_tasks(executor, tasks, phrase_token)
+            ):
+                task.previous = last
+
+    def _last_tasks(
+        self,
+        executor: ThreadPoolExecutor,
+        tasks: List[BackgroundTask],
+        phrase_token: Optional[str],
+    ) -> Iterator[BackgroundTasksTbDto]:
+        return executor.map(
+            lambda task: contextvars.copy_context().run(
+                self._last_task, task, phrase_token
+            ),
+            tasks,
+        )
+
+    def _last_task(
+        self, task: BackgroundTask, phrase_token: Optional[str]
+    ) -> BackgroundTasksTbDto:
+        if task.kind == TRANS_MEMORY:
+            return self.client.translation_memory.getBackgroundTasks_1(
+                task.uid, phrase_token
+            )
+        return self.client.term_base.getLastBackgroundTask(task.uid, phrase_token)
+
+
+class AsyncBackgroundTaskWaiter(_BackgroundTaskWaiterBase):
+    def __init__(
+        self,
+        client: AsyncPhraseTMSClient,
+        polling: Optional[PollingPolicy] = None,
+        workers: int = 8,
+    ):
+        """
+        :param workers: int - last background tasks fetched at the same time
+        """
+        super().__init__(polling)
+        self.client = client
+        self.workers = workers
+
+    async def wait_for(
+        self,
+        tasks: Iterable[BackgroundTask],
+        timeout: Optional[float] = None,
+        progress: Optional[BackgroundTaskProgress] = None,
+        phrase_token: Optional[str] = None,
+    ) -> Dict[str, BackgroundTasksTbDto]:
+        """
+        Async version of SyncBackgroundTaskWaiter.wait_for, the last background tasks are fetched concurrently
+        """
+        tasks = list(tasks)
+        self._check_marked(tasks)
+        started = time.monotonic()
+        done: Dict[str, BackgroundTasksTbDto] = {}
+        checks = 0
+        while len(done) < len(tasks):
+            elapsed = time.monotonic() - started
+            interval = self.polling.interval(elapsed, checks)
+            if timeout is not None:
+                if elapsed >= timeout:
+                    raise self._timed_out(tasks, done, timeout)
+                interval = min(interval, timeout - elapsed)
+            await asyncio.sleep(interval)
+            pending = [task for task in tasks if task.uid not in done]
+            results = await self._last_tasks(pending, phrase_token)
+            for task, result in zip(pending, results):
+                if task.is_done(result):
+                    done[task.uid] = result
+                    self.polling.observe(time.monotonic() - started)
+            checks += 1
+            self._report(len(done), len(tasks), progress)
+        return {task.uid: done[task.uid] for task in tasks}
+
+    async def mark(
+        self, tasks: Iterable[BackgroundTask], phrase_token: Optional[str] = None
+    ) -> None:
+        """
+        Async version of SyncBackgroundTaskWaiter.mark
+        """
+        tasks = list(tasks)
+        for task, last in zip(tasks, await self._last_tasks(tasks, phrase_token)):
+            task.previous = last
+
+    async def _last_tasks(
+        self, tasks: List[BackgroundTask], phrase_token: Optional[str]
+    ) -> List[BackgroundTasksTbDto]:
+        semaphore = asyncio.Semaphore(self.workers)
+
+        async def last_task(task: BackgroundTask) -> BackgroundTasksTbDto:
+            async with semaphore:
+                return await self._last_task(task, phrase_token)
+
+        return await asyncio.gather(*(last_task(task) for task in tasks))
+
+    async def _last_task(
+        self, task: BackgroundTask, phrase_token: Optional[str]
+    ) -> BackgroundTasksTbDto:
+        if task.kind == TRANS_MEMORY:
+            return await self.client.translation_memory.getBackgroundTasks_1(
+                task.uid, phrase_token
+            )
+        return await self.client.term_base.getLastBackgroundTask(task.uid, phrase_token)
@@ -0,0 +1,469 @@
+from __future__ import annotations
+
+import asyncio
+import hmac
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .exceptions import WaitTimeoutError
+from .models.phrase_models import (
+    AsyncRequestDto,
+    CreateWebHookDto,
+    JobPartExtendedDto,
+    TriggerEvent,
+    WebHookDtoV2,
+)
+from .waiters import PollingPolicy
+
+if TYPE_CHECKING:
+    from .asynchron.client import AsyncPhraseTMSClient
+    from .synchron.client import SyncPhraseTMSClient
+
+logger = logging.getLogger(__name__)
+
+# Header carrying the secret token of the webhook in every call Phrase TMS makes
+TOKEN_HEADER = "x-memsource-token"
+
+DEFAULT_WEBHOOK_EVENTS = (
+    TriggerEvent.JOB_STATUS_CHANGED,
+    TriggerEvent.PRE_TRANSLATION_FINISHED,
+    TriggerEvent.ANALYSIS_CREATED,
+)
+
+JOB = "job"
+ASYNC_REQUEST = "async_request"
+
+# Kind and id of what an event is about, e.g. ("job", job uid)
+Key = Tuple[str, str]
+
+
+def event_keys(event: Mapping[str, Any]) -> List[Tuple[Key, Optional[str]]]:
+    """
+    Jobs and async requests an event is about, each with the job status it reports, if any
+    """
+    keys = []
+    for part in event.get("jobParts") or ():
+        if part.get("uid"):
+            keys.append(((JOB, part["uid"]), part.get("status")))
+    async_request = event.get("asyncRequest") or {}
+    request_id = async_request.get("id") or event.get("asyncRequestId")
+    if request_id is not None:
+        keys.append(((ASYNC_REQUEST, str(request_id)), None))
+    return keys
+
+
+class WebhookReceiver:
+    def __init__(
+        self,
+        secret_token: Optional[str] = None,
+        recent_events: int = 1000,
+        polling: Optional[PollingPolicy] = None,
+        max_body_size: int = 1024 * 1024,
+    ):
+        """
+        Turns webhook calls of Phrase TMS into futures of the jobs and async requests they are about.
+
+        Serve it with any ASGI server, e.g. uvicorn.run(receiver), or with serve(), which runs a small
+        http.server in a background thread. Events arriving before anyone waits for them are kept, up to
+        recent_events of them, so that a future asked for late still resolves.
+
+        :param secret_token: string (optional) - token Phrase TMS sends with every call, calls without it
+            are rejected. register() configures the webhook with it
+        :param recent_events: int - events kept for futures asked for after the event arrived
+        :param polling: PollingPolicy (optional) - check intervals of the polling fallback of wait_job
+        :param max_body_size: int - largest webhook call accepted in bytes, larger calls are answered with 413
+        """
+        self.secret_token = secret_token
+        self.recent_events = recent_events
+        self.polling = polling or PollingPolicy()
+        self.max_body_size = max_body_size
+        self.webhook: Optional[WebHookDtoV2] = None
+        self.received = 0
+        self.rejected = 0
+        self._futures: Dict[Key, List[Tuple[Future, Optional[frozenset]]]] = {}
+        self._recent: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def job_future(
+        self, job_uid: str, statuses: Optional[Iterable[str]] = None
+    ) -> Future:
+        """
+        Future resolved with the next event about the job, e.g. JOB_STATUS_CHANGED. Wrap it with
+        asyncio.wrap_future to await it.
+
+        :param statuses: list of strings (optional) - only events reporting one of these statuses,
+            e.g. ["COMPLETED"], resolve the future
+        """
+        return self._future(
+            (JOB, job_uid), frozenset(statuses) if statuses is not None else None
+        )
+
+    def async_request_future(self, async_request_id: str) -> Future:
+        """
+        Future resolved with the event about the async request, e.g. PRE_TRANSLATION_FINISHED
+        """
+        return self._future((ASYNC_REQUEST, str(async_request_id)), None)
+
+    def _future(self, key: Key, statuses: Optional[frozenset]) -> Future:
+        future = Future()
+        with self._lock:
+            recent = self._recent.get(key)
+            if recent is not None and (statuses is None or recent[1] in statuses):
+                future.set_result(recent[0])
+                return future
+            self._futures.setdefault(key, []).append((future, statuses))
+        return future
+
+    def discard(self, future: Future) -> None:
+        """
+        Stop waiting with a future, e.g. after a timeout
+        """
+        future.cancel()
+        with self._lock:
+            for key, futures in list(self._futures.items()):
+                futures = [entry for entry in futures if entry[0] is not future]
+                if futures:
+                    self._futures[key] = futures
+                else:
+                    del self._futures[key]
+
+    def dispatch(self, event: Mapping[str, Any]) -> int:
+        """
+        Resolve the futures waiting for an event, returns how many were resolved
+        """
+        resolved = 0
+        with self._lock:
+            self.received += 1
+            for key, status in event_keys(event):
+                self._recent[key] = (event, status)
+                self._recent.move_to_end(key)
+                waiting = []
+                for future, statuses in self._futures.pop(key, ()):
+                    if statuses is not None and status not in statuses:
+                        if not future.cancelled():
+                            waiting.append((future, statuses))
+                        continue
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    future.set_result(event)
+                    resolved += 1
+                if waiting:
+                    self._futures[key] = waiting
+            while len(self._recent) > self.recent_events:
+                self._recent.popitem(last=False)
+        logger.debug(f"Webhook {event.get('event')} resolved {resolved} futures")
+        return resolved
+
+    def handle(self, body: bytes, headers: Mapping[str, str]) -> int:
+        """
+        Process one webhook call and return the HTTP status to answer with
+
+        :param headers: mapping of lower case header names to values
+        """
+        if self.secret_token is not None and not hmac.compare_digest(
+            headers.get(TOKEN_HEADER, ""), self.secret_token
+        ):
+            self.rejected += 1
+            logger.warning("Webhook call with a wrong token rejected")
+            return 401
+        try:
+            event = json.loads(body)
+        except ValueError:
+            return 400
+        if not isinstance(event, dict):
+            return 400
+        self.dispatch(event)
+        return 200
+
+    async def __call__(self, scope, receive, send) -> None:
+        """
+        ASGI application accepting webhook calls as POST on any path
+        """
+        if scope["type"] != "http":
+            return
+        status = 405
+        if scope["method"] == "POST":
+            body = b""
+            more_body = True
+            while more_body and len(body) <= self.max_body_size:
+                message = await receive()
+                body += message.get("body", b"")
+                more_body = message.get("more_body", False)
+            if len(body) > self.max_body_size:
+                status = 413
+            else:
+                headers = {
+                    name.decode("latin-1").lower(): value.decode("latin-1")
+                    for name, value in scope["headers"]
+                }
+                status = self.handle(body, headers)
+        await send({"type": "http.response.start", "status": status, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[str, int]:
+        """
+        Accept webhook calls with http.server in a background thread, returns the address it listens on.
+        Port 0 picks a free port. Listens on the loopback interface only, e.g. behind a reverse proxy,
+        pass host="0.0.0.0" to accept calls on all interfaces.
+        """
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                try:
+                    length = int(self.headers.get("Content-Length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    status = 400
+                elif length > receiver.max_body_size:
+                    status = 413
+                    self.close_connection = True
+                else:
+                    headers = {
+                        name.lower(): value for name, value in self.headers.items()
+                    }
+                    status = receiver.handle(self.rfile.read(length), headers)
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, format: str, *args) -> None:
+                logger.debug(format % args)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(
+            target=self._server.serve_forever, name="pyphrase-webhooks", daemon=True
+        ).start()
+        return self._server.server_address[:2]
+
+    def shutdown(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def _webhook_body(
+        self, url: str, events: Sequence[TriggerEvent], name: Optional[str]
+    ) -> CreateWebHookDto:
+        return CreateWebHookDto(
+            name=name, url=url, events=list(events), secretToken=self.secret_token
+        )
+
+    def register(
+        self,
+        client: SyncPhraseTMSClient,
+        url: str,
+        events: Sequence[TriggerEvent] = DEFAULT_WEBHOOK_EVENTS,
+        name: Optional[str] = "pyphrase",
+        phrase_token: Optional[str] = None,
+    ) -> WebHookDtoV2:
+        """
+        Create a webhook in Phrase TMS sending the events to url, the public address of this receiver
+        """
+        self.webhook = client.webhook.createWebHook_1(
+            self._webhook_body(url, events, name), phrase_token
+        )
+        return self.webhook
+
+    def unregister(
+        self, client: SyncPhraseTMSClient, phrase_token: Optional[str] = None
+    ) -> None:
+        if self.webhook is not None:
+            client.webhook.deleteWebHook_1(self.webhook.uid, phrase_token)
+            self.webhook = None
+
+    async def aregister(
+        self,
+        client: AsyncPhraseTMSClient,
+        url: str,
+        events: Sequence[TriggerEvent] = DEFAULT_WEBHOOK_EVENTS,
+        name: Optional[str] = "pyphrase",
+        phrase_token: Optional[str] = None,
+    ) -> WebHookDtoV2:
+        """
+        Async version of register
+        """
+        self.webhook = await client.webhook.createWebHook_1(
+            self._webhook_body(url, events, name), phrase_token
+        )
+        return self.webhook
+
+    async def aunregister(
+        self, client: AsyncPhraseTMSClient, phrase_token: Optional[str] = None
+    ) -> None:
+        if self.webhook is not None:
+            await client.webhook.deleteWebHook_1(self.webhook.uid, phrase_token)
+            self.webhook = None
+
+    def wait_async_request(
+        self,
+        client: SyncPhraseTMSClient,
+        async_request_id: str,
+        timeout: float,
+        poll_timeout: Optional[float] = None,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncRequestDto:
+        """
+        Block until the event about the async request arrives, then fetch it once. Without an event after
+        `timeout` seconds, falls back to polling with client.wait_for.
+
+        :param poll_timeout: float (optional) - seconds to poll at most, raises WaitTimeoutError after that
+        """
+        future = self.async_request_future(async_request_id)
+        try:
+            future.result(timeout)
+        except FutureTimeoutError:
+            self.discard(future)
+            logger.info(f"No webhook for async request {async_request_id}, polling")
+            done = client.wait_for([async_request_id], poll_timeout, phrase_token)
+            return done[str(async_request_id)]
+        return client.async_request.getAsyncRequest(async_request_id, phrase_token)
+
+    async def await_async_request(
+        self,
+        client: AsyncPhraseTMSClient,
+        async_request_id: str,
+        timeout: float,
+        poll_timeout: Optional[float] = None,
+        phrase_token: Optional[str] = None,
+    ) -> AsyncRequestDto:
+        """
+        Async version of wait_async_request
+        """
+        future = self.async_request_future(async_request_id)
+        try:
+            await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            self.discard(future)
+            logger.info(f"No webhook for async request {async_request_id}, polling")
+            done = await client.wait_for([async_request_id], poll_timeout, phrase_token)
+            return done[str(async_request_id)]
+        return await client.async_request.getAsyncRequest(
+            async_request_id, phrase_token
+        )
+
+    def wait_job(
+        self,
+        client: SyncPhraseTMSClient,
+        project_uid: str,
+        job_uid: str,
+        statuses: Iterable[str],
+        timeout: float,
+        poll_timeout: Optional[float] = None,
+        phrase_token: Optional[str] = None,
+    ) -> JobPartExtendedDto:
+        """
+        Block until an event reports one of the statuses for the job, then fetch the job once. Without such
+        an event after `timeout` seconds, falls back to polling getPart until the job reaches a status.
+
+        :param statuses: list of strings - job statuses to wait for, e.g. ["COMPLETED"]
+        :param poll_timeout: float (optional) - seconds to poll at most, raises WaitTimeoutError after that
+        """
+        statuses = frozenset(statuses)
+        future = self.job_future(job_uid, statuses)
+        try:
+            future.result(timeout)
+        except FutureTimeoutError:
+            self.discard(future)
+            logger.info(f"No webhook for job {job_uid}, polling")
+            return self._poll_job(
+                client, project_uid, job_uid, statuses, poll_timeout, phrase_token
+            )
+        return client.job.getPart(job_uid, project_uid, phrase_token)
+
+    def _poll_job(
+        self,
+        client: SyncPhraseTMSClient,
+        project_uid: str,
+        job_uid: str,
+        statuses: frozenset,
+        poll_timeout: Optional[float],
+        phrase_token: Optional[str],
+    ) -> JobPartExtendedDto:
+        started = time.monotonic()
+        checks = 0
+        while True:
+            job = client.job.getPart(job_uid, project_uid, phrase_token)
+            if job.status is not None and job.status.value in statuses:
+                self.polling.observe(time.monotonic() - started)
+                return job
+            time.sleep(self._poll_interval(job_uid, started, checks, poll_timeout))
+            checks += 1
+
+    def _poll_interval(
+        self, job_uid: str, started: float, checks: int, poll_timeout: Optional[float]
+    ) -> float:
+        """
+        Pause before the next check of a polled job, raises WaitTimeoutError once poll_timeout has passed
+        """
+        elapsed = time.monotonic() - started
+        interval = self.polling.interval(elapsed, checks)
+        if poll_timeout is None:
+            return interval
+        if elapsed >= poll_timeout:
+            raise WaitTimeoutError(
+                f"Job {job_uid} not in one of the awaited statuses after {poll_timeout}s",
+                pending=[job_uid],
+            )
+        return min(interval, poll_timeout - elapsed)
+
+    async def await_job(
+        self,
+        client: AsyncPhraseTMSClient,
+        project_uid: str,
+        job_uid: str,
+        statuses: Iterable[str],
+        timeout: float,
+        poll_timeout: Optional[float] = None,
+        phrase_token: Optional[str] = None,
+    ) -> JobPartExtendedDto:
+        """
+        Async version of wait_job
+        """
+        statuses = frozenset(statuses)
+        future = self.job_future(job_uid, statuses)
+        try:
+            await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            self.discard(future)
+            logger.info(f"No webhook for job {job_uid}, polling")
+            started = time.monotonic()
+            checks = 0
+            while True:
+                job = await client.job.getPart(job_uid, project_uid, phrase_token)
+                if job.status is not None and job.status.value in statuses:
+                    self.polling.observe(time.monotonic() - started)
+                    return job
+                await asyncio.sleep(
+                    self._poll_interval(job_uid, started, checks, poll_timeout)
+                )
+                checks += 1
+        return await client.job.getPart(job_uid, project_uid, phrase_token)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "received": self.received,
+                "rejected": self.rejected,
+                "waiting": sum(len(futures) for futures in self._futures.values()),
+                "recent_events": len(self._recent),
+            }
@@ -0,0 +1,44 @@
+from typing import Callable
+
+import httpx
+import pytest
+
+from pyphrase import AsyncPhraseTMSClient, SyncPhraseTMSClient
+
+from .helpers import TOKEN, fast_retries
+
+
+@pytest.fixture
+def sync_client() -> Callable[..., SyncPhraseTMSClient]:
+    """
+    Factory of SyncPhraseTMSClient answering from a MockTransport handler, closed after the test
+    """
+    clients = []
+
+    def make(handler, **kwargs) -> SyncPhraseTMSClient:
+        kwargs.setdefault("retry_policy", fast_retries())
+        client = SyncPhraseTMSClient(
+            token=TOKEN, transport=httpx.MockTransport(handler), **kwargs
+        )
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def async_client() -> Callable[..., AsyncPhraseTMSClient]:
+    """
+    Factory of AsyncPhraseTMSClient answering from a MockTransport handler. Create and use it inside
+    one asyncio.run, it is closed by the test
+    """
+
+    def make(handler, **kwargs) -> AsyncPhraseTMSClient:
+        kwargs.setdefault("retry_policy", fast_retries())
+        return AsyncPhraseTMSClient(
+            token=TOKEN, transport=httpx.MockTransport(handler), **kwargs
+        )
+
+    return make
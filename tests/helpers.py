@@ -0,0 +1,27 @@
+from typing import Any, List, Optional
+
+from pyphrase.transport import RetryPolicy
+
+TOKEN = "ApiToken test"
+
+
+def fast_retries(max_attempts: int = 4) -> RetryPolicy:
+    return RetryPolicy(max_attempts=max_attempts, base_delay=0.001, max_delay=0.002)
+
+
+def page_json(
+    items: List[Any], page_number: int, page_size: int, total: Optional[int] = None
+) -> dict:
+    """
+    Body of a PageDto holding items, the items of page page_number of a listing of total items
+    """
+    total = len(items) if total is None else total
+    content = items[page_number * page_size : (page_number + 1) * page_size]
+    return {
+        "content": content,
+        "totalElements": total,
+        "totalPages": -(-total // page_size),
+        "pageNumber": page_number,
+        "pageSize": page_size,
+        "numberOfElements": len(content),
+    }
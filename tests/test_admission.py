@@ -0,0 +1,142 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from pyphrase.admission import AsyncAdmissionController, SyncAdmissionController
+from pyphrase.exceptions import PhraseTMSException
+from pyphrase.transport import RetryPolicy
+
+JOBS = "/api2/v1/projects/P/jobs"
+
+
+class Organization:
+    """
+    Every created job leaves an async request pending for `duration` seconds, getCurrentLimitStatus reports them
+    """
+
+    def __init__(self, limit=None, duration=0.05, fail=()):
+        self.limit = limit
+        self.duration = duration
+        self.fail = set(fail)
+        self.expiries = []
+        self.created = []
+        self.status_reads = 0
+        self.max_pending = 0
+        self._lock = threading.Lock()
+
+    def pending(self):
+        now = time.monotonic()
+        return sum(expiry > now for expiry in self.expiries)
+
+    def __call__(self, request):
+        with self._lock:
+            if request.url.path.endswith("/async/status"):
+                self.status_reads += 1
+                if self.limit is None:
+                    return httpx.Response(200, json={})
+                requests = {"limit": self.limit, "count": self.pending()}
+                return httpx.Response(200, json={"concurrentRequests": requests})
+            name = request.url.params["name"]
+            self.created.append(name)
+            if name in self.fail:
+                return httpx.Response(400, json={"errorCode": "InvalidArgument"})
+            self.expiries.append(time.monotonic() + self.duration)
+            self.max_pending = max(self.max_pending, self.pending())
+            return httpx.Response(200, json={"name": name})
+
+
+def create_job(client, name):
+    return client.post(JOBS, params={"name": name})
+
+
+def test_operations_stay_within_limit_minus_reserve(sync_client):
+    organization = Organization(limit=6)
+    client = sync_client(organization)
+    admission = SyncAdmissionController(client, refresh_interval=0.01, reserve=2)
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(
+            executor.map(
+                lambda i: admission.submit(create_job, client, str(i)), range(20)
+            )
+        )
+
+    assert sorted(r["name"] for r in results) == sorted(str(i) for i in range(20))
+    assert organization.max_pending <= 4
+    snapshot = admission.snapshot()
+    assert snapshot["admitted"] == 20
+    assert snapshot["in_flight"] == 0 and snapshot["queued"] == 0
+
+
+def test_without_limit_every_operation_is_admitted(sync_client):
+    organization = Organization(limit=None)
+    client = sync_client(organization)
+    admission = SyncAdmissionController(client, refresh_interval=60)
+
+    for i in range(5):
+        admission.submit(create_job, client, str(i))
+
+    assert admission.headroom() is None
+    assert organization.status_reads == 1
+
+
+def test_failed_operation_gives_its_slot_back(sync_client):
+    organization = Organization(limit=10, duration=60, fail={"bad"})
+    client = sync_client(organization, retry_policy=RetryPolicy.disabled())
+    admission = SyncAdmissionController(client, refresh_interval=60)
+
+    admission.submit(create_job, client, "1")
+    with pytest.raises(PhraseTMSException):
+        admission.submit(create_job, client, "bad")
+    admission.submit(create_job, client, "2")
+
+    # The failure forces a fresh read before the next admission
+    assert organization.status_reads == 2
+    assert admission.pending() == organization.pending() == 2
+
+
+def test_waiting_operations_are_admitted_by_priority(async_client):
+    organization = Organization(limit=1, duration=0.02)
+
+    async def main():
+        async with async_client(organization) as client:
+            admission = AsyncAdmissionController(client, refresh_interval=0.005)
+            await admission.submit(create_job, client, "first")
+            await asyncio.gather(
+                *(
+                    admission.submit(create_job, client, name, priority=priority)
+                    for name, priority in [("a", 5), ("b", 1), ("c", 3), ("d", 1)]
+                )
+            )
+            return admission.snapshot()
+
+    snapshot = asyncio.run(main())
+
+    assert organization.created == ["first", "b", "d", "c", "a"]
+    assert organization.max_pending == 1
+    assert snapshot["admitted"] == 5 and snapshot["queued"] == 0
+
+
+def test_cancelled_waiter_leaves_the_queue(async_client):
+    organization = Organization(limit=1, duration=60)
+
+    async def main():
+        async with async_client(organization) as client:
+            admission = AsyncAdmissionController(client, refresh_interval=0.005)
+            await admission.submit(create_job, client, "first")
+            waiting = asyncio.ensure_future(
+                admission.submit(create_job, client, "second")
+            )
+            await asyncio.sleep(0.02)
+            waiting.cancel()
+            await asyncio.gather(waiting, return_exceptions=True)
+            return admission.snapshot()
+
+    snapshot = asyncio.run(main())
+
+    assert organization.created == ["first"]
+    assert snapshot["queued"] == 0 and snapshot["headroom"] == 0
@@ -0,0 +1,185 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from pyphrase.exceptions import (
+    CircuitOpenError,
+    PhraseTMSException,
+    PhraseTmsServerError,
+)
+from pyphrase.transport import CircuitBreakerMiddleware, RetryPolicy
+from pyphrase.transport.circuit_breaker import CLOSED, HALF_OPEN, OPEN, endpoint_family
+
+
+class Server:
+    def __init__(self, status=503):
+        self.status = status
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        return httpx.Response(self.status, json={})
+
+
+@pytest.mark.parametrize(
+    "path, family",
+    [
+        ("/api2/v1/projects/aB3dE5/jobs/jobUid1", "projects/*/jobs/*"),
+        ("/api2/v1/projects/aB3dE5/jobs/search", "projects/*/jobs/search"),
+        (
+            "/api2/v3/projects/aB3dE5/jobs/jobUid1/targetFile",
+            "projects/*/jobs/*/targetFile",
+        ),
+        ("/api2/v1/transMemories/a1B2c3/search?x=1", "transMemories/*/search"),
+        ("/api2/v1/unknownThing/12345/details", "unknownThing/*/details"),
+    ],
+)
+def test_endpoint_family_replaces_identifiers(path, family):
+    assert endpoint_family(path) == family
+
+
+def test_breaker_opens_after_failures_in_a_row(sync_client):
+    server = Server()
+    breaker = CircuitBreakerMiddleware(failure_threshold=3, recovery_timeout=60)
+    client = sync_client(
+        server, circuit_breaker=breaker, retry_policy=RetryPolicy.disabled()
+    )
+
+    for _ in range(3):
+        with pytest.raises(PhraseTmsServerError):
+            client.get("/api2/v1/projects/P1/jobs/J1")
+    with pytest.raises(CircuitOpenError) as error:
+        client.get("/api2/v1/projects/P2/jobs/J2")
+
+    assert len(server.requests) == 3
+    assert error.value.family == "projects/*/jobs/*"
+    assert 0 < error.value.retry_after <= 60
+    snapshot = breaker.snapshot()["projects/*/jobs/*"]
+    assert snapshot["state"] == OPEN and snapshot["rejected"] == 1
+
+
+def test_open_breaker_does_not_affect_other_families(sync_client):
+    server = Server()
+    breaker = CircuitBreakerMiddleware(failure_threshold=1, recovery_timeout=60)
+    client = sync_client(
+        server, circuit_breaker=breaker, retry_policy=RetryPolicy.disabled()
+    )
+
+    with pytest.raises(PhraseTmsServerError):
+        client.get("/api2/v1/projects/P1/jobs/J1")
+    server.status = 200
+
+    assert client.get("/api2/v1/projects/P1") == {}
+    with pytest.raises(CircuitOpenError):
+        client.get("/api2/v1/projects/P1/jobs/J1")
+
+
+def test_successes_reset_the_failure_count(sync_client):
+    statuses = iter([503, 503, 200, 503, 503])
+    breaker = CircuitBreakerMiddleware(failure_threshold=3)
+    client = sync_client(
+        lambda request: httpx.Response(next(statuses), json={}),
+        circuit_breaker=breaker,
+        retry_policy=RetryPolicy.disabled(),
+    )
+
+    for _ in range(5):
+        try:
+            client.get("/api2/v1/projects")
+        except PhraseTmsServerError:
+            pass
+
+    assert breaker.snapshot()["projects"]["state"] == CLOSED
+
+
+def test_retries_count_as_failures_and_stop_at_open_breaker(sync_client):
+    server = Server()
+    breaker = CircuitBreakerMiddleware(failure_threshold=2, recovery_timeout=60)
+    client = sync_client(server, circuit_breaker=breaker)
+
+    with pytest.raises(CircuitOpenError):
+        client.get("/api2/v1/projects")
+    assert len(server.requests) == 2
+
+
+def test_half_open_trial_closes_or_reopens(sync_client):
+    server = Server()
+    breaker = CircuitBreakerMiddleware(failure_threshold=1, recovery_timeout=0.02)
+    client = sync_client(
+        server, circuit_breaker=breaker, retry_policy=RetryPolicy.disabled()
+    )
+    path = "/api2/v1/projects"
+
+    with pytest.raises(PhraseTmsServerError):
+        client.get(path)
+    time.sleep(0.03)
+    with pytest.raises(PhraseTmsServerError):
+        client.get(path)
+    assert breaker.snapshot()["projects"]["state"] == OPEN
+    assert breaker.snapshot()["projects"]["times_opened"] == 2
+
+    time.sleep(0.03)
+    server.status = 200
+    assert client.get(path) == {}
+    assert breaker.snapshot()["projects"]["state"] == CLOSED
+
+
+def test_transport_errors_count_and_client_errors_do_not(sync_client):
+    def handler(request):
+        if request.url.path.endswith("/down"):
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(404, json={})
+
+    breaker = CircuitBreakerMiddleware(failure_threshold=2)
+    client = sync_client(
+        handler, circuit_breaker=breaker, retry_policy=RetryPolicy.disabled()
+    )
+
+    for path in ["/api2/v1/projects/P/down"] * 2 + ["/api2/v1/projects"] * 3:
+        with pytest.raises((httpx.ConnectError, PhraseTMSException)):
+            client.get(path)
+
+    snapshot = breaker.snapshot()
+    assert snapshot["projects/*/down"]["state"] == OPEN
+    assert snapshot["projects"]["state"] == CLOSED
+
+
+def test_family_thresholds_override_the_default(sync_client):
+    server = Server()
+    breaker = CircuitBreakerMiddleware(
+        failure_threshold=10, thresholds={"transMemories/*/search": 1}
+    )
+    client = sync_client(
+        server, circuit_breaker=breaker, retry_policy=RetryPolicy.disabled()
+    )
+
+    with pytest.raises(PhraseTmsServerError):
+        client.post("/api2/v1/transMemories/TM1/search")
+    with pytest.raises(CircuitOpenError):
+        client.post("/api2/v1/transMemories/TM2/search")
+
+
+def test_cancelled_trial_releases_half_open_slot(async_client):
+    async def handler(request):
+        if request.url.params.get("slow"):
+            await asyncio.sleep(1)
+        return httpx.Response(200, json={})
+
+    async def main():
+        breaker = CircuitBreakerMiddleware(failure_threshold=1, recovery_timeout=0)
+        family = breaker.breaker("/api2/v1/projects")
+        family.record_failure()
+        async with async_client(handler, circuit_breaker=breaker) as client:
+            trial = asyncio.ensure_future(
+                client.get("/api2/v1/projects", params={"slow": 1})
+            )
+            await asyncio.sleep(0.01)
+            assert family.state == HALF_OPEN
+            trial.cancel()
+            await asyncio.gather(trial, return_exceptions=True)
+            await client.get("/api2/v1/projects")
+        return family.state
+
+    assert asyncio.run(main()) == CLOSED
@@ -0,0 +1,101 @@
+import asyncio
+
+import httpx
+
+from pyphrase import AsyncPhraseTMSClient, SyncPhraseTMSClient
+from pyphrase.asynchron import client as async_client_module
+
+from .helpers import TOKEN
+
+
+def ok(request):
+    return httpx.Response(200, json={"path": request.url.path})
+
+
+def test_operations_share_the_pooled_client(sync_client):
+    client = sync_client(ok)
+
+    assert client.project.client is client
+    assert client.job.client is client
+    assert isinstance(client.http_client, httpx.Client)
+    assert client.get("/api2/v1/projects") == {"path": "/web/api2/v1/projects"}
+
+
+def test_owned_client_is_closed_on_exit():
+    with SyncPhraseTMSClient(token=TOKEN, transport=httpx.MockTransport(ok)) as client:
+        client.get("/api2/v1/projects")
+
+    assert client.http_client.is_closed
+
+
+def test_supplied_client_is_used_and_left_open():
+    seen = []
+    http_client = httpx.Client(
+        transport=httpx.MockTransport(lambda r: seen.append(r) or ok(r)),
+        headers={"User-Agent": "custom"},
+    )
+
+    with SyncPhraseTMSClient(token=TOKEN, http_client=http_client) as client:
+        client.get("/api2/v1/projects")
+
+    assert not http_client.is_closed
+    assert seen[0].headers["User-Agent"] == "custom"
+    http_client.close()
+
+
+def test_async_operations_share_the_pooled_client(async_client):
+    async def main():
+        async with async_client(ok) as client:
+            assert client.project.client is client
+            assert isinstance(client.http_client, httpx.AsyncClient)
+            await client.get("/api2/v1/projects")
+            await client.get("/api2/v1/projects")
+            return client
+
+    client = asyncio.run(main())
+
+    assert client.http_client.is_closed
+
+
+def test_async_supplied_client_is_left_open():
+    async def main():
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(ok))
+        async with AsyncPhraseTMSClient(token=TOKEN, http_client=http_client) as client:
+            result = await client.get("/api2/v1/projects")
+        assert not http_client.is_closed
+        await http_client.aclose()
+        return result
+
+    assert asyncio.run(main()) == {"path": "/web/api2/v1/projects"}
+
+
+def test_http2_falls_back_without_h2(monkeypatch, caplog):
+    monkeypatch.setattr(async_client_module, "_h2_available", lambda: False)
+
+    async def main():
+        async with AsyncPhraseTMSClient(
+            token=TOKEN, transport=httpx.MockTransport(ok), http2=True
+        ) as client:
+            await client.get("/api2/v1/projects")
+            return client.negotiated_http_version
+
+    assert asyncio.run(main()) == "HTTP/1.1"
+    assert "h2 is not installed" in caplog.text
+
+
+def test_responses_are_counted_per_protocol(async_client):
+    def handler(request):
+        version = b"HTTP/2" if request.url.path.endswith("/jobs") else b"HTTP/1.1"
+        return httpx.Response(200, json={}, extensions={"http_version": version})
+
+    async def main():
+        async with async_client(handler) as client:
+            assert client.negotiated_http_version is None
+            for path in ("/api2/v1/jobs", "/api2/v1/jobs", "/api2/v1/projects"):
+                await client.get(path)
+            return client
+
+    client = asyncio.run(main())
+
+    assert client.http_versions == {"HTTP/2": 2, "HTTP/1.1": 1}
+    assert client.negotiated_http_version == "HTTP/2"
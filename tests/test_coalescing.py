@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from pyphrase.exceptions import PhraseTMSException
+from pyphrase.transport import CoalescingMiddleware
+
+
+class BlockingHandler:
+    """
+    Holds every call until released, so that identical calls overlap
+    """
+
+    def __init__(self, status=200):
+        self.status = status
+        self.requests = []
+        self.release = threading.Event()
+
+    def __call__(self, request):
+        self.requests.append(request)
+        self.release.wait(5)
+        return httpx.Response(self.status, json={"params": dict(request.url.params)})
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+def run_concurrently(calls, handler, coalescing, sync_client):
+    client = sync_client(handler, coalescing=coalescing)
+    with ThreadPoolExecutor(len(calls)) as executor:
+        futures = [executor.submit(call, client) for call in calls]
+        wait_until(lambda: coalescing.coalesced + len(handler.requests) == len(calls))
+        handler.release.set()
+        return [f.exception() or f.result() for f in futures]
+
+
+def test_identical_gets_share_one_call(sync_client):
+    handler = BlockingHandler()
+    coalescing = CoalescingMiddleware()
+    calls = [lambda c: c.get("/api2/v1/projects", params={"pageNumber": 0})] * 5
+
+    results = run_concurrently(calls, handler, coalescing, sync_client)
+
+    assert len(handler.requests) == 1
+    assert results == [{"params": {"pageNumber": "0"}}] * 5
+    assert coalescing.snapshot() == {"coalesced": 4, "in_flight": 0}
+
+
+def test_different_params_tokens_and_posts_are_not_shared(sync_client):
+    handler = BlockingHandler()
+    coalescing = CoalescingMiddleware()
+    calls = [
+        lambda c: c.get("/api2/v1/projects", params={"pageNumber": 0}),
+        lambda c: c.get("/api2/v1/projects", params={"pageNumber": 1}),
+        lambda c: c.get("/api2/v1/projects", phrase_token="ApiToken other"),
+        lambda c: c.post("/api2/v1/projects"),
+        lambda c: c.post("/api2/v1/projects"),
+    ]
+
+    run_concurrently(calls, handler, coalescing, sync_client)
+
+    assert len(handler.requests) == 5
+    assert coalescing.coalesced == 0
+
+
+def test_error_responses_reach_every_caller(sync_client):
+    handler = BlockingHandler(status=404)
+    coalescing = CoalescingMiddleware()
+    calls = [lambda c: c.get("/api2/v1/projects")] * 3
+
+    results = run_concurrently(calls, handler, coalescing, sync_client)
+
+    assert len(handler.requests) == 1
+    assert all(isinstance(result, PhraseTMSException) for result in results)
+
+
+def test_calls_after_completion_are_sent_again(sync_client):
+    handler = BlockingHandler()
+    handler.release.set()
+    client = sync_client(handler, coalescing=CoalescingMiddleware())
+
+    client.get("/api2/v1/projects")
+    client.get("/api2/v1/projects")
+
+    assert len(handler.requests) == 2
+
+
+def test_async_gets_share_one_call(async_client):
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, json={"ok": True})
+
+    async def main():
+        coalescing = CoalescingMiddleware()
+        async with async_client(handler, coalescing=coalescing) as client:
+            results = await asyncio.gather(
+                *(client.get("/api2/v1/projects") for _ in range(5))
+            )
+            return results, coalescing.snapshot()
+
+    results, snapshot = asyncio.run(main())
+
+    assert len(requests) == 1
+    assert results == [{"ok": True}] * 5
+    assert snapshot == {"coalesced": 4, "in_flight": 0}
+
+
+def test_async_call_goes_on_when_first_caller_is_cancelled(async_client):
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"ok": True})
+
+    async def main():
+        async with async_client(handler, coalescing=CoalescingMiddleware()) as client:
+            first = asyncio.ensure_future(client.get("/api2/v1/projects"))
+            await asyncio.sleep(0.01)
+            second = asyncio.ensure_future(client.get("/api2/v1/projects"))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+    assert asyncio.run(main()) == {"ok": True}
+    assert len(requests) == 1
@@ -0,0 +1,126 @@
+import asyncio
+import gzip
+import json
+import zlib
+
+import httpx
+import pytest
+
+from pyphrase.transport import CompressionMiddleware
+from pyphrase.transport.compression import available_encodings, compress
+
+PAYLOAD = {"segments": [{"source": "Hello world", "target": "Hallo Welt"}] * 200}
+
+
+class Recorder:
+    def __init__(self, body=None, encoding=None):
+        self.requests = []
+        self.body = json.dumps(body if body is not None else {}).encode()
+        self.encoding = encoding
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if self.encoding is None:
+            return httpx.Response(200, content=self.body)
+        return httpx.Response(
+            200,
+            content=compress(self.body, self.encoding),
+            headers={
+                "Content-Encoding": self.encoding,
+                "Content-Type": "application/json",
+            },
+        )
+
+
+def test_accept_encoding_offers_available_encodings(sync_client):
+    recorder = Recorder()
+    client = sync_client(recorder, compression=CompressionMiddleware())
+
+    client.get("/api2/v1/projects")
+
+    offered = recorder.requests[0].headers["Accept-Encoding"].split(", ")
+    assert offered == list(available_encodings())
+    assert offered[-2:] == ["gzip", "deflate"]
+
+
+@pytest.mark.parametrize("encoding", available_encodings())
+def test_compressed_responses_are_decoded_and_counted(sync_client, encoding):
+    recorder = Recorder(body=PAYLOAD, encoding=encoding)
+    client = sync_client(recorder, compression=CompressionMiddleware())
+
+    assert client.get("/api2/v1/projects") == PAYLOAD
+    assert client.metrics.snapshot()["response_bytes_saved"] > 0
+
+
+def test_large_json_bodies_are_compressed(sync_client):
+    recorder = Recorder()
+    client = sync_client(
+        recorder, compression=CompressionMiddleware(min_request_size=1024)
+    )
+
+    client.post("/api2/v1/projects", payload=PAYLOAD)
+
+    request = recorder.requests[0]
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert request.headers["Content-Type"] == "application/json"
+    body = gzip.decompress(request.content)
+    assert json.loads(body) == PAYLOAD
+    saved = client.metrics.snapshot()["request_bytes_saved"]
+    assert saved == len(body) - len(request.content) > 0
+
+
+def test_bytes_bodies_are_compressed_with_request_encoding(sync_client):
+    recorder = Recorder()
+    compression = CompressionMiddleware(
+        min_request_size=100, request_encoding="deflate"
+    )
+    client = sync_client(recorder, compression=compression)
+    data = b"tm unit " * 1000
+
+    client.put("/api2/v1/projects/P", content=data)
+
+    assert recorder.requests[0].headers["Content-Encoding"] == "deflate"
+    assert zlib.decompress(recorder.requests[0].content) == data
+
+
+def test_small_bodies_and_multipart_are_sent_as_they_are(sync_client):
+    recorder = Recorder()
+    client = sync_client(
+        recorder, compression=CompressionMiddleware(min_request_size=1024)
+    )
+
+    client.post("/api2/v1/projects", payload={"name": "small"})
+    client.post("/api2/v1/projects", files={"file": ("a.txt", b"x" * 4096)})
+
+    assert all("Content-Encoding" not in r.headers for r in recorder.requests)
+    assert json.loads(recorder.requests[0].content) == {"name": "small"}
+
+
+def test_request_bodies_are_not_compressed_by_default(sync_client):
+    recorder = Recorder()
+    client = sync_client(recorder, compression=CompressionMiddleware())
+
+    client.post("/api2/v1/projects", payload=PAYLOAD)
+
+    assert "Content-Encoding" not in recorder.requests[0].headers
+
+
+def test_unavailable_encodings_are_rejected():
+    with pytest.raises(ValueError):
+        CompressionMiddleware(accept_encodings=["gzip", "lzma"])
+    with pytest.raises(ValueError):
+        CompressionMiddleware(request_encoding="lzma")
+    with pytest.raises(ValueError):
+        compress(b"data", "lzma")
+
+
+def test_async_client_compresses_requests(async_client):
+    recorder = Recorder(body=PAYLOAD, encoding="gzip")
+
+    async def main():
+        compression = CompressionMiddleware(min_request_size=1024)
+        async with async_client(recorder, compression=compression) as client:
+            return await client.post("/api2/v1/projects", payload=PAYLOAD)
+
+    assert asyncio.run(main()) == PAYLOAD
+    assert json.loads(gzip.decompress(recorder.requests[0].content)) == PAYLOAD
@@ -0,0 +1,114 @@
+import asyncio
+import random
+
+import httpx
+
+from pyphrase.transport import AdaptiveConcurrencyLimiter, RetryPolicy
+
+
+def run_samples(limiter, latencies, congested=False):
+    async def main():
+        for latency in latencies:
+            await limiter.acquire()
+            await limiter.release(latency, congested)
+
+    asyncio.run(main())
+
+
+def test_window_grows_while_healthy_despite_jitter():
+    random.seed(7)
+    limiter = AdaptiveConcurrencyLimiter(initial=8)
+
+    run_samples(limiter, [0.05 * random.lognormvariate(0, 0.5) for _ in range(1000)])
+
+    assert limiter.decreases == 0
+    assert limiter.window > 40
+
+
+def test_single_slow_response_is_not_congestion():
+    limiter = AdaptiveConcurrencyLimiter(initial=8)
+    run_samples(limiter, [0.05] * 100)
+    window = limiter.window
+
+    run_samples(limiter, [1.0])
+
+    assert limiter.decreases == 0
+    assert limiter.window >= window
+
+
+def test_sustained_latency_rise_shrinks_window():
+    limiter = AdaptiveConcurrencyLimiter(initial=32)
+    run_samples(limiter, [0.001] * 200)
+    window = limiter.window
+
+    run_samples(limiter, [0.004] * 60)
+
+    assert limiter.latency_rising()
+    assert limiter.decreases >= 1
+    assert limiter.window < window
+
+
+def test_throttling_halves_window_once_per_round_trip():
+    limiter = AdaptiveConcurrencyLimiter(initial=32)
+    run_samples(limiter, [0.5] * 20)
+    window = limiter.window
+
+    # A burst of 429s within one smoothed latency counts as one congestion event
+    run_samples(limiter, [0.01] * 5, congested=True)
+
+    assert limiter.decreases == 1
+    assert limiter.window == window // 2
+
+
+def test_window_bounds():
+    limiter = AdaptiveConcurrencyLimiter(initial=500, min_limit=2, max_limit=10)
+    assert limiter.window == 10
+
+    limiter.smoothed_latency = 0.0
+    for _ in range(10):
+        limiter._last_decrease = 0.0
+        run_samples(limiter, [0.01], congested=True)
+    assert limiter.window == 2
+
+
+def test_client_keeps_requests_in_flight_within_window(async_client):
+    limiter = AdaptiveConcurrencyLimiter(initial=4, max_limit=4)
+    in_flight = 0
+    most = 0
+
+    async def handler(request):
+        nonlocal in_flight, most
+        in_flight += 1
+        most = max(most, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    async def main():
+        async with async_client(handler, concurrency_limiter=limiter) as client:
+            await asyncio.gather(*(client.get("/api2/v1/projects") for _ in range(40)))
+
+    asyncio.run(main())
+    assert most == 4
+    assert limiter.in_flight == 0
+
+
+def test_client_backs_off_once_for_a_burst_of_429(async_client):
+    limiter = AdaptiveConcurrencyLimiter(initial=16)
+
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(429, json={})
+
+    async def main():
+        async with async_client(
+            handler, concurrency_limiter=limiter, retry_policy=RetryPolicy.disabled()
+        ) as client:
+            await asyncio.gather(
+                *(client.get("/api2/v1/projects") for _ in range(16)),
+                return_exceptions=True,
+            )
+
+    asyncio.run(main())
+    assert limiter.window == 8
+    assert limiter.snapshot()["decreases"] == 1
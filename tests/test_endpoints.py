@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+import httpx
+
+from pyphrase.transport import PHRASE_TMS_ENDPOINTS, fastest_endpoint
+
+EU = PHRASE_TMS_ENDPOINTS["eu"]
+US = PHRASE_TMS_ENDPOINTS["us"]
+GATEWAY = "https://tms-gateway.internal/web"
+
+
+def latency_handler(delays, unreachable=()):
+    """
+    Answers whoAmI probes after the delay of the host, and other calls with the host they were sent to
+    """
+
+    def handler(request):
+        if request.url.host in unreachable:
+            raise httpx.ConnectError("unreachable", request=request)
+        if request.url.path.endswith("/auth/whoAmI"):
+            time.sleep(delays.get(request.url.host, 0))
+            return httpx.Response(401)
+        return httpx.Response(200, json={"host": request.url.host})
+
+    return handler
+
+
+def test_calls_go_to_base_url(sync_client):
+    client = sync_client(latency_handler({}), base_url=US + "/")
+
+    assert client.base_url == US
+    assert client.get("/api2/v1/projects") == {"host": "us.cloud.memsource.com"}
+
+
+def test_probe_switches_to_the_fastest_endpoint(sync_client):
+    handler = latency_handler(
+        {"cloud.memsource.com": 0.02, "us.cloud.memsource.com": 0.01}
+    )
+    client = sync_client(handler, endpoints=[US, GATEWAY], probe=True)
+
+    assert client.base_url == GATEWAY
+    assert set(client.endpoint_rtts) == {EU, US, GATEWAY}
+    assert client.get("/api2/v1/projects") == {"host": "tms-gateway.internal"}
+
+
+def test_unreachable_endpoints_are_skipped(sync_client):
+    handler = latency_handler(
+        {"cloud.memsource.com": 0.01}, unreachable={"tms-gateway.internal"}
+    )
+    client = sync_client(handler, endpoints=[GATEWAY])
+
+    assert client.select_endpoint(attempts=2) == EU
+    assert client.endpoint_rtts[GATEWAY] is None
+
+
+def test_base_url_is_kept_when_nothing_is_reachable(sync_client):
+    handler = latency_handler(
+        {}, unreachable={"cloud.memsource.com", "us.cloud.memsource.com"}
+    )
+    client = sync_client(handler, endpoints=[US])
+
+    assert client.select_endpoint() == EU
+    assert fastest_endpoint(client.endpoint_rtts) is None
+
+
+def test_async_client_probes_on_enter(async_client):
+    handler = latency_handler({"cloud.memsource.com": 0.02})
+
+    async def main():
+        async with async_client(handler, endpoints=[US], probe=True) as client:
+            return client.base_url, await client.get("/api2/v1/projects")
+
+    assert asyncio.run(main()) == (US, {"host": "us.cloud.memsource.com"})
@@ -0,0 +1,128 @@
+import asyncio
+import time
+
+import httpx
+
+from pyphrase.transport import AdaptiveConcurrencyLimiter, HedgingMiddleware
+
+PATH = "/api2/v1/projects/P/jobs/J"
+FAMILY = "projects/*/jobs/*"
+
+
+class SlowOnce:
+    """
+    Answers at once, except for call number slow_call which takes slow seconds
+    """
+
+    def __init__(self, slow_call=None, slow=1.0, delay=0.001):
+        self.slow_call = slow_call
+        self.slow = slow
+        self.delay = delay
+        self.requests = []
+
+    async def __call__(self, request):
+        self.requests.append(request)
+        number = len(self.requests)
+        await asyncio.sleep(self.slow if number == self.slow_call else self.delay)
+        return httpx.Response(200, json={"call": number})
+
+
+def hedging(**kwargs):
+    kwargs.setdefault("min_samples", 5)
+    kwargs.setdefault("min_delay", 0.02)
+    kwargs.setdefault("max_hedge_ratio", 1.0)
+    return HedgingMiddleware(**kwargs)
+
+
+def run(async_client, handler, calls, **kwargs):
+    async def main():
+        async with async_client(handler, **kwargs) as client:
+            results = []
+            for _ in range(calls):
+                results.append(await client.get(PATH))
+            return results, client.metrics.snapshot()
+
+    return asyncio.run(main())
+
+
+def test_calls_are_not_hedged_before_enough_samples(async_client):
+    hedger = hedging()
+    handler = SlowOnce(slow_call=3, slow=0.1)
+
+    results, _ = run(async_client, handler, 5, hedging=hedger)
+
+    assert len(handler.requests) == 5
+    assert hedger.hedges == 0
+
+
+def test_slow_call_is_hedged_and_duplicate_wins(async_client):
+    hedger = hedging()
+    handler = SlowOnce(slow_call=6)
+
+    started = time.monotonic()
+    results, metrics = run(async_client, handler, 6, hedging=hedger)
+
+    assert time.monotonic() - started < 0.5
+    assert results[-1] == {"call": 7}
+    assert len(handler.requests) == 7
+    assert hedger.snapshot()["hedges"] == hedger.snapshot()["hedges_won"] == 1
+    assert metrics["hedged_requests"] == 1
+
+
+def test_hedges_are_capped_by_ratio(async_client):
+    hedger = hedging(max_hedge_ratio=0.0)
+    handler = SlowOnce(slow_call=6, slow=0.1)
+
+    run(async_client, handler, 6, hedging=hedger)
+
+    assert hedger.hedges == 0
+    assert len(handler.requests) == 6
+
+
+def test_posts_and_downloads_are_not_hedged(async_client):
+    hedger = hedging(min_samples=0, min_delay=0.001)
+    handler = SlowOnce(delay=0.02)
+
+    async def main():
+        async with async_client(handler, hedging=hedger) as client:
+            await client.post(PATH)
+            async for _ in client.iter_bytestream(PATH):
+                pass
+
+    asyncio.run(main())
+
+    assert hedger.hedges == 0
+    assert len(handler.requests) == 2
+
+
+def test_cancelled_losing_call_is_not_congestion(async_client):
+    hedger = hedging()
+    limiter = AdaptiveConcurrencyLimiter(initial=4)
+    handler = SlowOnce(slow_call=6)
+
+    run(async_client, handler, 6, hedging=hedger, concurrency_limiter=limiter)
+
+    assert hedger.hedges_won == 1
+    snapshot = limiter.snapshot()
+    assert snapshot["decreases"] == 0
+    assert snapshot["in_flight"] == 0
+
+
+def test_time_queued_in_limiters_is_not_latency(async_client):
+    hedger = hedging(min_samples=5, min_delay=0.05)
+    limiter = AdaptiveConcurrencyLimiter(initial=1, max_limit=1)
+    handler = SlowOnce(delay=0.005)
+
+    async def main():
+        async with async_client(
+            handler, hedging=hedger, concurrency_limiter=limiter
+        ) as client:
+            await asyncio.gather(*(client.get(PATH) for _ in range(40)))
+
+    asyncio.run(main())
+
+    # The last calls wait about 40 * 5ms for the single slot, which must neither be learned nor hedged
+    assert hedger.hedges == 0
+    assert len(handler.requests) == 40
+    assert max(hedger.latencies[FAMILY]) < 0.05
+    assert hedger.snapshot()["delays"][FAMILY] == 0.05
@@ -0,0 +1,347 @@
+import asyncio
+import inspect
+import threading
+import time
+
+import httpx
+import pytest
+
+from pyphrase import AsyncPhraseTMSClient, SyncPhraseTMSClient
+from pyphrase.exceptions import PhraseTMSException
+from pyphrase.pagination import (
+    is_last_page,
+    parallel_iterate_pages,
+    total_pages,
+)
+
+from .helpers import page_json
+
+PROJECTS = [{"uid": f"p{i}", "name": f"Project {i}"} for i in range(23)]
+UIDS = [project["uid"] for project in PROJECTS]
+
+
+class Listing:
+    """
+    Serves PROJECTS page by page on /projects, like listProjects
+    """
+
+    def __init__(self, items=PROJECTS, delay=0.0, totals=True):
+        self.items = items
+        self.delay = delay
+        self.totals = totals
+        self.pages = []
+        self.params = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def enter(self):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def page(self, request):
+        page_number = int(request.url.params["pageNumber"])
+        page_size = int(request.url.params["pageSize"])
+        with self._lock:
+            self.active -= 1
+            self.pages.append(page_number)
+            self.params.append(dict(request.url.params))
+        body = page_json(self.items, page_number, page_size)
+        if not self.totals:
+            body = {"content": body["content"]}
+        return httpx.Response(200, json=body)
+
+    def __call__(self, request):
+        self.enter()
+        time.sleep(self.delay)
+        return self.page(request)
+
+    async def ahandle(self, request):
+        self.enter()
+        await asyncio.sleep(self.delay)
+        return self.page(request)
+
+
+def uids(projects):
+    return [project.uid for project in projects]
+
+
+def test_iter_yields_items_of_every_page_lazily(sync_client):
+    listing = Listing()
+    client = sync_client(listing)
+
+    projects = client.project.iter_listProjects(pageSize=10, name="Project")
+    first = next(projects)
+
+    assert first.uid == "p0"
+    assert listing.pages == [0]
+    assert uids([first, *projects]) == UIDS
+    assert listing.pages == [0, 1, 2]
+    assert all(params["name"] == "Project" for params in listing.params)
+
+
+def test_iter_stops_on_short_page_without_totals(sync_client):
+    listing = Listing(items=PROJECTS[:20], totals=False)
+    client = sync_client(listing)
+
+    assert len(list(client.project.iter_listProjects(pageSize=10))) == 20
+    assert listing.pages == [0, 1, 2]
+
+
+def test_empty_listing_yields_nothing(sync_client):
+    listing = Listing(items=[])
+    client = sync_client(listing)
+
+    assert list(client.project.iter_listProjects()) == []
+    assert listing.pages == [0]
+
+
+def test_last_page_and_total_pages():
+    class Page:
+        def __init__(self, content, **totals):
+            self.content = content
+            self.__dict__.update(totals)
+
+    assert is_last_page(Page([1], totalPages=3), 2, 1)
+    assert not is_last_page(Page([1], totalPages=3), 1, 1)
+    assert is_last_page(Page([1, 2], totalCount=4), 1, 2)
+    assert not is_last_page(Page([1, 2]), 0, 2)
+    assert total_pages(Page([1], totalCount=5), 2) == 3
+    assert total_pages(Page([1]), 2) is None
+
+
+def test_async_iter_yields_all_items(async_client):
+    listing = Listing()
+
+    async def main():
+        async with async_client(listing.ahandle) as client:
+            return [p async for p in client.project.iter_listProjects(pageSize=10)]
+
+    assert uids(asyncio.run(main())) == UIDS
+
+
+@pytest.mark.parametrize("client_class", [SyncPhraseTMSClient, AsyncPhraseTMSClient])
+def test_iter_methods_wrap_paginated_operations(client_class):
+    client = client_class(token="t")
+    tags = [t for t in vars(client).values() if type(t).__name__.endswith("Operations")]
+    pairs = [
+        (getattr(tag, name), getattr(tag, name[len("iter_") :]))
+        for tag in tags
+        for name in dir(tag)
+        if name.startswith("iter_")
+    ]
+
+    assert len(pairs) > 50
+    for iter_method, operation in pairs:
+        parameters = inspect.signature(operation).parameters
+        iter_parameters = inspect.signature(iter_method).parameters
+        assert "pageNumber" not in iter_parameters
+        assert set(parameters) - {"pageNumber", "beginIndex", "endIndex"} <= set(
+            iter_parameters
+        ), iter_method.__name__
+
+
+def test_concurrent_iter_keeps_page_order(sync_client):
+    listing = Listing(items=PROJECTS * 4, delay=0.02)
+    client = sync_client(listing)
+
+    projects = list(client.project.iter_listProjects(pageSize=10, concurrency=4))
+
+    assert uids(projects) == UIDS * 4
+    assert sorted(listing.pages) == list(range(10))
+    assert listing.max_active == 4
+
+
+def test_unordered_pages_come_as_they_arrive(sync_client):
+    listing = Listing(items=PROJECTS * 4)
+    client = sync_client(listing)
+
+    pages = list(
+        parallel_iterate_pages(
+            client.project.listProjects, 10, workers=3, ordered=False
+        )
+    )
+
+    assert pages[0].pageNumber == 0
+    assert sorted(page.pageNumber for page in pages) == list(range(10))
+
+
+def test_concurrent_iter_without_totals_goes_page_by_page(sync_client):
+    listing = Listing(items=PROJECTS[:20], totals=False)
+    client = sync_client(listing)
+
+    projects = list(client.project.iter_listProjects(pageSize=10, concurrency=4))
+
+    assert len(projects) == 20
+    assert listing.pages == [0, 1, 2]
+    assert listing.max_active == 1
+
+
+def test_concurrent_iter_raises_failed_page(sync_client):
+    listing = Listing(items=PROJECTS * 4)
+
+    def handler(request):
+        if request.url.params["pageNumber"] == "5":
+            return httpx.Response(404, json={})
+        return listing(request)
+
+    client = sync_client(handler)
+    projects = client.project.iter_listProjects(pageSize=10, concurrency=4)
+
+    with pytest.raises(PhraseTMSException):
+        list(projects)
+
+
+def test_async_concurrent_iter_keeps_page_order(async_client):
+    listing = Listing(items=PROJECTS * 4, delay=0.01)
+
+    async def main():
+        async with async_client(listing.ahandle) as client:
+            projects = client.project.iter_listProjects(pageSize=10, concurrency=3)
+            return [p async for p in projects]
+
+    assert uids(asyncio.run(main())) == UIDS * 4
+    assert listing.max_active == 3
+
+
+def wait_for_pages(listing, count, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while len(listing.pages) < count and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def test_prefetch_fetches_a_bounded_number_of_pages_ahead(sync_client):
+    listing = Listing(items=PROJECTS * 4)
+    client = sync_client(listing)
+
+    projects = client.project.iter_listProjects(pageSize=10, prefetch=2)
+    assert next(projects).uid == "p0"
+    # One page in hand, two waiting in the buffer and one fetched but not yet handed over
+    wait_for_pages(listing, 4)
+    time.sleep(0.05)
+    assert listing.pages == [0, 1, 2, 3]
+
+    assert len(list(projects)) == len(PROJECTS) * 4 - 1
+    assert listing.pages == list(range(10))
+
+
+def test_prefetch_keeps_order_and_raises_errors(sync_client):
+    listing = Listing(items=PROJECTS * 4, delay=0.005)
+
+    def handler(request):
+        if request.url.params["pageNumber"] == "3":
+            return httpx.Response(404, json={})
+        return listing(request)
+
+    client = sync_client(handler)
+    projects = client.project.iter_listProjects(pageSize=10, prefetch=2)
+
+    assert uids(next(projects) for _ in range(30)) == (UIDS * 4)[:30]
+    with pytest.raises(PhraseTMSException):
+        next(projects)
+
+
+def test_abandoned_prefetch_stops_fetching(sync_client):
+    listing = Listing(items=PROJECTS * 10)
+    client = sync_client(listing)
+
+    projects = client.project.iter_listProjects(pageSize=10, prefetch=1)
+    next(projects)
+    projects.close()
+    time.sleep(0.3)
+    fetched = len(listing.pages)
+    time.sleep(0.2)
+
+    assert len(listing.pages) == fetched < 5
+
+
+def test_async_prefetch_fetches_ahead(async_client):
+    listing = Listing(items=PROJECTS * 4)
+
+    async def main():
+        async with async_client(listing.ahandle) as client:
+            projects = client.project.iter_listProjects(pageSize=10, prefetch=2)
+            first = await projects.__anext__()
+            await asyncio.sleep(0.05)
+            fetched_ahead = list(listing.pages)
+            return [first, *[p async for p in projects]], fetched_ahead
+
+    projects, fetched_ahead = asyncio.run(main())
+
+    assert uids(projects) == UIDS * 4
+    assert fetched_ahead == [0, 1, 2, 3]
+
+
+class Segments:
+    """
+    Serves count segments on /segments for the range [beginIndex, endIndex), like listSegments
+    """
+
+    def __init__(self, count, delay=0.0):
+        self.count = count
+        self.delay = delay
+        self.ranges = []
+        self._lock = threading.Lock()
+
+    def window(self, request):
+        begin = int(request.url.params["beginIndex"])
+        end = int(request.url.params["endIndex"])
+        with self._lock:
+            self.ranges.append((begin, end))
+        segments = [{"id": str(i)} for i in range(begin, min(end, self.count))]
+        return httpx.Response(200, json={"segments": segments})
+
+    def __call__(self, request):
+        time.sleep(self.delay)
+        return self.window(request)
+
+    async def ahandle(self, request):
+        await asyncio.sleep(self.delay)
+        return self.window(request)
+
+
+def segment_ids(segments):
+    return [int(segment.id) for segment in segments]
+
+
+def test_segments_are_fetched_window_by_window(sync_client):
+    server = Segments(250)
+    client = sync_client(server)
+
+    segments = client.job.iter_listSegments("J", "P", windowSize=100)
+
+    assert segment_ids(segments) == list(range(250))
+    assert server.ranges == [(0, 100), (100, 200), (200, 300)]
+
+
+def test_full_last_window_is_followed_by_an_empty_one(sync_client):
+    server = Segments(200)
+    client = sync_client(server)
+
+    assert len(list(client.job.iter_listSegments("J", "P", windowSize=100))) == 200
+    assert server.ranges[-1] == (200, 300)
+
+
+def test_concurrent_windows_keep_order(sync_client):
+    server = Segments(1050, delay=0.005)
+    client = sync_client(server)
+
+    segments = client.job.iter_listSegments("J", "P", windowSize=100, concurrency=4)
+
+    assert segment_ids(segments) == list(range(1050))
+    # Windows ahead of the short one may already be in flight, nothing past them is asked for
+    assert max(begin for begin, _ in server.ranges) < 1000 + 4 * 100
+
+
+def test_async_windows_keep_order(async_client):
+    server = Segments(530, delay=0.005)
+
+    async def main():
+        async with async_client(server.ahandle) as client:
+            segments = client.job.iter_listSegments(
+                "J", "P", windowSize=50, concurrency=3
+            )
+            return [s async for s in segments]
+
+    assert segment_ids(asyncio.run(main())) == list(range(530))
@@ -0,0 +1,160 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pyphrase import SyncPhraseTMSClient
+from pyphrase.exceptions import NotAuthenticatedError, PhraseTMSException
+from pyphrase.transport import (
+    AuthMiddleware,
+    CacheMiddleware,
+    Middleware,
+    Pipeline,
+    RetryMiddleware,
+)
+
+from .helpers import TOKEN
+
+
+def ok(request):
+    return httpx.Response(200, json={"path": request.url.path})
+
+
+class Trace(Middleware):
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def handle(self, context, call_next):
+        self.log.append(f"{self.name} >")
+        context.headers["X-Trace"] = self.name
+        response = call_next(context)
+        self.log.append(f"{self.name} <")
+        return response
+
+    async def ahandle(self, context, call_next):
+        self.log.append(f"{self.name} >")
+        context.headers["X-Trace"] = self.name
+        response = await call_next(context)
+        self.log.append(f"{self.name} <")
+        return response
+
+
+class ShortCircuit(Middleware):
+    def handle(self, context, call_next):
+        return httpx.Response(200, json={"from": "middleware"})
+
+
+def test_calls_are_authorized_with_the_client_token(sync_client):
+    seen = []
+    client = sync_client(lambda request: seen.append(request) or ok(request))
+
+    client.get("/api2/v1/projects")
+    client.get("/api2/v1/projects", phrase_token="ApiToken other")
+
+    assert [r.headers["Authorization"] for r in seen] == [TOKEN, "ApiToken other"]
+
+
+def test_call_without_token_is_rejected():
+    client = SyncPhraseTMSClient(transport=httpx.MockTransport(ok))
+
+    with pytest.raises(NotAuthenticatedError):
+        client.get("/api2/v1/projects")
+    client.close()
+
+
+def test_middlewares_run_in_order_around_the_request(sync_client):
+    log = []
+    seen = []
+
+    def handler(request):
+        log.append("send")
+        seen.append(request)
+        return ok(request)
+
+    client = sync_client(handler, middlewares=[Trace("a", log), Trace("b", log)])
+
+    client.get("/api2/v1/projects")
+
+    assert log == ["a >", "b >", "send", "b <", "a <"]
+    assert seen[0].headers["X-Trace"] == "b"
+    assert isinstance(client.pipeline.middlewares[0], AuthMiddleware)
+
+
+def test_middleware_can_answer_without_sending(sync_client):
+    seen = []
+    client = sync_client(lambda request: seen.append(request) or ok(request))
+    client.pipeline.add(ShortCircuit(), before=RetryMiddleware)
+
+    assert client.get("/api2/v1/projects") == {"from": "middleware"}
+    assert seen == []
+
+    client.pipeline.remove(ShortCircuit)
+    assert client.get("/api2/v1/projects") == {"path": "/web/api2/v1/projects"}
+
+
+def test_pipeline_skips_none_and_finds_by_class():
+    retry = RetryMiddleware()
+    pipeline = Pipeline([AuthMiddleware(), None, retry])
+
+    assert len(pipeline.middlewares) == 2
+    assert pipeline.get(RetryMiddleware) is retry
+    assert pipeline.get(CacheMiddleware) is None
+
+
+def test_metrics_count_requests_and_status_codes(sync_client):
+    statuses = iter([503, 200, 200])
+    client = sync_client(lambda request: httpx.Response(next(statuses), json={}))
+
+    client.get("/api2/v1/projects")
+    client.get("/api2/v1/projects")
+    snapshot = client.metrics.snapshot()
+
+    assert snapshot["requests"] == 3
+    assert snapshot["retries"] == 1
+    assert snapshot["status_codes"] == {503: 1, 200: 2}
+    assert snapshot["average_latency"] is not None
+    assert client.metrics.latency_percentile(50) is not None
+
+
+def test_cache_reuses_get_responses_per_token(sync_client):
+    seen = []
+    cache = CacheMiddleware(ttl=60)
+    client = sync_client(
+        lambda request: seen.append(request) or ok(request), cache=cache
+    )
+
+    client.get("/api2/v1/projects", params={"pageNumber": 0})
+    client.get("/api2/v1/projects", params={"pageNumber": 0})
+    client.get("/api2/v1/projects", params={"pageNumber": 1})
+    client.get(
+        "/api2/v1/projects", phrase_token="ApiToken other", params={"pageNumber": 0}
+    )
+    client.post("/api2/v1/projects")
+    client.post("/api2/v1/projects")
+
+    assert len(seen) == 5
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_cache_does_not_keep_errors(sync_client):
+    statuses = iter([404, 200])
+    cache = CacheMiddleware(ttl=60)
+    client = sync_client(
+        lambda request: httpx.Response(next(statuses), json={}), cache=cache
+    )
+
+    with pytest.raises(PhraseTMSException):
+        client.get("/api2/v1/projects")
+    assert client.get("/api2/v1/projects") == {}
+
+
+def test_async_middlewares_use_ahandle(async_client):
+    log = []
+
+    async def main():
+        async with async_client(ok, middlewares=[Trace("a", log)]) as client:
+            return await client.get("/api2/v1/projects")
+
+    assert asyncio.run(main()) == {"path": "/web/api2/v1/projects"}
+    assert log == ["a >", "a <"]
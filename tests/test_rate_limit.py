@@ -0,0 +1,75 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from pyphrase.transport import RateLimiter, RateLimitRule, TokenBucket
+
+
+def test_token_bucket_paces_after_burst():
+    bucket = TokenBucket(rate=10, capacity=2)
+    now = bucket.updated
+
+    delays = [bucket.reserve(now=now) for _ in range(4)]
+
+    assert delays == [0.0, 0.0, pytest.approx(0.1), pytest.approx(0.2)]
+    assert bucket.reserve(now=now + 1.0) == 0.0
+
+
+def test_tokens_have_separate_budgets():
+    limiter = RateLimiter(rate=1, burst=1)
+
+    assert limiter.reserve("/api2/v1/projects", "a") == 0
+    assert limiter.reserve("/api2/v1/projects", "b") == 0
+    assert limiter.reserve("/api2/v1/projects", "a") > 0
+
+
+def test_shared_budget_without_per_token():
+    limiter = RateLimiter(rate=1, burst=1, per_token=False)
+
+    limiter.reserve("/api2/v1/projects", "a")
+    assert limiter.reserve("/api2/v1/projects", "b") > 0
+
+
+def test_rule_adds_budget_for_endpoint_family():
+    limiter = RateLimiter(
+        rate=100, burst=100, rules=[RateLimitRule("/api2/v1/async", rate=1)]
+    )
+
+    assert limiter.reserve("/api2/v1/async/1") == 0
+    assert limiter.reserve("/api2/v1/async/2") > 0
+    assert limiter.reserve("/api2/v1/projects") == 0
+
+
+def test_client_calls_are_paced(sync_client):
+    limiter = RateLimiter(rate=20, burst=2)
+    client = sync_client(
+        lambda request: httpx.Response(200, json={}), rate_limiter=limiter
+    )
+
+    started = time.monotonic()
+    for _ in range(6):
+        client.get("/api2/v1/projects")
+
+    assert time.monotonic() - started >= 0.18
+    snapshot = limiter.snapshot()
+    assert snapshot["requests"] == 6
+    assert snapshot["delayed_requests"] == 4
+
+
+def test_sync_and_async_clients_share_a_limiter(sync_client, async_client):
+    limiter = RateLimiter(rate=1, burst=1)
+    sync_client(lambda request: httpx.Response(200, json={}), rate_limiter=limiter).get(
+        "/api2/v1/projects"
+    )
+
+    async def main():
+        async with async_client(
+            lambda request: httpx.Response(200, json={}), rate_limiter=limiter
+        ) as client:
+            started = time.monotonic()
+            await client.get("/api2/v1/projects")
+            return time.monotonic() - started
+
+    assert asyncio.run(main()) >= 0.9
@@ -0,0 +1,98 @@
+import asyncio
+import multiprocessing
+import time
+
+import pytest
+
+from pyphrase.transport import (
+    FileRateLimiterBackend,
+    InMemoryRateLimiterBackend,
+    RateLimiter,
+    RedisRateLimiterBackend,
+)
+
+
+def _reserve_from_process(path, count, start, results):
+    limiter = RateLimiter(rate=2, burst=5, backend=FileRateLimiterBackend(path))
+    start.wait()
+    results.put([limiter.reserve("/api2/v1/projects", "token") for _ in range(count)])
+
+
+def test_file_backend_shares_budget_across_processes(tmp_path):
+    path = str(tmp_path / "rate-limit.json")
+    results = multiprocessing.Queue()
+    start = multiprocessing.Barrier(4)
+    processes = [
+        multiprocessing.Process(
+            target=_reserve_from_process, args=(path, 10, start, results)
+        )
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    delays = sorted(sum((results.get(timeout=30) for _ in processes), []))
+    for process in processes:
+        process.join()
+
+    # 40 reservations at 2/s after a burst of 5, paced as if they came from one process. The rate is slow
+    # enough that the time the processes take to reserve refills no further token
+    assert sum(delay == 0 for delay in delays) == 5
+    assert delays[-1] == pytest.approx(35 / 2, abs=0.25)
+    granted = FileRateLimiterBackend(path).snapshot()
+    assert [bucket["granted"] for bucket in granted.values()] == [40]
+
+
+def test_redis_backend_shares_budget_between_clients():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    server = fakeredis.FakeServer()
+    backends = [
+        RedisRateLimiterBackend(fakeredis.FakeStrictRedis(server=server))
+        for _ in range(3)
+    ]
+    limiters = [RateLimiter(rate=10, burst=3, backend=backend) for backend in backends]
+
+    delays = [limiters[i % 3].reserve("/api2/v1/projects", "token") for i in range(6)]
+
+    assert delays[:3] == [0, 0, 0]
+    assert delays[3:] == [
+        pytest.approx(0.1, abs=0.02),
+        pytest.approx(0.2, abs=0.02),
+        pytest.approx(0.3, abs=0.02),
+    ]
+    (bucket,) = backends[0].snapshot().values()
+    assert bucket["granted"] == 6
+    assert bucket["capacity"] == 3
+
+
+def test_blocking_backend_reserves_off_the_event_loop(tmp_path):
+    class SlowBackend(FileRateLimiterBackend):
+        def reserve(self, *args, **kwargs):
+            time.sleep(0.2)
+            return super().reserve(*args, **kwargs)
+
+    limiter = RateLimiter(
+        rate=100, backend=SlowBackend(str(tmp_path / "rate-limit.json"))
+    )
+
+    async def main():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.ensure_future(tick())
+        await limiter.acquire_async("/api2/v1/projects")
+        ticker.cancel()
+        return ticks
+
+    assert asyncio.run(main()) >= 10
+
+
+def test_in_memory_backend_is_not_blocking():
+    assert not InMemoryRateLimiterBackend.blocking
+    assert FileRateLimiterBackend.blocking
+    assert RedisRateLimiterBackend.blocking
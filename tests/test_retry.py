@@ -0,0 +1,130 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from pyphrase.exceptions import (
+    PhraseTMSException,
+    PhraseTmsServerError,
+    PhraseTmsTooManyRequestsError,
+)
+from pyphrase.transport import RetryPolicy, parse_retry_after
+
+from .helpers import fast_retries
+
+
+def failing(statuses, headers=None):
+    """
+    Handler answering with the given statuses in turn, then 200, and recording the calls
+    """
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) <= len(statuses):
+            return httpx.Response(
+                statuses[len(calls) - 1], headers=headers, json={"errorCode": "ERR"}
+            )
+        return httpx.Response(200, json={"uid": "1"})
+
+    return handler, calls
+
+
+def test_get_retried_on_server_errors(sync_client):
+    handler, calls = failing([503, 502])
+    client = sync_client(handler)
+
+    assert client.get("/api2/v1/projects/1") == {"uid": "1"}
+    assert len(calls) == 3
+
+
+def test_gives_up_after_max_attempts(sync_client):
+    handler, calls = failing([503] * 10)
+    client = sync_client(handler, retry_policy=fast_retries(max_attempts=3))
+
+    with pytest.raises(PhraseTmsServerError) as error:
+        client.get("/api2/v1/projects/1")
+    assert error.value.status_code == 503
+    assert error.value.error_code == "ERR"
+    assert len(calls) == 3
+
+
+def test_post_not_retried_on_server_error(sync_client):
+    handler, calls = failing([500])
+    client = sync_client(handler)
+
+    with pytest.raises(PhraseTmsServerError):
+        client.post("/api2/v1/projects", payload={"name": "x"})
+    assert len(calls) == 1
+
+
+def test_post_retried_on_429(sync_client):
+    handler, calls = failing([429])
+    client = sync_client(handler)
+
+    assert client.post("/api2/v1/projects", payload={"name": "x"}) == {"uid": "1"}
+    assert len(calls) == 2
+
+
+def test_post_retried_when_connection_failed(sync_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={})
+
+    client = sync_client(handler)
+    client.post("/api2/v1/projects", payload={"name": "x"})
+    assert len(calls) == 2
+
+
+def test_retry_after_is_respected(sync_client):
+    handler, calls = failing([429], headers={"Retry-After": "0.2"})
+    client = sync_client(handler)
+
+    started = time.monotonic()
+    client.get("/api2/v1/projects/1")
+    assert time.monotonic() - started >= 0.2
+
+
+def test_429_raises_typed_exception_with_retry_after(sync_client):
+    handler, _ = failing([429] * 5, headers={"Retry-After": "0"})
+    client = sync_client(handler, retry_policy=RetryPolicy.disabled())
+
+    with pytest.raises(PhraseTmsTooManyRequestsError) as error:
+        client.get("/api2/v1/projects/1")
+    assert error.value.retry_after == 0
+
+
+def test_client_errors_not_retried(sync_client):
+    handler, calls = failing([404])
+    client = sync_client(handler)
+
+    with pytest.raises(PhraseTMSException) as error:
+        client.get("/api2/v1/projects/1")
+    assert error.value.status_code == 404
+    assert len(calls) == 1
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    response = httpx.Response(
+        429, headers={"Retry-After": format_datetime(retry_at, usegmt=True)}
+    )
+    assert 25 < parse_retry_after(response) <= 30
+
+
+def test_async_get_retried(async_client):
+    handler, calls = failing([503])
+
+    async def main():
+        async with async_client(handler) as client:
+            return await client.get("/api2/v1/projects/1")
+
+    assert asyncio.run(main()) == {"uid": "1"}
+    assert len(calls) == 2
@@ -0,0 +1,119 @@
+import asyncio
+import inspect
+import io
+import typing
+
+import httpx
+import pytest
+
+from pyphrase import AsyncPhraseTMSClient, SyncPhraseTMSClient
+from pyphrase.exceptions import PhraseTMSException
+
+BODY = bytes(range(256)) * 1000
+ORIGINAL = "/api2/v1/projects/P/jobs/J/original"
+
+
+def download(request):
+    return httpx.Response(
+        200, content=BODY, headers={"Content-Type": "application/octet-stream"}
+    )
+
+
+class BrokenStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __iter__(self):
+        yield BODY[:1000]
+        raise httpx.ReadError("connection lost")
+
+    async def __aiter__(self):
+        yield BODY[:1000]
+        raise httpx.ReadError("connection lost")
+
+
+def test_download_returns_bytes_without_destination(sync_client):
+    client = sync_client(download)
+    assert client.job.getOriginalFile("J", "P") == BODY
+
+
+def test_download_streams_to_path_with_progress(sync_client, tmp_path):
+    client = sync_client(download)
+    progress = []
+    path = tmp_path / "original.bin"
+
+    written = client.job.getOriginalFile(
+        "J",
+        "P",
+        destination=path,
+        progress=lambda done, total: progress.append((done, total)),
+    )
+
+    assert written == len(BODY)
+    assert path.read_bytes() == BODY
+    assert progress[-1] == (len(BODY), len(BODY))
+    assert [done for done, _ in progress] == sorted(done for done, _ in progress)
+
+
+def test_download_streams_to_file_object(sync_client):
+    client = sync_client(download)
+    f = io.BytesIO()
+
+    client.job.getOriginalFile("J", "P", destination=f)
+
+    assert not f.closed
+    assert f.getvalue() == BODY
+
+
+def test_failed_download_leaves_no_partial_file(sync_client, tmp_path):
+    client = sync_client(lambda request: httpx.Response(200, stream=BrokenStream()))
+    path = tmp_path / "original.bin"
+
+    with pytest.raises(httpx.ReadError):
+        client.job.getOriginalFile("J", "P", destination=path)
+    assert not path.exists()
+
+
+def test_error_response_is_raised_before_writing(sync_client, tmp_path):
+    client = sync_client(
+        lambda request: httpx.Response(404, json={"errorCode": "NOT_FOUND"})
+    )
+    path = tmp_path / "original.bin"
+
+    with pytest.raises(PhraseTMSException):
+        client.job.getOriginalFile("J", "P", destination=path)
+    assert not path.exists()
+
+
+def test_iter_bytestream_yields_chunks(sync_client):
+    client = sync_client(download)
+
+    chunks = list(client.iter_bytestream(ORIGINAL, chunk_size=4096))
+
+    assert b"".join(chunks) == BODY
+    assert max(len(chunk) for chunk in chunks) <= 4096
+
+
+def test_async_download_streams_to_path(async_client, tmp_path):
+    path = tmp_path / "original.bin"
+
+    async def main():
+        async with async_client(download) as client:
+            return await client.job.getOriginalFile("J", "P", destination=path)
+
+    assert asyncio.run(main()) == len(BODY)
+    assert path.read_bytes() == BODY
+
+
+@pytest.mark.parametrize("client_class", [SyncPhraseTMSClient, AsyncPhraseTMSClient])
+def test_download_operations_have_resolvable_annotations(client_class):
+    client = client_class(token="t")
+    operations = [
+        method
+        for name, tag in vars(client).items()
+        if type(tag).__name__.endswith("Operations")
+        for _, method in inspect.getmembers(tag, inspect.ismethod)
+        if "destination" in inspect.signature(method).parameters
+    ]
+
+    assert len(operations) >= 17
+    for method in operations:
+        hints = typing.get_type_hints(method)
+        assert "destination" in hints and "progress" in hints
@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from pyphrase.exceptions import DeadlineExceededError
+from pyphrase.transport import TimeoutPolicy, TimeoutRule
+from pyphrase.transport.streaming import UploadBody
+
+
+class Recorder:
+    def __init__(self):
+        self.timeouts = []
+
+    def __call__(self, request):
+        self.timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200, json={})
+
+
+def test_calls_use_the_default_profile(sync_client):
+    recorder = Recorder()
+    client = sync_client(recorder)
+
+    client.get("/api2/v1/projects")
+
+    assert recorder.timeouts[0]["read"] == 30.0
+
+
+def test_rules_pick_profiles_per_endpoint_family(sync_client):
+    recorder = Recorder()
+    client = sync_client(recorder)
+
+    client.post("/api2/v1/projects/P/jobs/export")
+    client.put("/api2/v1/projects/P/fileHandovers", content=UploadBody(b"data"))
+    client.post("/api2/v1/projects/P/jobs", files={"file": ("a.txt", b"data")})
+
+    bulk, upload, multipart = recorder.timeouts
+    assert bulk["read"] == 300.0 and bulk["pool"] == 30.0
+    assert upload["write"] == 300.0 and multipart["write"] == 300.0
+
+
+def test_custom_profiles_and_rules_come_first(sync_client):
+    recorder = Recorder()
+    policy = TimeoutPolicy(
+        profiles={"default": httpx.Timeout(5.0), "quick": httpx.Timeout(1.0)},
+        rules=[TimeoutRule(r"/projects$", "quick", methods=["get"])],
+    )
+    client = sync_client(recorder, timeouts=policy)
+
+    client.get("/api2/v1/projects")
+    client.post("/api2/v1/projects")
+    client.get("/api2/v1/projects/P")
+
+    assert [t["read"] for t in recorder.timeouts] == [1.0, 5.0, 5.0]
+
+
+def test_explicit_timeouts_are_used_as_they_are():
+    policy = TimeoutPolicy()
+
+    assert policy.resolve("POST", "/api2/v1/projects/P/jobs/export", 2.5) == 2.5
+    with pytest.raises(ValueError, match="Unknown timeout profile"):
+        policy.resolve("GET", "/api2/v1/projects", "glacial")
+
+
+def test_deadline_cuts_timeouts_down(sync_client):
+    recorder = Recorder()
+    client = sync_client(recorder)
+
+    with client.deadline(2):
+        client.get("/api2/v1/projects")
+
+    assert all(0 < value <= 2 for value in recorder.timeouts[0].values())
+
+
+def test_inner_deadline_cannot_extend_outer(sync_client):
+    client = sync_client(Recorder())
+
+    with client.deadline(1) as outer:
+        with client.deadline(60) as inner:
+            assert inner is outer
+
+
+def test_deadline_covers_retries(sync_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        time.sleep(0.03)
+        raise httpx.ReadTimeout("slow", request=request)
+
+    client = sync_client(handler)
+
+    with pytest.raises(DeadlineExceededError):
+        with client.deadline(0.05):
+            client.get("/api2/v1/projects")
+    assert 1 <= len(calls) < 4
+
+
+def test_expired_deadline_raises_before_sending(sync_client):
+    recorder = Recorder()
+    client = sync_client(recorder)
+
+    with pytest.raises(DeadlineExceededError, match="before GET"):
+        with client.deadline(0):
+            client.get("/api2/v1/projects")
+    assert recorder.timeouts == []
+
+
+def test_async_deadline_applies_to_the_task(async_client):
+    recorder = Recorder()
+
+    async def main():
+        async with async_client(recorder) as client:
+            with client.deadline(2):
+                await client.get("/api2/v1/projects")
+            await client.get("/api2/v1/projects")
+
+    asyncio.run(main())
+
+    assert recorder.timeouts[0]["read"] <= 2
+    assert recorder.timeouts[1]["read"] == 30.0
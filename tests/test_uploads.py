@@ -0,0 +1,159 @@
+import asyncio
+import io
+import mmap
+
+import httpx
+import pytest
+
+from pyphrase.exceptions import PhraseTmsServerError
+from pyphrase.models.phrase_models import JobPartReferences
+from pyphrase.transport.streaming import UploadBody
+
+DATA = b"handover " * 5000
+
+
+class Recorder:
+    def __init__(self, statuses=(200,)):
+        self.statuses = list(statuses)
+        self.requests = []
+        self.bodies = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        self.bodies.append(request.read())
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        return httpx.Response(status, json={"fileId": "1", "filename": "handover.txt"})
+
+
+def test_upload_from_bytes_sets_headers(sync_client):
+    recorder = Recorder()
+    client = sync_client(recorder)
+
+    result = client.job.uploadHandoverFile("P", DATA, fileName="résumé.txt")
+
+    request = recorder.requests[0]
+    assert request.method == "PUT"
+    assert request.url.path == "/web/api2/v1/projects/P/fileHandovers"
+    assert request.headers["Content-Length"] == str(len(DATA))
+    assert (
+        request.headers["Content-Disposition"]
+        == "filename*=UTF-8''r%C3%A9sum%C3%A9.txt"
+    )
+    assert recorder.bodies[0] == DATA
+    assert result.fileId == "1"
+
+
+def test_upload_from_path_uses_file_name(sync_client, tmp_path):
+    path = tmp_path / "handover.txt"
+    path.write_bytes(DATA)
+    recorder = Recorder()
+    client = sync_client(recorder)
+
+    client.job.uploadHandoverFile("P", str(path))
+
+    assert recorder.bodies[0] == DATA
+    assert recorder.requests[0].headers["Content-Length"] == str(len(DATA))
+    assert (
+        recorder.requests[0].headers["Content-Disposition"]
+        == "filename*=UTF-8''handover.txt"
+    )
+
+
+def test_upload_from_file_object_and_mmap(sync_client, tmp_path):
+    path = tmp_path / "handover.txt"
+    path.write_bytes(DATA)
+    recorder = Recorder()
+    client = sync_client(recorder)
+
+    with open(path, "rb") as f:
+        f.seek(9)
+        client.job.uploadHandoverFile("P", f)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            client.job.uploadHandoverFile("P", mapped, fileName="mapped.txt")
+
+    assert recorder.bodies == [DATA[9:], DATA]
+    assert recorder.requests[0].headers["Content-Length"] == str(len(DATA) - 9)
+
+
+def test_metadata_is_sent_in_memsource_header(sync_client):
+    recorder = Recorder()
+    client = sync_client(recorder)
+    metadata = JobPartReferences(jobs=[{"uid": "J1"}])
+
+    client.job.uploadHandoverFile("P", DATA, fileName="a.txt", metadata=metadata)
+
+    assert recorder.requests[0].headers["Memsource"] == metadata.json(exclude_none=True)
+
+
+def test_file_body_is_replayed_on_retry(sync_client):
+    recorder = Recorder(statuses=[503, 200])
+    client = sync_client(recorder)
+
+    client.job.uploadHandoverFile("P", io.BytesIO(DATA), fileName="a.txt")
+
+    assert recorder.bodies == [DATA, DATA]
+
+
+def test_iterator_body_is_not_retried(sync_client):
+    recorder = Recorder(statuses=[503, 200])
+    client = sync_client(recorder)
+    chunks = iter([DATA[:100], DATA[100:]])
+
+    with pytest.raises(PhraseTmsServerError):
+        client.job.uploadHandoverFile("P", chunks, fileName="a.txt")
+    assert recorder.bodies == [DATA]
+
+
+def test_iterator_body_can_only_be_sent_once():
+    body = UploadBody(iter([DATA]))
+    assert not body.replayable
+    assert b"".join(body) == DATA
+
+    with pytest.raises(RuntimeError, match="only be sent once"):
+        list(body)
+
+
+def test_upload_without_file_name_is_rejected(sync_client):
+    client = sync_client(Recorder())
+
+    with pytest.raises(ValueError):
+        client.job.uploadHandoverFile("P", DATA)
+
+
+def test_upload_body_reads_in_chunks():
+    body = UploadBody(DATA, chunk_size=1000)
+
+    chunks = list(body)
+
+    assert body.length == len(DATA)
+    assert body.replayable
+    assert max(map(len, chunks)) == 1000
+    assert b"".join(chunks) == DATA
+
+
+def test_async_upload_from_async_iterator(async_client):
+    recorder = Recorder()
+
+    async def chunks():
+        for offset in range(0, len(DATA), 4096):
+            yield DATA[offset : offset + 4096]
+
+    async def main():
+        async with async_client(recorder) as client:
+            return await client.job.uploadHandoverFile("P", chunks(), fileName="a.txt")
+
+    result = asyncio.run(main())
+
+    assert result.filename == "handover.txt"
+    assert recorder.bodies[0] == DATA
+    assert "Content-Length" not in recorder.requests[0].headers
+
+
+def test_sync_client_rejects_async_iterator(sync_client):
+    async def chunks():
+        yield DATA
+
+    client = sync_client(Recorder())
+
+    with pytest.raises(TypeError, match="async client"):
+        client.job.uploadHandoverFile("P", chunks(), fileName="a.txt")
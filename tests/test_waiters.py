@@ -0,0 +1,261 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from pyphrase.exceptions import WaitTimeoutError
+from pyphrase.waiters import (
+    BackgroundTask,
+    PollingPolicy,
+    async_request_ids,
+    background_task_failed,
+)
+
+from .helpers import page_json
+
+
+def fast_polling():
+    return PollingPolicy(initial_interval=0.001, max_interval=0.005)
+
+
+class AsyncRequests:
+    """
+    Async requests finishing after the given seconds, served by getAsyncRequest and listPendingRequests
+    """
+
+    def __init__(self, durations, delay=0.0):
+        self.started = time.monotonic()
+        self.durations = durations
+        self.delay = delay
+        self.fetched = []
+        self.scans = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def done(self, request_id):
+        return time.monotonic() - self.started >= self.durations[request_id]
+
+    def body(self, request_id):
+        body = {"id": request_id, "action": "PRE_TRANSLATE"}
+        if self.done(request_id):
+            body["asyncResponse"] = {"dateCreated": "2026-01-01T00:00:00Z"}
+        return body
+
+    def respond(self, request):
+        path = request.url.path
+        if path.endswith("/async"):
+            self.scans += 1
+            pending = [self.body(i) for i in self.durations if not self.done(i)]
+            page_number = int(request.url.params["pageNumber"])
+            return httpx.Response(200, json=page_json(pending, page_number, 50))
+        request_id = path.rsplit("/", 1)[-1]
+        self.fetched.append(request_id)
+        return httpx.Response(200, json=self.body(request_id))
+
+    def __call__(self, request):
+        return self.respond(request)
+
+    async def ahandle(self, request):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return self.respond(request)
+
+
+class Reference:
+    def __init__(self, request_id):
+        self.id = request_id
+
+
+def test_few_requests_are_fetched_one_by_one(sync_client):
+    server = AsyncRequests({"1": 0.0, "2": 0.02})
+    client = sync_client(server, polling=fast_polling())
+
+    finished = client.wait_for(["2", "1"])
+
+    assert list(finished) == ["2", "1"]
+    assert all(request.asyncResponse is not None for request in finished.values())
+    assert server.scans == 0
+    assert server.fetched.count("1") == 1
+
+
+def test_many_requests_are_resolved_by_scanning_the_queue(sync_client):
+    durations = {str(i): 0.01 * (i % 4) for i in range(20)}
+    server = AsyncRequests(durations)
+    client = sync_client(server, polling=fast_polling())
+
+    finished = client.wait_for(durations)
+
+    assert list(finished) == list(durations)
+    assert server.scans >= 1
+    # Only requests that have left the queue are fetched
+    assert len(server.fetched) < 2 * len(durations)
+
+
+def test_ids_are_taken_from_objects_and_deduplicated():
+    assert async_request_ids([Reference(1), "2", Reference("1")]) == ["1", "2"]
+
+
+def test_timeout_reports_done_and_pending(sync_client):
+    server = AsyncRequests({"1": 0.0, "2": 60.0})
+    client = sync_client(server, polling=fast_polling())
+
+    with pytest.raises(WaitTimeoutError) as error:
+        client.wait_for(["1", "2"], timeout=0.05)
+
+    assert list(error.value.done) == ["1"]
+    assert error.value.pending == ["2"]
+
+
+def test_polling_learns_from_completion_times():
+    polling = PollingPolicy(initial_interval=1.0, max_interval=30.0, multiplier=2.0)
+
+    assert polling.interval(0, 0) == 1.0
+    assert polling.interval(10, 3) == 8.0
+    for duration in (10.0, 12.0, 20.0):
+        polling.observe(duration)
+
+    assert polling.expected_duration() == 12.0
+    assert polling.interval(2.0, 0) == 10.0
+    assert polling.interval(13.0, 6) == 30.0
+
+
+def test_async_waiter_fetches_with_bounded_concurrency(async_client):
+    durations = {str(i): 0.0 for i in range(30)}
+    server = AsyncRequests(durations, delay=0.005)
+
+    async def main():
+        async with async_client(server.ahandle, polling=fast_polling()) as client:
+            client.async_request_waiter.workers = 4
+            return await client.wait_for(durations)
+
+    finished = asyncio.run(main())
+
+    assert list(finished) == list(durations)
+    assert len(server.fetched) == 30
+    assert server.max_active == 4
+
+
+class BackgroundTasks:
+    """
+    Last background task of memories and term bases. Each reports its previous, finished task until the new one
+    is started, which then runs for the given seconds
+    """
+
+    def __init__(self, durations, starts=None, errors=()):
+        self.started = time.monotonic()
+        self.durations = durations
+        self.starts = starts or {}
+        self.errors = set(errors)
+        self.requests = []
+
+    def task(self, uid):
+        elapsed = time.monotonic() - self.started
+        if elapsed < self.starts.get(uid, 0):
+            request = {"id": f"old-{uid}", "asyncResponse": {}}
+            return {"status": "OK", "asyncRequest": request}
+        request = {"id": f"new-{uid}"}
+        if elapsed < self.starts.get(uid, 0) + self.durations[uid]:
+            return {"status": "RUNNING", "asyncRequest": request}
+        request["asyncResponse"] = (
+            {"errorCode": "ImportFailed"} if uid in self.errors else {}
+        )
+        return {"status": "OK", "asyncRequest": request}
+
+    def __call__(self, request):
+        self.requests.append(request.url.path)
+        uid = request.url.path.split("/")[-2]
+        return httpx.Response(200, json=self.task(uid))
+
+
+def test_background_tasks_of_memories_and_term_bases(sync_client):
+    server = BackgroundTasks({"TM1": 0.02, "TB1": 0.04}, errors={"TB1"})
+    client = sync_client(server)
+    client.background_task_waiter.polling = fast_polling()
+    progress = []
+    tasks = [
+        BackgroundTask.trans_memory("TM1", Reference("new-TM1")),
+        BackgroundTask.term_base("TB1", "new-TB1"),
+    ]
+
+    finished = client.wait_for_background_tasks(
+        tasks, progress=lambda done, total: progress.append((done, total))
+    )
+
+    assert list(finished) == ["TM1", "TB1"]
+    assert not background_task_failed(finished["TM1"])
+    assert background_task_failed(finished["TB1"])
+    assert progress[-1] == (2, 2)
+    assert "/web/api2/v1/transMemories/TM1/lastBackgroundTask" in server.requests
+    assert "/web/api2/v1/termBases/TB1/lastBackgroundTask" in server.requests
+
+
+def test_earlier_finished_task_is_not_taken(sync_client):
+    server = BackgroundTasks({"TM1": 0.01}, starts={"TM1": 0.03})
+    client = sync_client(server)
+    client.background_task_waiter.polling = fast_polling()
+
+    finished = client.wait_for_background_tasks(
+        [BackgroundTask.trans_memory("TM1", "new-TM1")]
+    )
+
+    assert finished["TM1"].asyncRequest.id == "new-TM1"
+
+
+def test_marked_tasks_wait_for_a_newer_task(sync_client):
+    server = BackgroundTasks({"TB1": 0.01}, starts={"TB1": 0.03})
+    client = sync_client(server)
+    waiter = client.background_task_waiter
+    waiter.polling = fast_polling()
+    tasks = [BackgroundTask.term_base("TB1")]
+
+    waiter.mark(tasks)
+    finished = waiter.wait_for(tasks)
+
+    assert tasks[0].previous.asyncRequest.id == "old-TB1"
+    assert finished["TB1"].asyncRequest.id == "new-TB1"
+
+
+def test_background_task_timeout_reports_pending(sync_client):
+    server = BackgroundTasks({"TM1": 0.0, "TM2": 60.0})
+    client = sync_client(server)
+    client.background_task_waiter.polling = fast_polling()
+    tasks = [BackgroundTask.trans_memory(uid, f"new-{uid}") for uid in ("TM1", "TM2")]
+
+    with pytest.raises(WaitTimeoutError) as error:
+        client.wait_for_background_tasks(tasks, timeout=0.05)
+
+    assert list(error.value.done) == ["TM1"]
+    assert error.value.pending == ["TM2"]
+
+
+def test_async_background_tasks_are_fetched_with_bounded_concurrency(async_client):
+    uids = [f"TM{i}" for i in range(12)]
+    server = BackgroundTasks({uid: 0.0 for uid in uids})
+    active = {"now": 0, "peak": 0}
+
+    async def handler(request):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.005)
+        active["now"] -= 1
+        return server(request)
+
+    async def main():
+        async with async_client(handler) as client:
+            waiter = client.background_task_waiter
+            waiter.polling = fast_polling()
+            waiter.workers = 3
+            tasks = [BackgroundTask.trans_memory(uid, f"new-{uid}") for uid in uids]
+            return await client.wait_for_background_tasks(tasks)
+
+    finished = asyncio.run(main())
+
+    assert list(finished) == uids
+    assert active["peak"] == 3
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from pyphrase.exceptions import PhraseTMSException
+
+from .helpers import TOKEN
+
+
+class WhoAmI:
+    """
+    Answers whoAmI, 401 without a valid token, and tracks how many calls overlap
+    """
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def _enter(self, request):
+        with self._lock:
+            self.requests.append(request)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def _response(self, request):
+        with self._lock:
+            self.active -= 1
+        if request.headers.get("Authorization") != TOKEN:
+            return httpx.Response(401, json={"errorCode": "AuthUnauthorized"})
+        return httpx.Response(200, json={"user": {"userName": "tester"}})
+
+    def __call__(self, request):
+        self._enter(request)
+        time.sleep(self.delay)
+        return self._response(request)
+
+    async def ahandle(self, request):
+        self._enter(request)
+        await asyncio.sleep(self.delay)
+        return self._response(request)
+
+
+def test_warmup_opens_connections_in_parallel(sync_client):
+    server = WhoAmI()
+    client = sync_client(server)
+
+    assert client.warmup(connections=4) is None
+
+    assert len(server.requests) == 4
+    assert server.max_active == 4
+    assert all(r.url.path == "/web/api2/v1/auth/whoAmI" for r in server.requests)
+    assert all("Authorization" not in r.headers for r in server.requests)
+
+
+def test_warmup_validates_token(sync_client):
+    client = sync_client(WhoAmI(delay=0))
+
+    user = client.warmup(validate_token=True)
+
+    assert user.user.userName == "tester"
+    with pytest.raises(PhraseTMSException):
+        client.warmup(validate_token=True, phrase_token="ApiToken expired")
+
+
+def test_async_warmup_opens_connections_concurrently(async_client):
+    server = WhoAmI()
+
+    async def main():
+        async with async_client(server.ahandle) as client:
+            return await client.warmup(connections=3, validate_token=True)
+
+    user = asyncio.run(main())
+
+    assert user.user.userName == "tester"
+    assert len(server.requests) == 4
+    assert server.max_active == 3
@@ -0,0 +1,216 @@
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+
+from pyphrase.exceptions import WaitTimeoutError
+from pyphrase.models.phrase_models import TriggerEvent
+from pyphrase.waiters import PollingPolicy
+from pyphrase.webhooks import TOKEN_HEADER, WebhookReceiver
+
+SECRET = "s3cret"
+
+
+def job_event(job_uid, status):
+    return {
+        "event": "JOB_STATUS_CHANGED",
+        "jobParts": [{"uid": job_uid, "status": status}],
+    }
+
+
+def fast_receiver(**kwargs):
+    kwargs.setdefault(
+        "polling", PollingPolicy(initial_interval=0.001, max_interval=0.005)
+    )
+    return WebhookReceiver(secret_token=SECRET, **kwargs)
+
+
+class Jobs:
+    """
+    getPart of jobs whose status the test changes, and getAsyncRequest of finished async requests
+    """
+
+    def __init__(self, status="NEW"):
+        self.status = status
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if "/async/" in request.url.path:
+            body = {"id": request.url.path.rsplit("/", 1)[-1], "asyncResponse": {}}
+            return httpx.Response(200, json=body)
+        uid = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"uid": uid, "status": self.status})
+
+
+def post(receiver, token=SECRET, **kwargs):
+    async def main():
+        transport = httpx.ASGITransport(app=receiver)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://hooks"
+        ) as client:
+            headers = {TOKEN_HEADER: token} if token else {}
+            return await client.post("/phrase", headers=headers, **kwargs)
+
+    return asyncio.run(main()).status_code
+
+
+def test_asgi_app_resolves_futures():
+    receiver = fast_receiver()
+    future = receiver.job_future("J1", statuses=["COMPLETED"])
+
+    assert post(receiver, json=job_event("J1", "ACCEPTED")) == 200
+    assert not future.done()
+    assert post(receiver, json=job_event("J1", "COMPLETED")) == 200
+
+    assert future.result(0)["jobParts"][0]["status"] == "COMPLETED"
+    assert receiver.snapshot()["waiting"] == 0
+
+
+def test_asgi_app_rejects_bad_calls():
+    receiver = fast_receiver(max_body_size=1024)
+
+    assert post(receiver, json=job_event("J1", "NEW"), token="wrong") == 401
+    assert post(receiver, json=job_event("J1", "NEW"), token=None) == 401
+    assert post(receiver, content=b"{not json") == 400
+    assert post(receiver, json=["not", "an", "object"]) == 400
+    assert post(receiver, content=b"x" * 2048) == 413
+    assert receiver.snapshot()["rejected"] == 2
+    assert receiver.snapshot()["received"] == 0
+
+
+def test_late_futures_resolve_from_recent_events():
+    receiver = fast_receiver(recent_events=2)
+    receiver.dispatch({"asyncRequest": {"id": 1}})
+    for job_uid in ("J1", "J2"):
+        receiver.dispatch(job_event(job_uid, "COMPLETED"))
+
+    # The oldest event was dropped
+    assert not receiver.async_request_future("1").done()
+    assert receiver.job_future("J1", statuses=["COMPLETED"]).done()
+    assert not receiver.job_future("J2", statuses=["DELIVERED"]).done()
+
+
+def test_serve_listens_on_loopback():
+    receiver = fast_receiver(max_body_size=1024)
+    host, port = receiver.serve()
+    future = receiver.async_request_future("42")
+    try:
+        with httpx.Client(base_url=f"http://{host}:{port}") as client:
+            ok = client.post(
+                "/", json={"asyncRequest": {"id": 42}}, headers={TOKEN_HEADER: SECRET}
+            )
+            too_large = client.post(
+                "/", content=b"x" * 2048, headers={TOKEN_HEADER: SECRET}
+            )
+    finally:
+        receiver.shutdown()
+
+    assert host == "127.0.0.1"
+    assert (ok.status_code, too_large.status_code) == (200, 413)
+    assert future.result(0)["asyncRequest"]["id"] == 42
+
+
+def test_wait_job_fetches_the_job_once_after_the_event(sync_client):
+    jobs = Jobs(status="COMPLETED")
+    client = sync_client(jobs)
+    receiver = fast_receiver()
+    timer = threading.Timer(0.02, receiver.dispatch, [job_event("J1", "COMPLETED")])
+    timer.start()
+
+    job = receiver.wait_job(client, "P", "J1", ["COMPLETED"], timeout=5)
+
+    assert job.uid == "J1"
+    assert [r.url.path for r in jobs.requests] == ["/web/api2/v1/projects/P/jobs/J1"]
+
+
+def test_wait_job_polls_without_events(sync_client):
+    jobs = Jobs(status="COMPLETED")
+    client = sync_client(jobs)
+    receiver = fast_receiver()
+
+    job = receiver.wait_job(client, "P", "J1", ["COMPLETED"], timeout=0.01)
+
+    assert job.status.value == "COMPLETED"
+    assert receiver.snapshot()["waiting"] == 0
+
+
+def test_wait_job_polling_gives_up_after_poll_timeout(sync_client):
+    client = sync_client(Jobs(status="NEW"))
+    receiver = fast_receiver()
+
+    with pytest.raises(WaitTimeoutError) as error:
+        receiver.wait_job(
+            client, "P", "J1", ["COMPLETED"], timeout=0.01, poll_timeout=0.05
+        )
+    assert error.value.pending == ["J1"]
+
+
+def test_wait_async_request_falls_back_to_wait_for(sync_client):
+    jobs = Jobs()
+    client = sync_client(jobs, polling=PollingPolicy(initial_interval=0.001))
+    receiver = fast_receiver()
+
+    request = receiver.wait_async_request(client, "7", timeout=0.01)
+
+    assert request.id == "7" and request.asyncResponse is not None
+
+
+def test_register_sends_secret_token(sync_client):
+    bodies = []
+
+    def handler(request):
+        if request.method == "POST":
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json={"uid": "W1", **bodies[-1]})
+        return httpx.Response(204)
+
+    client = sync_client(handler)
+    receiver = fast_receiver()
+
+    webhook = receiver.register(client, "https://example.com/hooks")
+    receiver.unregister(client)
+
+    assert webhook.uid == "W1"
+    assert bodies[0]["secretToken"] == SECRET
+    assert bodies[0]["events"] == [
+        e.value
+        for e in (
+            TriggerEvent.JOB_STATUS_CHANGED,
+            TriggerEvent.PRE_TRANSLATION_FINISHED,
+            TriggerEvent.ANALYSIS_CREATED,
+        )
+    ]
+    assert receiver.webhook is None
+
+
+def test_await_job_resolves_from_event(async_client):
+    jobs = Jobs(status="COMPLETED")
+    receiver = fast_receiver()
+
+    async def main():
+        async with async_client(jobs) as client:
+            waiting = asyncio.ensure_future(
+                receiver.await_job(client, "P", "J1", ["COMPLETED"], timeout=5)
+            )
+            await asyncio.sleep(0.01)
+            receiver.dispatch(job_event("J1", "COMPLETED"))
+            return await waiting
+
+    assert asyncio.run(main()).uid == "J1"
+    assert len(jobs.requests) == 1
+
+
+def test_await_job_polling_gives_up_after_poll_timeout(async_client):
+    receiver = fast_receiver()
+
+    async def main():
+        async with async_client(Jobs(status="NEW")) as client:
+            await receiver.await_job(
+                client, "P", "J1", ["COMPLETED"], timeout=0.01, poll_timeout=0.05
+            )
+
+    with pytest.raises(WaitTimeoutError):
+        asyncio.run(main())